@@ -1,20 +1,254 @@
 """Main entry point for the Tetris game."""
 
+import argparse
+import os
 import sys
-from tetris.game import TetrisGame
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the command line parser."""
+    from tetris.selfplay import POLICIES
+
+    parser = argparse.ArgumentParser(prog="tetris", description="Play Tetris.")
+    parser.add_argument(
+        "--record-demo", action="store_true", help="record a demo of the game"
+    )
+    parser.add_argument(
+        "--duration", type=float, default=20.0,
+        help="length of the demo recording in seconds of game time"
+    )
+    parser.add_argument(
+        "--offline", action="store_true",
+        help="record the demo faster than real time"
+    )
+    parser.add_argument(
+        "--ai", action="store_true", help="let the heuristic AI play"
+    )
+    parser.add_argument(
+        "--weights", help="JSON file with AI evaluation weights"
+    )
+    parser.add_argument(
+        "--lookahead", type=int, default=0,
+        help="number of preview pieces the AI plans ahead with beam search"
+    )
+    parser.add_argument(
+        "--beam-width", type=int, default=8, help="states kept per lookahead depth"
+    )
+    parser.add_argument(
+        "--budget", type=float, default=10.0,
+        help="milliseconds the AI may plan each move for"
+    )
+    parser.add_argument(
+        "--seed", type=int, default=None,
+        help="seed of the piece sequence; random if omitted"
+    )
+    parser.add_argument(
+        "--randomizer", default="uniform", choices=["uniform", "bag"],
+        help="piece generator: independent picks or shuffled 7-piece bags"
+    )
+    parser.add_argument(
+        "--dirty-rects", action="store_true",
+        help="redraw only the parts of the screen that changed"
+    )
+    parser.add_argument(
+        "--curses", action="store_true",
+        help="play in the terminal instead of a window"
+    )
+    parser.add_argument(
+        "--record-replays", metavar="DIR",
+        help="write a replay file of every game to this directory"
+    )
+    subparsers = parser.add_subparsers(dest="command")
+
+    selfplay = subparsers.add_parser(
+        "selfplay", help="play headless games across worker processes"
+    )
+    selfplay.add_argument("--workers", type=int, default=os.cpu_count() or 1,
+                          help="number of worker processes")
+    selfplay.add_argument("--games", type=int, default=100,
+                          help="number of games to play")
+    selfplay.add_argument("--seed", type=int, default=0,
+                          help="base seed of the piece sequences")
+    selfplay.add_argument("--policy", default="random", choices=sorted(POLICIES),
+                          help="policy used by the workers")
+    selfplay.add_argument("--max-pieces", type=int, default=None,
+                          help="stop each game after this many pieces")
+    selfplay.add_argument("--weights", help="JSON file with AI evaluation weights")
+    selfplay.add_argument("--randomizer", default="uniform", choices=["uniform", "bag"],
+                          help="piece generator of every game")
+
+    tune = subparsers.add_parser(
+        "tune", help="tune the AI evaluation weights with the cross-entropy method"
+    )
+    tune.add_argument("--workers", type=int, default=os.cpu_count() or 1,
+                      help="number of worker processes")
+    tune.add_argument("--generations", type=int, default=20,
+                      help="total number of generations")
+    tune.add_argument("--population", type=int, default=32,
+                      help="candidates per generation")
+    tune.add_argument("--games", type=int, default=8,
+                      help="seeded games played by every candidate")
+    tune.add_argument("--max-pieces", type=int, default=2000,
+                      help="piece limit of each game")
+    tune.add_argument("--metric", default="score", choices=["score", "lines", "pieces"],
+                      help="game result to maximize")
+    tune.add_argument("--seed", type=int, default=0,
+                      help="seed of the game set and sampling")
+    tune.add_argument("--checkpoint", default="tuning.json",
+                      help="checkpoint file written after every generation")
+    tune.add_argument("--resume", action="store_true",
+                      help="continue from the checkpoint")
+    tune.add_argument("--output", help="write the best weights to this JSON file")
+
+    bench = subparsers.add_parser(
+        "bench-placements", help="measure placement search throughput"
+    )
+    bench.add_argument("--pieces", type=int, default=1000,
+                       help="number of pieces to search")
+    bench.add_argument("--seed", type=int, default=0,
+                       help="seed of the benchmark game")
+
+    bench_capture = subparsers.add_parser(
+        "bench-capture", help="compare the recorder's frame capture paths"
+    )
+    bench_capture.add_argument("--frames", type=int, default=100,
+                               help="number of frames to convert with each path")
+
+    replay = subparsers.add_parser("replay", help="re-simulate a recorded game")
+    replay.add_argument("file", help="replay file written with --record-replays")
+    replay.add_argument("--headless", action="store_true",
+                        help="simulate without a window and print the final state")
+    replay.add_argument("--start", type=float, default=0.0, metavar="SECONDS",
+                        help="start from this point of the game")
+
+    render = subparsers.add_parser(
+        "render-replays", help="encode a directory of replays to videos in parallel"
+    )
+    render.add_argument("directory", help="directory of .replay files")
+    render.add_argument("--workers", type=int, default=os.cpu_count() or 1,
+                        help="number of worker processes")
+    render.add_argument("--output-dir", help="directory of the videos; defaults to DIRECTORY")
+    render.add_argument("--fps", type=int, default=30, help="frames per second of the videos")
+
+    return parser
+
+
+def _load_weights(path):
+    """Load AI evaluation weights from a JSON file, if one is given."""
+    if path is None:
+        return None
+    from tetris.ai import HeuristicWeights
+    return HeuristicWeights.load(path)
+
+
+def _create_game(args, renderer=None):
+    """Create the interactive game, with the AI playing if requested."""
+    from tetris.game import TetrisGame
+    from tetris.pieces import create_generator
+
+    generator = create_generator(args.randomizer, args.seed)
+    if renderer is None:
+        from tetris.renderer import Renderer
+        renderer = Renderer(dirty_rects=args.dirty_rects)
+    if not args.ai:
+        return TetrisGame(generator=generator, renderer=renderer,
+                          replay_dir=args.record_replays)
+
+    from tetris.ai import HeuristicAI
+    from tetris.bitboard import BitBoard
+    from tetris.engine import GameEngine
+
+    weights = _load_weights(args.weights)
+    if args.lookahead <= 0:
+        return TetrisGame(GameEngine(BitBoard(), generator=generator), ai=HeuristicAI(weights),
+                          renderer=renderer, replay_dir=args.record_replays)
+
+    from tetris.planner import BeamPlanner
+    planner = BeamPlanner(weights, depth=args.lookahead, beam_width=args.beam_width,
+                          time_budget=args.budget / 1000)
+    engine = GameEngine(BitBoard(), preview_size=args.lookahead, generator=generator)
+    return TetrisGame(engine, ai=planner, renderer=renderer, replay_dir=args.record_replays)
 
 
 def main():
     """Run the Tetris game."""
+    args = _build_parser().parse_args()
+
+    if args.command == "selfplay":
+        from tetris import selfplay
+        weights = _load_weights(args.weights)
+        selfplay.main(args.workers, args.games, args.seed, args.policy, args.max_pieces,
+                      weights.to_dict() if weights else None, args.randomizer)
+        return 0
+
+    if args.command == "tune":
+        from tetris import tuner
+        try:
+            tuner.main(
+                args.generations, output=args.output, resume=args.resume,
+                population=args.population, games=args.games, max_pieces=args.max_pieces,
+                seed=args.seed, workers=args.workers, checkpoint=args.checkpoint,
+                metric=args.metric,
+            )
+        except ValueError as error:
+            print(error, file=sys.stderr)
+            return 1
+        return 0
+
+    if args.command == "bench-placements":
+        from tetris.placements import benchmark
+        stats = benchmark(args.pieces, args.seed)
+        print(f"{stats['placements_found']} placements in {stats['seconds']:.3f}s "
+              f"({stats['placements_per_second']:.0f} placements/s)")
+        return 0
+
+    if args.command == "bench-capture":
+        from tetris.recorder import benchmark_capture
+        stats = benchmark_capture(frames=args.frames)
+        print(f"array3d: {stats['array3d_ms']:.2f} ms/frame, "
+              f"view: {stats['view_ms']:.2f} ms/frame ({stats['speedup']:.1f}x)")
+        return 0
+
+    if args.command == "replay":
+        from tetris.replay import ReplayPlayer, load_replay, read_header, watch_replay
+        start_tick = round(args.start * read_header(args.file)["tick_rate"])
+        replay = load_replay(args.file, start_tick)
+        if args.headless:
+            player = ReplayPlayer(replay)
+            player.seek(start_tick)
+            player.run()
+        else:
+            player = watch_replay(replay, start_tick=start_tick)
+        engine = player.engine
+        print(f"Score {engine.score}, {engine.lines_cleared} lines, level {engine.level}, "
+              f"{engine.pieces_placed} pieces after {player.tick} ticks")
+        if player.finished and not player.matches_end():
+            print("The replay did not reproduce the recorded game", file=sys.stderr)
+            return 1
+        return 0
+
+    if args.command == "render-replays":
+        from tetris.recorder import render_replays
+        for replay_path, video_path in render_replays(args.directory, args.workers,
+                                                      args.output_dir, args.fps):
+            print(f"{replay_path} -> {video_path}")
+        return 0
+
+    if args.curses:
+        import curses
+        from tetris.curses_renderer import CursesRenderer
+        curses.wrapper(lambda stdscr: _create_game(args, CursesRenderer(stdscr)).run())
+        return 0
+
     # Check if we should record a demo
-    if "--record-demo" in sys.argv:
+    if args.record_demo:
         print("Recording a demo of the Tetris game...")
         from tetris.recorder import create_demo_recording
-        game = TetrisGame()
-        create_demo_recording(game)
+        game = _create_game(args)
+        create_demo_recording(game, duration=args.duration, offline=args.offline)
         return 0
     else:
-        game = TetrisGame()
+        game = _create_game(args)
         game.run()
         return 0
 
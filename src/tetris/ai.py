@@ -0,0 +1,173 @@
+"""Heuristic autoplayer for Tetris."""
+
+import json
+import random
+from dataclasses import dataclass, asdict, fields
+from typing import Dict, List, Optional, Sequence, Tuple
+from tetris.board import Board
+from tetris.engine import Action, GameEngine
+from tetris.pieces import Tetromino
+from tetris.placements import Placement, PlacementGenerator
+from tetris.zobrist import TranspositionTable
+
+
+@dataclass
+class HeuristicWeights:
+    """Weights of the board features in the evaluation function."""
+
+    aggregate_height: float = -0.510066
+    holes: float = -0.35663
+    bumpiness: float = -0.184483
+    lines: float = 0.760666
+
+    @classmethod
+    def from_dict(cls, weights: Dict[str, float]) -> "HeuristicWeights":
+        """Create weights from a dictionary, using defaults for missing keys.
+
+        Args:
+            weights: Mapping of feature name to weight.
+
+        Returns:
+            The weights.
+
+        Raises:
+            ValueError: If a key is not a feature name.
+        """
+        unknown = set(weights) - {field.name for field in fields(cls)}
+        if unknown:
+            raise ValueError(f"unknown weights: {', '.join(sorted(unknown))}")
+        return cls(**weights)
+
+    @classmethod
+    def load(cls, path: str) -> "HeuristicWeights":
+        """Load weights from a JSON file.
+
+        Args:
+            path: Path to a JSON object mapping feature name to weight.
+
+        Returns:
+            The weights.
+        """
+        with open(path) as f:
+            return cls.from_dict(json.load(f))
+
+    def to_dict(self) -> Dict[str, float]:
+        """Get the weights as a dictionary."""
+        return asdict(self)
+
+
+class HeuristicAI:
+    """Plays the placement that maximizes a weighted sum of board features."""
+
+    # Number of preview pieces the AI looks at
+    lookahead = 0
+
+    def __init__(self, weights: Optional[HeuristicWeights] = None,
+                 table: Optional[TranspositionTable] = None):
+        """Initialize the AI.
+
+        Args:
+            weights: Feature weights. The defaults are used if None.
+            table: Optional transposition table that caches the chosen moves
+                by (board hash, piece type, preview types). It must not be
+                shared between AIs with different settings.
+        """
+        self.weights = weights if weights is not None else HeuristicWeights()
+        # Searches the root position only, so paths of chosen moves are known
+        self.generator = PlacementGenerator()
+        self.table = table
+        self.evaluations = 0
+
+    def evaluate(self, board: Board, lines_cleared: int) -> float:
+        """Score a board after a placement.
+
+        Args:
+            board: The board after the piece was locked and lines cleared.
+            lines_cleared: Lines cleared by the placement.
+
+        Returns:
+            The weighted feature sum; higher is better.
+        """
+        self.evaluations += 1
+        weights = self.weights
+        heights = board.get_column_heights()
+        bumpiness = 0
+        for a, b in zip(heights, heights[1:]):
+            bumpiness += abs(a - b)
+        return (
+            weights.aggregate_height * sum(heights)
+            + weights.holes * sum(board.get_column_holes())
+            + weights.bumpiness * bumpiness
+            + weights.lines * lines_cleared
+        )
+
+    def place(self, board: Board, placement: Placement) -> Tuple[Board, int]:
+        """Play a placement on a copy of the board.
+
+        Args:
+            board: The board to start from. It is not modified.
+            placement: The placement to lock.
+
+        Returns:
+            The resulting board and the number of lines cleared.
+        """
+        child = board.copy()
+        piece = Tetromino(placement.shape_type)
+        piece.rotation, piece.x, piece.y = placement.rotation, placement.x, placement.y
+        child.add_piece_to_grid(piece)
+        return child, child.clear_lines()
+
+    def choose(self, board: Board, piece: Tetromino,
+               preview: Sequence[str] = ()) -> Optional[Placement]:
+        """Choose the best placement for a piece.
+
+        Args:
+            board: The board to play on.
+            piece: The piece to place.
+            preview: Upcoming shape types; unused by the greedy AI.
+
+        Returns:
+            The best placement, or None if the piece cannot be placed.
+        """
+        best = None
+        best_score = float("-inf")
+        for placement in self.generator.generate(board, piece):
+            child, lines_cleared = self.place(board, placement)
+            score = self.evaluate(child, lines_cleared)
+            if score > best_score:
+                best, best_score = placement, score
+        return best
+
+    def actions(self, engine: GameEngine, rng: Optional[random.Random] = None) -> List[Action]:
+        """Get the actions that play the best placement of the current piece.
+
+        This matches the self-play policy signature; the RNG is unused.
+
+        Args:
+            engine: The game engine to play.
+            rng: Unused.
+
+        Returns:
+            The actions for the current piece, ending with a hard drop.
+        """
+        board = engine.board
+        piece = board.current_piece
+        if piece is None:
+            return []
+
+        preview = engine.get_preview(self.lookahead) if self.lookahead else []
+
+        # Reachable placements depend on the start position, so only moves
+        # for freshly spawned pieces are cached.
+        key = None
+        if self.table is not None and piece.is_at_spawn():
+            key = (board.get_zobrist_hash(), piece.shape_type, *preview)
+            cached = self.table.get(key)
+            if cached is not None:
+                return list(cached)
+
+        placement = self.choose(board, piece, preview)
+        actions = [Action.DROP] if placement is None else self.generator.path_to(placement)
+        if self.table is not None and key is not None:
+            self.table.put(key, tuple(actions))
+        return actions
@@ -0,0 +1,235 @@
+"""Vectorized environment that steps many Tetris boards at once with NumPy."""
+
+from typing import Optional, Sequence, Tuple, Union
+import numpy as np
+from tetris.board import Board
+from tetris.pieces import SHAPE_TYPES, Tetromino
+from tetris.constants import GRID_WIDTH, GRID_HEIGHT
+
+# Cells in the batch grid store the index in SHAPE_TYPES + 1
+
+# Block offsets indexed by [shape index, rotation, block, (dx, dy)]
+SHAPE_OFFSETS = np.array(
+    [Tetromino.SHAPES[shape_type] for shape_type in SHAPE_TYPES], dtype=np.int64
+)
+
+NO_PIECE = -1
+
+ArrayLike = Union[int, np.ndarray]
+
+
+class BatchEnv:
+    """Holds N boards as one array and applies the Board rules to all of them.
+
+    The grid has shape ``(N, height, width)`` and stores 0 for an empty cell or
+    the shape index plus one for a placed block. The current piece of each
+    board is described by the ``piece_type``, ``rotation``, ``x`` and ``y``
+    arrays, with ``piece_type`` set to ``NO_PIECE`` when a board has no piece.
+    Every operation takes an optional boolean mask selecting the boards it
+    applies to.
+    """
+
+    def __init__(self, num_boards: int, width: int = GRID_WIDTH, height: int = GRID_HEIGHT):
+        """Initialize the batch of boards.
+
+        Args:
+            num_boards: Number of boards in the batch.
+            width: Width of each board in blocks.
+            height: Height of each board in blocks.
+        """
+        self.num_boards = num_boards
+        self.width = width
+        self.height = height
+        self.reset()
+
+    def reset(self) -> None:
+        """Reset every board to its initial state."""
+        n = self.num_boards
+        self.grid = np.zeros((n, self.height, self.width), dtype=np.uint8)
+        self.piece_type = np.full(n, NO_PIECE, dtype=np.int64)
+        self.rotation = np.zeros(n, dtype=np.int64)
+        self.x = np.zeros(n, dtype=np.int64)
+        self.y = np.zeros(n, dtype=np.int64)
+
+    def _select(self, mask: Optional[np.ndarray]) -> np.ndarray:
+        """Get the indices of boards that are selected and hold a piece."""
+        active = self.piece_type != NO_PIECE
+        if mask is not None:
+            active &= mask
+        return np.flatnonzero(active)
+
+    def _cells(self, idx: np.ndarray, rotation: np.ndarray, x: np.ndarray,
+               y: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Get the absolute (xs, ys) block coordinates, each of shape (k, 4)."""
+        offsets = SHAPE_OFFSETS[self.piece_type[idx], rotation]
+        return x[:, None] + offsets[..., 0], y[:, None] + offsets[..., 1]
+
+    def _valid(self, idx: np.ndarray, rotation: np.ndarray, x: np.ndarray,
+               y: np.ndarray) -> np.ndarray:
+        """Check the given placements the same way as Board.is_valid_position."""
+        xs, ys = self._cells(idx, rotation, x, y)
+        in_bounds = ((xs >= 0) & (xs < self.width) & (ys < self.height)).all(axis=1)
+
+        # Cells above the board never collide
+        rows = np.clip(ys, 0, self.height - 1)
+        cols = np.clip(xs, 0, self.width - 1)
+        blocked = (self.grid[idx[:, None], rows, cols] != 0) & (ys >= 0)
+        return in_bounds & ~blocked.any(axis=1)
+
+    def is_valid_position(self, mask: Optional[np.ndarray] = None) -> np.ndarray:
+        """Check whether each current piece is in a valid position.
+
+        Args:
+            mask: Optional boolean mask of boards to check.
+
+        Returns:
+            A boolean array of shape (N,); boards without a piece are False.
+        """
+        result = np.zeros(self.num_boards, dtype=bool)
+        idx = self._select(mask)
+        result[idx] = self._valid(idx, self.rotation[idx], self.x[idx], self.y[idx])
+        return result
+
+    def spawn(self, piece_types: Sequence[int], mask: Optional[np.ndarray] = None) -> np.ndarray:
+        """Place new pieces at the spawn position.
+
+        Args:
+            piece_types: Shape index per board, of shape (N,).
+            mask: Optional boolean mask of boards that receive a piece.
+
+        Returns:
+            A boolean array of shape (N,) telling which spawned pieces fit.
+        """
+        selected = np.ones(self.num_boards, dtype=bool) if mask is None else mask
+        types = np.asarray(piece_types, dtype=np.int64)
+        self.piece_type[selected] = types[selected]
+        self.rotation[selected] = 0
+        self.x[selected] = Tetromino.SPAWN_X
+        self.y[selected] = Tetromino.SPAWN_Y
+        return self.is_valid_position(selected)
+
+    def move(self, dx: ArrayLike, dy: ArrayLike, mask: Optional[np.ndarray] = None) -> np.ndarray:
+        """Move the current pieces, keeping them in place where blocked.
+
+        Args:
+            dx: Horizontal movement, a scalar or an array of shape (N,).
+            dy: Vertical movement, a scalar or an array of shape (N,).
+            mask: Optional boolean mask of boards to move.
+
+        Returns:
+            A boolean array of shape (N,) telling which moves succeeded.
+        """
+        moved = np.zeros(self.num_boards, dtype=bool)
+        idx = self._select(mask)
+        new_x = self.x[idx] + np.broadcast_to(dx, (self.num_boards,))[idx]
+        new_y = self.y[idx] + np.broadcast_to(dy, (self.num_boards,))[idx]
+        valid = self._valid(idx, self.rotation[idx], new_x, new_y)
+
+        ok = idx[valid]
+        self.x[ok] = new_x[valid]
+        self.y[ok] = new_y[valid]
+        moved[ok] = True
+        return moved
+
+    def rotate(self, mask: Optional[np.ndarray] = None) -> np.ndarray:
+        """Rotate the current pieces clockwise where the rotation fits.
+
+        Args:
+            mask: Optional boolean mask of boards to rotate.
+
+        Returns:
+            A boolean array of shape (N,) telling which rotations succeeded.
+        """
+        rotated = np.zeros(self.num_boards, dtype=bool)
+        idx = self._select(mask)
+        new_rotation = (self.rotation[idx] + 1) % 4
+        valid = self._valid(idx, new_rotation, self.x[idx], self.y[idx])
+
+        ok = idx[valid]
+        self.rotation[ok] = new_rotation[valid]
+        rotated[ok] = True
+        return rotated
+
+    def lock(self, mask: Optional[np.ndarray] = None) -> None:
+        """Add the current pieces to their grids and remove them.
+
+        Args:
+            mask: Optional boolean mask of boards whose piece is locked.
+        """
+        idx = self._select(mask)
+        xs, ys = self._cells(idx, self.rotation[idx], self.x[idx], self.y[idx])
+        inside = (ys >= 0) & (ys < self.height) & (xs >= 0) & (xs < self.width)
+
+        boards = np.broadcast_to(idx[:, None], xs.shape)[inside]
+        values = np.broadcast_to(self.piece_type[idx, None] + 1, xs.shape)[inside]
+        self.grid[boards, ys[inside], xs[inside]] = values
+        self.piece_type[idx] = NO_PIECE
+
+    def drop(self, mask: Optional[np.ndarray] = None) -> np.ndarray:
+        """Drop the current pieces as far as they go and lock them.
+
+        Args:
+            mask: Optional boolean mask of boards to drop.
+
+        Returns:
+            A boolean array of shape (N,) telling which pieces were placed.
+        """
+        placed = np.zeros(self.num_boards, dtype=bool)
+        placed[self._select(mask)] = True
+
+        falling = placed.copy()
+        while falling.any():
+            falling &= self.move(0, 1, falling)
+
+        self.lock(placed)
+        return placed
+
+    def clear_lines(self) -> np.ndarray:
+        """Clear completed lines on every board.
+
+        Returns:
+            An integer array of shape (N,) with the lines cleared per board.
+        """
+        full = (self.grid != 0).all(axis=2)
+        lines_cleared = full.sum(axis=1)
+        if not lines_cleared.any():
+            return lines_cleared
+
+        # Stable-sort full rows to the top, then empty them
+        rows = np.arange(self.height)
+        order = np.argsort(np.where(full, -1, rows), axis=1, kind="stable")
+        self.grid = np.take_along_axis(self.grid, order[:, :, None], axis=1)
+        self.grid[rows[None, :] < lines_cleared[:, None]] = 0
+        return lines_cleared
+
+    def is_game_over(self) -> np.ndarray:
+        """Check which boards have blocks in the top row.
+
+        Returns:
+            A boolean array of shape (N,).
+        """
+        return (self.grid[:, 0, :] != 0).any(axis=1)
+
+    def to_board(self, index: int) -> Board:
+        """Copy one board of the batch into a scalar Board.
+
+        Args:
+            index: Index of the board in the batch.
+
+        Returns:
+            A Board with the same grid and current piece.
+        """
+        board = Board(self.width, self.height)
+        for y in range(self.height):
+            for x in range(self.width):
+                value = self.grid[index, y, x]
+                if value:
+                    board.grid[y][x] = SHAPE_TYPES[value - 1]
+
+        if self.piece_type[index] != NO_PIECE:
+            piece = Tetromino(SHAPE_TYPES[self.piece_type[index]])
+            piece.rotation = int(self.rotation[index])
+            piece.x = int(self.x[index])
+            piece.y = int(self.y[index])
+            board.current_piece = piece
+        return board
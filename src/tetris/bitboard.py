@@ -0,0 +1,311 @@
+"""Bitboard-backed game board for Tetris."""
+
+from typing import Dict, List, Optional, Set, Tuple, cast
+from tetris.board import Board
+from tetris.pieces import Tetromino
+from tetris.constants import GRID_WIDTH, GRID_HEIGHT
+from tetris.zobrist import row_hash, zobrist_keys
+
+# A piece mask is (min_dx, max_dx, rows), where rows holds (dy, bits) pairs and
+# bit 0 of ``bits`` is the leftmost column the piece occupies.
+PieceMask = Tuple[int, int, Tuple[Tuple[int, int], ...]]
+
+
+def _build_piece_masks() -> Dict[Tuple[str, int], PieceMask]:
+    """Precompute the row masks of every (shape, rotation) pair."""
+    masks: Dict[Tuple[str, int], PieceMask] = {}
+    for shape_type, rotations in Tetromino.SHAPES.items():
+        for rotation, offsets in enumerate(rotations):
+            min_dx = min(dx for dx, _ in offsets)
+            max_dx = max(dx for dx, _ in offsets)
+            rows: Dict[int, int] = {}
+            for dx, dy in offsets:
+                rows[dy] = rows.get(dy, 0) | (1 << (dx - min_dx))
+            masks[(shape_type, rotation)] = (min_dx, max_dx, tuple(sorted(rows.items())))
+    return masks
+
+
+PIECE_MASKS = _build_piece_masks()
+
+
+def _build_piece_bottoms() -> Dict[Tuple[str, int], Tuple[Tuple[int, int], ...]]:
+    """Precompute the lowest cell of every column of each (shape, rotation) pair."""
+    bottoms: Dict[Tuple[str, int], Tuple[Tuple[int, int], ...]] = {}
+    for shape_type, rotations in Tetromino.SHAPES.items():
+        for rotation, offsets in enumerate(rotations):
+            columns: Dict[int, int] = {}
+            for dx, dy in offsets:
+                columns[dx] = max(dy, columns.get(dx, dy))
+            bottoms[(shape_type, rotation)] = tuple(sorted(columns.items()))
+    return bottoms
+
+
+# (dx, dy) of the lowest cell in each column a piece covers
+PIECE_BOTTOMS = _build_piece_bottoms()
+
+
+class BitBoard(Board):
+    """A game board that keeps every row as an integer bitmask.
+
+    Bit ``x`` of ``rows[y]`` is set when cell (x, y) is occupied, so collision
+    checks are a handful of ANDs and a full row is a single comparison. The
+    ``grid`` of block types is still maintained for rendering, but it must only
+    be changed through ``add_piece_to_grid`` and ``clear_lines``.
+
+    Column heights, per-column hole counts, row fill counts and the Zobrist
+    hash are kept up to date by those two methods, so board features can be
+    read without scanning the grid.
+    """
+
+    def __init__(self, width: int = GRID_WIDTH, height: int = GRID_HEIGHT):
+        """Initialize a new bitboard.
+
+        Args:
+            width: Width of the board in blocks.
+            height: Height of the board in blocks.
+        """
+        super().__init__(width, height)
+        self.full_row = (1 << width) - 1
+        self.zobrist_keys = zobrist_keys(width, height)
+        self._reset_features()
+
+    def _reset_features(self) -> None:
+        """Clear the row masks and the incrementally maintained features."""
+        self.rows: List[int] = [0] * self.height
+        self.row_fills: List[int] = [0] * self.height
+        self.heights: List[int] = [0] * self.width
+        self.holes: List[int] = [0] * self.width
+        self.zobrist = 0
+
+    def reset(self) -> None:
+        """Reset the board to its initial state."""
+        super().reset()
+        self._reset_features()
+
+    def copy(self) -> "BitBoard":
+        """Create an independent copy of the board.
+
+        Returns:
+            A board with the same cells, features and copies of the pieces.
+        """
+        board = cast(BitBoard, super().copy())
+        board.rows = self.rows[:]
+        board.row_fills = self.row_fills[:]
+        board.heights = self.heights[:]
+        board.holes = self.holes[:]
+        return board
+
+    def set_rows(self, rows: List[str]) -> None:
+        """Replace the cells with ones returned by get_rows.
+
+        Args:
+            rows: One string per row, top first.
+        """
+        super().set_rows(rows)
+        self._reset_features()
+        for y, row in enumerate(self.grid):
+            for x, cell in enumerate(row):
+                if cell is not None:
+                    self.rows[y] |= 1 << x
+                    self.row_fills[y] += 1
+                    self.zobrist ^= self.zobrist_keys[y][x]
+        for x in range(self.width):
+            self._rescan_column(x)
+
+    def get_zobrist_hash(self) -> int:
+        """Get the 64-bit Zobrist hash of the occupied cells.
+
+        Returns:
+            The incrementally maintained hash.
+        """
+        return self.zobrist
+
+    def fits(self, shape_type: str, rotation: int, x: int, y: int) -> bool:
+        """Check if a piece with the given shape and placement is valid.
+
+        Args:
+            shape_type: The type of tetromino.
+            rotation: The rotation index of the tetromino.
+            x: X coordinate of the piece's center.
+            y: Y coordinate of the piece's center.
+
+        Returns:
+            True if the position is valid, False otherwise.
+        """
+        min_dx, max_dx, rows = PIECE_MASKS[(shape_type, rotation)]
+        left = x + min_dx
+        if left < 0 or x + max_dx >= self.width:
+            return False
+
+        for dy, bits in rows:
+            row = y + dy
+            if row >= self.height:
+                return False
+            if row >= 0 and self.rows[row] & (bits << left):
+                return False
+
+        return True
+
+    def is_valid_position(self, piece: Tetromino) -> bool:
+        """Check if the piece is in a valid position.
+
+        Args:
+            piece: The tetromino to check.
+
+        Returns:
+            True if the position is valid, False otherwise.
+        """
+        return self.fits(piece.shape_type, piece.rotation, piece.x, piece.y)
+
+    def landing_y(self, piece: Tetromino) -> int:
+        """Get the row the piece would land on if dropped straight down.
+
+        The drop distance is read off the column heights: each column of the
+        piece can fall until its lowest cell rests on the column's surface.
+        Pieces tucked below the surface, where overhangs may stop them
+        earlier, fall back to the step-by-step search.
+
+        Args:
+            piece: The tetromino to drop. It must be in a valid position.
+
+        Returns:
+            The y coordinate of the piece's center after the drop.
+        """
+        x = piece.x
+        heights = self.heights
+        height = self.height
+        landing = height
+        for dx, dy in PIECE_BOTTOMS[(piece.shape_type, piece.rotation)]:
+            column_landing = height - heights[x + dx] - 1 - dy
+            if column_landing < landing:
+                landing = column_landing
+
+        if landing < piece.y:
+            return super().landing_y(piece)
+        return landing
+
+    def add_piece_to_grid(self, piece: Tetromino) -> None:
+        """Add the piece to the grid.
+
+        Args:
+            piece: The tetromino to add to the grid.
+        """
+        for x, y in piece.get_positions():
+            if 0 <= y < self.height and 0 <= x < self.width:
+                self.grid[y][x] = piece.shape_type
+                bit = 1 << x
+                if self.rows[y] & bit:
+                    continue
+                self.rows[y] |= bit
+                self.row_fills[y] += 1
+                self.zobrist ^= self.zobrist_keys[y][x]
+
+                # Raising a column turns the gap below the block into holes,
+                # while a block below the surface fills a hole.
+                cell_height = self.height - y
+                if cell_height > self.heights[x]:
+                    self.holes[x] += cell_height - self.heights[x] - 1
+                    self.heights[x] = cell_height
+                else:
+                    self.holes[x] -= 1
+
+    def _rescan_column(self, x: int) -> None:
+        """Recompute the height and hole count of a column from the row masks."""
+        bit = 1 << x
+        column_height = 0
+        holes = 0
+        for y in range(self.height):
+            if self.rows[y] & bit:
+                if not column_height:
+                    column_height = self.height - y
+            elif column_height:
+                holes += 1
+        self.heights[x] = column_height
+        self.holes[x] = holes
+
+    def clear_lines(self) -> int:
+        """Clear completed lines and return the number of lines cleared.
+
+        Returns:
+            The number of lines cleared.
+        """
+        full_row = self.full_row
+        kept = [y for y in range(self.height) if self.rows[y] != full_row]
+        lines_cleared = self.height - len(kept)
+        if lines_cleared:
+            cleared = [y for y in range(self.height) if self.rows[y] == full_row]
+            top_cleared = cleared[0]
+
+            # Rows below the lowest cleared row keep their position and hash
+            shifted = range(cleared[-1] + 1)
+            keys = self.zobrist_keys
+            for y in shifted:
+                self.zobrist ^= row_hash(keys[y], self.rows[y])
+
+            self.rows[:] = [0] * lines_cleared + [self.rows[y] for y in kept]
+            self.row_fills[:] = [0] * lines_cleared + [self.row_fills[y] for y in kept]
+            empty: List[List[Optional[str]]] = [
+                [None for _ in range(self.width)] for _ in range(lines_cleared)
+            ]
+            self.grid[:] = empty + [self.grid[y] for y in kept]
+
+            # Full rows have no holes, so a column only changes shape when its
+            # top block was in a cleared row; every other column just sinks.
+            for x in range(self.width):
+                if self.height - self.heights[x] < top_cleared:
+                    self.heights[x] -= lines_cleared
+                else:
+                    self._rescan_column(x)
+
+            for y in shifted:
+                self.zobrist ^= row_hash(keys[y], self.rows[y])
+
+        return lines_cleared
+
+    def get_column_heights(self) -> List[int]:
+        """Get the height of the highest block in each column.
+
+        Returns:
+            A list with one height per column, 0 for an empty column.
+        """
+        return self.heights
+
+    def get_column_holes(self) -> List[int]:
+        """Get the number of empty cells below the highest block of each column.
+
+        Returns:
+            A list with one hole count per column.
+        """
+        return self.holes
+
+    def get_row_fills(self) -> List[int]:
+        """Get the number of occupied cells in each row.
+
+        Returns:
+            A list with one count per row, from top to bottom.
+        """
+        return self.row_fills
+
+    def is_game_over(self) -> bool:
+        """Check if the game is over.
+
+        Returns:
+            True if the game is over, False otherwise.
+        """
+        return self.rows[0] != 0
+
+    def get_occupied_cells(self) -> Set[Tuple[int, int]]:
+        """Get the positions of all occupied cells on the board.
+
+        Returns:
+            A set of (x, y) coordinates of occupied cells.
+        """
+        occupied = set()
+        for y, row in enumerate(self.rows):
+            x = 0
+            while row:
+                if row & 1:
+                    occupied.add((x, y))
+                row >>= 1
+                x += 1
+        return occupied
@@ -1,8 +1,13 @@
 """Game board for Tetris."""
 
+import copy
 from typing import List, Optional, Tuple, Set
 from tetris.pieces import Tetromino
 from tetris.constants import GRID_WIDTH, GRID_HEIGHT
+from tetris.zobrist import zobrist_keys
+
+# Character of an empty cell in get_rows
+EMPTY_CELL = "."
 
 
 class Board:
@@ -47,6 +52,42 @@ class Board:
         
         return True
 
+    def fits(self, shape_type: str, rotation: int, x: int, y: int) -> bool:
+        """Check if a piece with the given shape and placement is valid.
+
+        Args:
+            shape_type: The type of tetromino.
+            rotation: The rotation index of the tetromino.
+            x: X coordinate of the piece's center.
+            y: Y coordinate of the piece's center.
+
+        Returns:
+            True if the position is valid, False otherwise.
+        """
+        for dx, dy in Tetromino.SHAPES[shape_type][rotation]:
+            cell_x = x + dx
+            cell_y = y + dy
+            if cell_x < 0 or cell_x >= self.width or cell_y >= self.height:
+                return False
+            if cell_y >= 0 and self.grid[cell_y][cell_x] is not None:
+                return False
+
+        return True
+
+    def landing_y(self, piece: Tetromino) -> int:
+        """Get the row the piece would land on if dropped straight down.
+
+        Args:
+            piece: The tetromino to drop. It must be in a valid position.
+
+        Returns:
+            The y coordinate of the piece's center after the drop.
+        """
+        y = piece.y
+        while self.fits(piece.shape_type, piece.rotation, piece.x, y + 1):
+            y += 1
+        return y
+
     def add_piece_to_grid(self, piece: Tetromino) -> None:
         """Add the piece to the grid.
 
@@ -119,9 +160,8 @@ class Board:
         if not self.current_piece:
             return False
 
-        # Move the piece down until it can't move anymore
-        while self.move_piece(0, 1):
-            pass
+        # Move the piece straight to its landing row
+        self.current_piece.y = self.landing_y(self.current_piece)
 
         # Add the piece to the grid
         self.add_piece_to_grid(self.current_piece)
@@ -171,6 +211,90 @@ class Board:
                     occupied.add((x, y))
         return occupied
 
+    def get_column_heights(self) -> List[int]:
+        """Get the height of the highest block in each column.
+
+        Returns:
+            A list with one height per column, 0 for an empty column.
+        """
+        heights = [0] * self.width
+        for x in range(self.width):
+            for y in range(self.height):
+                if self.grid[y][x] is not None:
+                    heights[x] = self.height - y
+                    break
+        return heights
+
+    def get_column_holes(self) -> List[int]:
+        """Get the number of empty cells below the highest block of each column.
+
+        Returns:
+            A list with one hole count per column.
+        """
+        holes = [0] * self.width
+        for x, column_height in enumerate(self.get_column_heights()):
+            for y in range(self.height - column_height, self.height):
+                if self.grid[y][x] is None:
+                    holes[x] += 1
+        return holes
+
+    def get_row_fills(self) -> List[int]:
+        """Get the number of occupied cells in each row.
+
+        Returns:
+            A list with one count per row, from top to bottom.
+        """
+        return [sum(cell is not None for cell in row) for row in self.grid]
+
+    def get_zobrist_hash(self) -> int:
+        """Get the 64-bit Zobrist hash of the occupied cells.
+
+        Block types are not part of the hash, so boards with the same shape
+        hash equally.
+
+        Returns:
+            The XOR of the Zobrist keys of all occupied cells.
+        """
+        keys = zobrist_keys(self.width, self.height)
+        value = 0
+        for y in range(self.height):
+            for x in range(self.width):
+                if self.grid[y][x] is not None:
+                    value ^= keys[y][x]
+        return value
+
+    def copy(self) -> "Board":
+        """Create an independent copy of the board.
+
+        Returns:
+            A board with the same cells and copies of the current pieces.
+        """
+        board = self.__class__.__new__(self.__class__)
+        board.__dict__.update(self.__dict__)
+        board.grid = [row[:] for row in self.grid]
+        if self.current_piece is not None:
+            board.current_piece = copy.copy(self.current_piece)
+        if self.next_piece is not None:
+            board.next_piece = copy.copy(self.next_piece)
+        return board
+
+    def get_rows(self) -> List[str]:
+        """Get the cells as text, e.g. to store a snapshot of the board.
+
+        Returns:
+            One string per row, top first, holding the shape type of each
+            cell or EMPTY_CELL.
+        """
+        return ["".join(cell or EMPTY_CELL for cell in row) for row in self.grid]
+
+    def set_rows(self, rows: List[str]) -> None:
+        """Replace the cells with ones returned by get_rows.
+
+        Args:
+            rows: One string per row, top first.
+        """
+        self.grid = [[None if cell == EMPTY_CELL else cell for cell in row] for row in rows]
+
     def get_cell_type(self, x: int, y: int) -> Optional[str]:
         """Get the type of block at the given position.
 
@@ -0,0 +1,279 @@
+"""Terminal renderer for Tetris built on curses."""
+
+import curses
+from typing import Any, Dict, List, Optional, Tuple
+from tetris.board import Board
+from tetris.pieces import Tetromino
+from tetris.render_base import BaseRenderer, Command, board_cells
+from tetris.constants import GRID_WIDTH, GRID_HEIGHT
+
+# Terminal colors of the tetrominoes; orange has no curses equivalent
+CURSES_COLORS = {
+    "I": curses.COLOR_CYAN,
+    "J": curses.COLOR_BLUE,
+    "L": curses.COLOR_WHITE,
+    "O": curses.COLOR_YELLOW,
+    "S": curses.COLOR_GREEN,
+    "T": curses.COLOR_MAGENTA,
+    "Z": curses.COLOR_RED,
+}
+
+# Every board cell is two characters wide to look roughly square
+BLOCK = "[]"
+GHOST = "::"
+EMPTY = " ."
+
+KEY_COMMANDS = {
+    27: Command.QUIT,  # Escape
+    ord("q"): Command.QUIT,
+    ord("Q"): Command.QUIT,
+    ord("r"): Command.RESTART,
+    ord("R"): Command.RESTART,
+    ord("p"): Command.PAUSE,
+    ord("P"): Command.PAUSE,
+    curses.KEY_LEFT: Command.LEFT,
+    curses.KEY_RIGHT: Command.RIGHT,
+    curses.KEY_DOWN: Command.DOWN,
+    curses.KEY_UP: Command.ROTATE,
+    ord(" "): Command.DROP,
+    curses.KEY_RESIZE: Command.REDRAW,
+}
+
+CONTROLS = (
+    "Controls:",
+    "Left/Right : Move",
+    "Up : Rotate",
+    "Down : Soft Drop",
+    "Space : Hard Drop",
+    "P : Pause",
+    "R : Restart",
+    "Esc/Q : Quit",
+)
+
+# A character cell on screen is (character, attributes)
+Cell = Tuple[str, int]
+
+
+class CursesRenderer(BaseRenderer):
+    """Draws the game to a terminal, writing only the cells that changed.
+
+    Each frame is drawn into a back buffer of character cells. On
+    ``update_display`` the buffer is compared with what the terminal already
+    shows, and only changed runs of cells are written, so an idle frame costs
+    no output at all.
+    """
+
+    def __init__(self, stdscr: Optional[Any] = None, width: int = GRID_WIDTH,
+                 height: int = GRID_HEIGHT):
+        """Initialize the renderer.
+
+        Args:
+            stdscr: The curses window to draw on. The terminal is set up, and
+                restored by ``close``, if None.
+            width: Width of the board in blocks.
+            height: Height of the board in blocks.
+        """
+        self.owns_screen = stdscr is None
+        if stdscr is None:
+            stdscr = curses.initscr()
+            curses.noecho()
+            curses.cbreak()
+            stdscr.keypad(True)
+        self.stdscr = stdscr
+        self.stdscr.nodelay(True)
+
+        self.attrs: Dict[str, int] = {shape_type: 0 for shape_type in CURSES_COLORS}
+        try:
+            curses.curs_set(0)
+            if curses.has_colors():
+                curses.start_color()
+                for pair, (shape_type, color) in enumerate(CURSES_COLORS.items(), start=1):
+                    curses.init_pair(pair, color, curses.COLOR_BLACK)
+                    self.attrs[shape_type] = curses.color_pair(pair) | curses.A_BOLD
+        except curses.error:
+            pass  # Not a real terminal, or one without colors
+
+        # The board sits inside a border; the panel is to its right
+        self.board_row = 1
+        self.board_col = 1
+        self.board_width = width
+        self.board_height = height
+        self.panel_col = self.board_col + 2 * width + 3
+
+        self.frames = 0
+        self.cells_written = 0
+        self.writes = 0
+        self._back: Dict[Tuple[int, int], Cell] = {}
+        self._front: Dict[Tuple[int, int], Cell] = {}
+
+    def _put(self, row: int, col: int, text: str, attr: int = 0) -> None:
+        """Write a string into the back buffer."""
+        for offset, character in enumerate(text):
+            self._back[(row, col + offset)] = (character, attr)
+
+    def clear_screen(self) -> None:
+        """Start a new frame with an empty back buffer."""
+        self._back = {}
+
+    def draw_board(self, board: Board) -> None:
+        """Draw the game board.
+
+        Args:
+            board: The game board to draw.
+        """
+        top = self.board_row - 1
+        left = self.board_col - 1
+        inner_width = 2 * board.width
+        self._put(top, left, "+" + "-" * inner_width + "+")
+        self._put(top + board.height + 1, left, "+" + "-" * inner_width + "+")
+
+        cells = board_cells(board)
+        for y in range(board.height):
+            row = self.board_row + y
+            self._put(row, left, "|")
+            self._put(row, self.board_col + inner_width, "|")
+            for x in range(board.width):
+                state = cells.get((x, y))
+                col = self.board_col + 2 * x
+                if state is None:
+                    self._put(row, col, EMPTY)
+                else:
+                    shape_type, ghost = state
+                    self._put(row, col, GHOST if ghost else BLOCK, self.attrs[shape_type])
+
+    def draw_next_piece(self, piece: Optional[Tetromino]) -> None:
+        """Draw the next piece preview.
+
+        Args:
+            piece: The next piece to draw.
+        """
+        self._put(self.board_row, self.panel_col, "Next")
+        if piece:
+            for dx, dy in piece.shape:
+                self._put(
+                    self.board_row + 2 + dy,
+                    self.panel_col + 2 * (dx + 1),
+                    BLOCK,
+                    self.attrs[piece.shape_type]
+                )
+
+    def draw_score(self, score: int, level: int, lines: int) -> None:
+        """Draw the score, level, and lines information.
+
+        Args:
+            score: Current score.
+            level: Current level.
+            lines: Number of lines cleared.
+        """
+        row = self.board_row + 6
+        self._put(row, self.panel_col, f"Score: {score}")
+        self._put(row + 1, self.panel_col, f"Level: {level}")
+        self._put(row + 2, self.panel_col, f"Lines: {lines}")
+
+    def draw_controls(self) -> None:
+        """Draw the controls information."""
+        row = self.board_row + 10
+        for offset, text in enumerate(CONTROLS):
+            self._put(row + offset, self.panel_col, text)
+
+    def _draw_message(self, title: str, hint: str) -> None:
+        """Draw a two-line message centered on the board."""
+        inner_width = 2 * self.board_width
+        row = self.board_row + self.board_height // 2 - 1
+        for offset, text in enumerate((title, "", hint)):
+            self._put(row + offset, self.board_col, text[:inner_width].center(inner_width),
+                      curses.A_REVERSE)
+
+    def draw_game_over(self) -> None:
+        """Draw the game over screen."""
+        self._draw_message("GAME OVER", "R: restart")
+
+    def draw_pause(self) -> None:
+        """Draw the pause screen."""
+        self._draw_message("PAUSED", "P: continue")
+
+    def update_display(self) -> None:
+        """Write the cells that changed since the last frame to the terminal."""
+        back = self._back
+        front = self._front
+        changed = {
+            position: cell for position, cell in back.items() if front.get(position) != cell
+        }
+        for position in front.keys() - back.keys():
+            changed[position] = (" ", 0)
+
+        # Join horizontally adjacent cells with equal attributes into one write
+        run_start: Optional[Tuple[int, int]] = None
+        run_text: List[str] = []
+        run_attr = 0
+        for row, col in sorted(changed):
+            character, attr = changed[(row, col)]
+            if (run_start is not None and row == run_start[0]
+                    and col == run_start[1] + len(run_text) and attr == run_attr):
+                run_text.append(character)
+                continue
+            if run_start is not None:
+                self._write(run_start, "".join(run_text), run_attr)
+            run_start, run_text, run_attr = (row, col), [character], attr
+        if run_start is not None:
+            self._write(run_start, "".join(run_text), run_attr)
+
+        if changed:
+            self.stdscr.refresh()
+        self.cells_written += len(changed)
+        self.frames += 1
+        self._front = back
+        self._back = {}
+
+    def _write(self, position: Tuple[int, int], text: str, attr: int) -> None:
+        """Write a run of characters to the terminal."""
+        self.writes += 1
+        try:
+            self.stdscr.addstr(position[0], position[1], text, attr)
+        except curses.error:
+            pass  # Off-screen, or the bottom-right corner of the terminal
+
+    def poll_input(self) -> List[Command]:
+        """Read the keys pressed since the last call.
+
+        Returns:
+            The commands in the order they were received.
+        """
+        commands = []
+        while True:
+            key = self.stdscr.getch()
+            if key == -1:
+                break
+            command = KEY_COMMANDS.get(key)
+            if command == Command.REDRAW:
+                self.invalidate()
+            if command is not None:
+                commands.append(command)
+        return commands
+
+    def invalidate(self) -> None:
+        """Clear the terminal so the next frame is written in full."""
+        self._front = {}
+        self.stdscr.clear()
+
+    def close(self) -> None:
+        """Restore the terminal if this renderer set it up."""
+        if self.owns_screen:
+            self.stdscr.keypad(False)
+            curses.nocbreak()
+            curses.echo()
+            curses.endwin()
+
+    def stats(self) -> Dict[str, Any]:
+        """Get the output statistics.
+
+        Returns:
+            A dictionary with the frame count, the number of cells and write
+            calls sent to the terminal, and cells per frame.
+        """
+        return {
+            "frames": self.frames,
+            "cells_written": self.cells_written,
+            "writes": self.writes,
+            "cells_per_frame": self.cells_written / self.frames if self.frames else 0.0,
+        }
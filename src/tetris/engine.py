@@ -0,0 +1,251 @@
+"""Headless game logic for Tetris.
+
+The engine owns the board, scoring, levels and gravity, and only advances when
+``step`` or ``tick`` is called. It never imports pygame, so it can be used to
+simulate games without a display.
+"""
+
+from enum import IntEnum
+from typing import Dict, Any, List, Optional
+from tetris.board import Board
+from tetris.pieces import PieceGenerator, Tetromino, UniformGenerator
+from tetris.constants import (
+    INITIAL_FALL_FREQUENCY, LEVEL_SPEEDUP_FACTOR, LINES_PER_LEVEL, SCORING
+)
+
+
+class Action(IntEnum):
+    """Player actions understood by the game engine."""
+
+    NONE = 0
+    LEFT = 1
+    RIGHT = 2
+    DOWN = 3
+    ROTATE = 4
+    DROP = 5
+
+
+def _piece_state(piece: Optional[Tetromino]) -> Optional[List[Any]]:
+    """Describe a piece as [shape type, rotation, x, y]."""
+    if piece is None:
+        return None
+    return [piece.shape_type, piece.rotation, piece.x, piece.y]
+
+
+def _piece_from_state(state: Optional[List[Any]]) -> Optional[Tetromino]:
+    """Create a piece described by _piece_state."""
+    if state is None:
+        return None
+    piece = Tetromino(state[0])
+    piece.rotation, piece.x, piece.y = state[1:]
+    return piece
+
+
+class GameEngine:
+    """Pure-logic Tetris game that advances on explicit actions and ticks."""
+
+    def __init__(self, board: Optional[Board] = None, seed: Optional[int] = None,
+                 preview_size: int = 1, generator: Optional[PieceGenerator] = None):
+        """Initialize a new game engine.
+
+        Args:
+            board: The board to play on. A new Board is created if None.
+            seed: Seed for the piece sequence when no generator is given.
+                Games with the same seed get the same pieces; a random
+                sequence is used if None.
+            preview_size: Number of upcoming pieces known in advance,
+                including the board's next piece.
+            generator: The piece generator. A UniformGenerator seeded with
+                ``seed`` is created if None.
+        """
+        self.board = board if board is not None else Board()
+        self.generator = generator if generator is not None else UniformGenerator(seed)
+        self.preview_size = max(1, preview_size)
+        self.reset()
+
+    @property
+    def seed(self) -> int:
+        """Seed of the piece sequence."""
+        return self.generator.seed
+
+    def reset(self) -> None:
+        """Reset the game to its initial state."""
+        self.board.reset()
+        self.score = 0
+        self.level = 1
+        self.lines_cleared = 0
+        self.pieces_placed = 0
+        self.fall_frequency = INITIAL_FALL_FREQUENCY
+        self.fall_timer = 0.0
+        self.game_over = False
+        self.generator.reset()
+
+        # Create initial pieces
+        self.board.next_piece = self.generator.next_piece()
+        self._spawn_new_piece()
+
+    def _spawn_new_piece(self) -> None:
+        """Spawn a new piece and check for game over."""
+        piece = self.board.next_piece
+        if piece is None:
+            piece = self.generator.next_piece()
+        self.board.current_piece = piece
+        self.board.next_piece = self.generator.next_piece()
+
+        # Check if the new piece can be placed
+        if not self.board.is_valid_position(piece):
+            self.game_over = True
+
+    def get_preview(self, count: Optional[int] = None) -> List[str]:
+        """Get the shape types of the upcoming pieces.
+
+        Args:
+            count: Maximum number of pieces to return. All known pieces are
+                returned if None.
+
+        Returns:
+            The upcoming shape types, starting with the next piece.
+        """
+        if count is None:
+            count = self.preview_size
+        if count <= 0 or self.board.next_piece is None:
+            return []
+        return [self.board.next_piece.shape_type] + self.generator.peek(count - 1)
+
+    def _lock_piece(self) -> int:
+        """Lock the current piece, clear lines and spawn the next piece.
+
+        Returns:
+            The number of lines cleared.
+        """
+        if self.board.current_piece:
+            self.board.add_piece_to_grid(self.board.current_piece)
+            self.board.current_piece = None
+        self.pieces_placed += 1
+
+        lines_cleared = self.board.clear_lines()
+        self.update_score(lines_cleared)
+        self._spawn_new_piece()
+        return lines_cleared
+
+    def update_score(self, lines_cleared: int) -> None:
+        """Update the score based on lines cleared.
+
+        Args:
+            lines_cleared: Number of lines cleared.
+        """
+        if lines_cleared > 0:
+            # Update lines count
+            self.lines_cleared += lines_cleared
+
+            # Update score
+            self.score += SCORING.get(lines_cleared, 0) * self.level
+
+            # Update level
+            new_level = (self.lines_cleared // LINES_PER_LEVEL) + 1
+            if new_level > self.level:
+                self.level = new_level
+                # Increase falling speed
+                self.fall_frequency *= LEVEL_SPEEDUP_FACTOR
+
+    def step(self, action: Action) -> bool:
+        """Apply a player action.
+
+        Args:
+            action: The action to apply.
+
+        Returns:
+            True if the action changed the game state, False otherwise.
+        """
+        if self.game_over:
+            return False
+
+        if action == Action.LEFT:
+            return self.board.move_piece(-1, 0)
+        if action == Action.RIGHT:
+            return self.board.move_piece(1, 0)
+        if action == Action.DOWN:
+            self.fall_timer = 0.0  # Reset fall timer
+            return self.board.move_piece(0, 1)
+        if action == Action.ROTATE:
+            return self.board.rotate_piece()
+        if action == Action.DROP:
+            self.board.drop_piece()
+            self._lock_piece()
+            return True
+
+        return False
+
+    def tick(self, dt: float) -> None:
+        """Advance gravity by the given amount of game time.
+
+        Args:
+            dt: Elapsed game time in seconds.
+        """
+        if self.game_over:
+            return
+
+        # Check if it's time for the piece to fall
+        self.fall_timer += dt
+        if self.fall_timer > self.fall_frequency:
+            # If the piece can't move down, place it
+            if not self.board.move_piece(0, 1):
+                self._lock_piece()
+            self.fall_timer = 0.0
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Capture everything needed to continue the game from this point.
+
+        The board cells, pieces, scoring, gravity timer and the position in
+        the piece stream are stored as plain JSON-compatible values. The
+        generator's seed is not, so a snapshot is restored into an engine
+        with the same generator.
+
+        Returns:
+            The snapshot, for restore.
+        """
+        return {
+            "grid": self.board.get_rows(),
+            "current": _piece_state(self.board.current_piece),
+            "next": _piece_state(self.board.next_piece),
+            "score": self.score,
+            "level": self.level,
+            "lines_cleared": self.lines_cleared,
+            "pieces_placed": self.pieces_placed,
+            "fall_frequency": self.fall_frequency,
+            "fall_timer": self.fall_timer,
+            "game_over": self.game_over,
+            "generator": list(self.generator.get_state()),
+        }
+
+    def restore(self, snapshot: Dict[str, Any]) -> None:
+        """Continue the game from a snapshot.
+
+        Args:
+            snapshot: A snapshot returned by ``snapshot``.
+        """
+        self.board.set_rows(snapshot["grid"])
+        self.board.current_piece = _piece_from_state(snapshot["current"])
+        self.board.next_piece = _piece_from_state(snapshot["next"])
+        self.score = snapshot["score"]
+        self.level = snapshot["level"]
+        self.lines_cleared = snapshot["lines_cleared"]
+        self.pieces_placed = snapshot["pieces_placed"]
+        self.fall_frequency = snapshot["fall_frequency"]
+        self.fall_timer = snapshot["fall_timer"]
+        self.game_over = snapshot["game_over"]
+        self.generator.set_state(tuple(snapshot["generator"]))
+
+    def get_state(self) -> Dict[str, Any]:
+        """Get the current game state.
+
+        Returns:
+            A dictionary containing the current game state.
+        """
+        return {
+            "score": self.score,
+            "level": self.level,
+            "lines_cleared": self.lines_cleared,
+            "pieces_placed": self.pieces_placed,
+            "game_over": self.game_over,
+        }
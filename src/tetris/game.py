@@ -1,53 +1,165 @@
 """Main game logic for Tetris."""
 
-import pygame
 import time
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional, Tuple
+from tetris.ai import HeuristicAI
+from tetris.bitboard import BitBoard
 from tetris.board import Board
-from tetris.pieces import Tetromino, get_random_tetromino
-from tetris.renderer import Renderer
-from tetris.constants import (
-    FPS, INITIAL_FALL_FREQUENCY, LEVEL_SPEEDUP_FACTOR,
-    LINES_PER_LEVEL, SCORING, KEY_REPEAT_DELAY, KEY_REPEAT_INTERVAL
-)
+from tetris.engine import Action, GameEngine
+from tetris.pieces import PieceGenerator, Tetromino
+from tetris.render_base import BaseRenderer, Command
+from tetris.replay import ReplayWriter
+from tetris.scheduler import FixedStepScheduler
+from tetris.constants import FPS
 
 
 class TetrisGame:
-    """Main Tetris game class."""
+    """Interactive Tetris game built on top of the headless GameEngine.
 
-    def __init__(self):
-        """Initialize a new Tetris game."""
-        self.board = Board()
-        self.renderer = Renderer()
-        self.clock = pygame.time.Clock()
+    Gravity advances in fixed ticks of ``1 / FPS`` seconds of game time, and
+    every action is applied between two ticks, so a game can be recorded as
+    a replay of (tick, action) events and re-simulated exactly. ``run``
+    takes the ticks from a FixedStepScheduler, so rendering never delays
+    or speeds up the simulation.
+    """
+
+    # Commands that map directly onto engine actions
+    COMMAND_ACTIONS = {
+        Command.LEFT: Action.LEFT,
+        Command.RIGHT: Action.RIGHT,
+        Command.DOWN: Action.DOWN,
+        Command.ROTATE: Action.ROTATE,
+        Command.DROP: Action.DROP,
+    }
+
+    def __init__(self, engine: Optional[GameEngine] = None, ai: Optional[HeuristicAI] = None,
+                 generator: Optional[PieceGenerator] = None,
+                 renderer: Optional[BaseRenderer] = None, hold_frames: bool = True,
+                 replay_dir: Optional[str] = None,
+                 scheduler: Optional[FixedStepScheduler] = None):
+        """Initialize a new Tetris game.
+
+        Args:
+            engine: The game engine to play. A new GameEngine on a BitBoard,
+                whose ghost piece drop is read off the column heights, is
+                created if None.
+            ai: If given, the AI plays the game one action per frame.
+            generator: The piece generator, replacing the engine's if given.
+            renderer: The rendering backend to draw with and read input
+                from. A full-redraw pygame Renderer is created if None.
+            hold_frames: While paused or over, skip rendering frames that
+                would look the same as the last one.
+            replay_dir: If given, every game is recorded to a replay file
+                in this directory.
+            scheduler: Schedules the ticks and frames of ``run``. One on the
+                monotonic clock at FPS ticks per second is created if None.
+        """
+        if engine is None:
+            engine = GameEngine(BitBoard(), generator=generator)
+        self.engine = engine
+        if generator is not None:
+            self.engine.generator = generator
+        self.ai = ai
+        if renderer is None:
+            from tetris.renderer import Renderer
+            renderer = Renderer()
+        self.renderer = renderer
+        self.hold_frames = hold_frames
+        self.replay_dir = replay_dir
+        self.replay_writer: Optional[ReplayWriter] = None
+        self.tick_seconds = 1.0 / FPS
+        self.scheduler = scheduler if scheduler is not None else FixedStepScheduler(FPS)
         self.reset_game()
-        
-        # Set up key repeat for smoother controls
-        pygame.key.set_repeat(KEY_REPEAT_DELAY, KEY_REPEAT_INTERVAL)
+
+    @property
+    def board(self) -> Board:
+        """The board of the underlying engine."""
+        return self.engine.board
+
+    @property
+    def score(self) -> int:
+        """The current score."""
+        return self.engine.score
+
+    @score.setter
+    def score(self, value: int) -> None:
+        self.engine.score = value
+
+    @property
+    def level(self) -> int:
+        """The current level."""
+        return self.engine.level
+
+    @level.setter
+    def level(self, value: int) -> None:
+        self.engine.level = value
+
+    @property
+    def lines_cleared(self) -> int:
+        """The total number of lines cleared."""
+        return self.engine.lines_cleared
+
+    @lines_cleared.setter
+    def lines_cleared(self, value: int) -> None:
+        self.engine.lines_cleared = value
+
+    @property
+    def fall_frequency(self) -> float:
+        """Seconds between gravity steps."""
+        return self.engine.fall_frequency
+
+    @fall_frequency.setter
+    def fall_frequency(self, value: float) -> None:
+        self.engine.fall_frequency = value
+
+    @property
+    def game_over(self) -> bool:
+        """Whether the game has ended."""
+        return self.engine.game_over
+
+    @game_over.setter
+    def game_over(self, value: bool) -> None:
+        self.engine.game_over = value
 
     def reset_game(self) -> None:
         """Reset the game to its initial state."""
-        self.board.reset()
-        self.score = 0
-        self.level = 1
-        self.lines_cleared = 0
-        self.fall_frequency = INITIAL_FALL_FREQUENCY
-        self.last_fall_time = time.time()
-        self.game_over = False
+        # The replay of the previous game ends with that game's final state
+        self.close_replay()
+        self.engine.reset()
+        self.last_update_time = time.monotonic()
+        self.ticks = 0
+        self._accumulator = 0.0
         self.paused = False
-        
-        # Create initial pieces
-        self.board.next_piece = get_random_tetromino()
-        self._spawn_new_piece()
-
-    def _spawn_new_piece(self) -> None:
-        """Spawn a new piece and check for game over."""
-        self.board.current_piece = self.board.next_piece
-        self.board.next_piece = get_random_tetromino()
-        
-        # Check if the new piece can be placed
-        if not self.board.is_valid_position(self.board.current_piece):
-            self.game_over = True
+        self._ai_plan: List[Action] = []
+        self._ai_piece: Optional[Tetromino] = None
+        self._held_frame: Optional[Tuple[Any, ...]] = None
+
+        if self.replay_dir is not None:
+            self.replay_writer = ReplayWriter.create(self.replay_dir, self.engine, FPS)
+
+    def close_replay(self) -> None:
+        """Finish the replay file of the current game, if one is recorded."""
+        if self.replay_writer is not None:
+            self.replay_writer.close(self.ticks)
+            self.replay_writer = None
+
+    def _step(self, action: Action) -> bool:
+        """Apply an action to the engine, recording it to the replay.
+
+        Args:
+            action: The action to apply.
+
+        Returns:
+            True if the action changed the game state, False otherwise.
+        """
+        if self.game_over:
+            return False
+        if self.replay_writer is not None:
+            self.replay_writer.record(self.ticks, action)
+        changed = self.engine.step(action)
+        if self.game_over:
+            self.close_replay()
+        return changed
 
     def _update_score(self, lines_cleared: int) -> None:
         """Update the score based on lines cleared.
@@ -55,84 +167,93 @@ class TetrisGame:
         Args:
             lines_cleared: Number of lines cleared.
         """
-        if lines_cleared > 0:
-            # Update lines count
-            self.lines_cleared += lines_cleared
-            
-            # Update score
-            self.score += SCORING.get(lines_cleared, 0) * self.level
-            
-            # Update level
-            new_level = (self.lines_cleared // LINES_PER_LEVEL) + 1
-            if new_level > self.level:
-                self.level = new_level
-                # Increase falling speed
-                self.fall_frequency *= LEVEL_SPEEDUP_FACTOR
+        self.engine.update_score(lines_cleared)
 
     def _handle_events(self) -> bool:
-        """Handle pygame events.
+        """Handle the input read by the renderer.
 
         Returns:
             False if the game should quit, True otherwise.
         """
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
+        for command in self.renderer.poll_input():
+            if command == Command.QUIT:
                 return False
-            
-            if event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_ESCAPE:
-                    return False
-                
-                if self.game_over:
-                    if event.key == pygame.K_r:
-                        self.reset_game()
-                    continue
-                
-                if event.key == pygame.K_p:
-                    self.paused = not self.paused
-                    continue
-                
-                if self.paused:
-                    continue
-                
-                if event.key == pygame.K_LEFT:
-                    self.board.move_piece(-1, 0)
-                elif event.key == pygame.K_RIGHT:
-                    self.board.move_piece(1, 0)
-                elif event.key == pygame.K_DOWN:
-                    self.board.move_piece(0, 1)
-                    self.last_fall_time = time.time()  # Reset fall timer
-                elif event.key == pygame.K_UP:
-                    self.board.rotate_piece()
-                elif event.key == pygame.K_SPACE:
-                    self.board.drop_piece()
-                    lines_cleared = self.board.clear_lines()
-                    self._update_score(lines_cleared)
-                    self._spawn_new_piece()
-        
+
+            if command == Command.REDRAW:
+                # The screen content may be lost; render the held frame again
+                self._held_frame = None
+                continue
+
+            if self.game_over:
+                if command == Command.RESTART:
+                    # A new game gets a new piece sequence
+                    self.engine.generator.reseed()
+                    self.reset_game()
+                continue
+
+            if command == Command.PAUSE:
+                self.paused = not self.paused
+                continue
+
+            if self.paused:
+                continue
+
+            action = self.COMMAND_ACTIONS.get(command)
+            if action is not None and self.ai is None:
+                self._step(action)
+
         return True
 
-    def _update_game(self) -> None:
-        """Update the game state."""
-        if self.game_over or self.paused:
+    def _play_ai_move(self) -> None:
+        """Play the next action of the AI's plan for the current piece."""
+        if self.ai is None:
             return
+        piece = self.board.current_piece
+        if piece is not self._ai_piece:
+            self._ai_piece = piece
+            self._ai_plan = self.ai.actions(self.engine)
+            self._ai_plan.reverse()
+
+        if self._ai_plan:
+            action = self._ai_plan.pop()
+            if not self._step(action):
+                # Gravity moved the piece off the planned path; plan again
+                self._ai_piece = None
+
+    def _update_game(self, dt: Optional[float] = None) -> float:
+        """Update the game state.
+
+        The AI plays one action, and gravity runs for every whole tick in
+        the time that passed; the remainder carries over to the next update.
+
+        Args:
+            dt: Game time to advance in seconds. The wall-clock time since
+                the last update is used if None.
+
+        Returns:
+            The game time that passed.
+        """
+        current_time = time.monotonic()
+        elapsed = current_time - self.last_update_time if dt is None else dt
+        self.last_update_time = current_time
+
+        if self.game_over or self.paused:
+            return elapsed
         
-        # Check if it's time for the piece to fall
-        current_time = time.time()
-        if current_time - self.last_fall_time > self.fall_frequency:
-            # Try to move the piece down
-            if not self.board.move_piece(0, 1):
-                # If the piece can't move down, place it
-                self.board.add_piece_to_grid(self.board.current_piece)
-                
-                # Clear completed lines
-                lines_cleared = self.board.clear_lines()
-                self._update_score(lines_cleared)
-                
-                # Spawn a new piece
-                self._spawn_new_piece()
-            
-            self.last_fall_time = current_time
+        if self.ai is not None:
+            self._play_ai_move()
+
+        self._accumulator += elapsed
+        # Allow for rounding, so an update of exactly one tick runs it
+        while self._accumulator >= self.tick_seconds - 1e-9 and not self.game_over:
+            self._accumulator -= self.tick_seconds
+            self.engine.tick(self.tick_seconds)
+            self.ticks += 1
+            if self.replay_writer is not None and not self.game_over:
+                self.replay_writer.start_tick(self.ticks)
+        if self.game_over:
+            self.close_replay()
+        return elapsed
 
     def _render(self) -> None:
         """Render the game."""
@@ -149,16 +270,51 @@ class TetrisGame:
         
         self.renderer.update_display()
 
+    def _frame_key(self) -> Optional[Tuple[Any, ...]]:
+        """Describe a frame that can be held on screen.
+
+        Returns:
+            Everything a paused or game over frame shows, or None while the
+            game is running and every frame must be rendered.
+        """
+        if not (self.paused or self.game_over):
+            return None
+        return (self.paused, self.game_over, self.score, self.level,
+                self.lines_cleared, self.engine.pieces_placed)
+
+    def _render_frame(self) -> bool:
+        """Render a frame unless it is held.
+
+        Returns:
+            True if the frame was rendered.
+        """
+        frame_key = self._frame_key() if self.hold_frames else None
+        if frame_key is not None and frame_key == self._held_frame:
+            return False
+        self._held_frame = frame_key
+        self._render()
+        return True
+
     def run(self) -> None:
-        """Run the game loop."""
+        """Run the game loop.
+
+        Each iteration handles input, simulates the ticks that elapsed,
+        renders a frame unless the scheduler skips it, and sleeps until the
+        next tick is due.
+        """
+        scheduler = self.scheduler
+        scheduler.reset()
         running = True
         while running:
             running = self._handle_events()
-            self._update_game()
-            self._render()
-            self.clock.tick(FPS)
-        
-        pygame.quit()
+            for _ in range(scheduler.advance()):
+                self._update_game(self.tick_seconds)
+            if scheduler.should_render():
+                self._render_frame()
+            scheduler.wait()
+
+        self.close_replay()
+        self.renderer.close()
 
     def get_state(self) -> Dict[str, Any]:
         """Get the current game state.
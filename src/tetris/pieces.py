@@ -1,6 +1,7 @@
 """Tetromino pieces for the Tetris game."""
 
-from typing import Dict, List, Tuple
+from abc import ABC, abstractmethod
+from typing import Dict, List, Optional, Tuple, Type
 import random
 
 
@@ -53,6 +54,10 @@ class Tetromino:
         ],
     }
 
+    # Position of newly created pieces
+    SPAWN_X = 5  # Start in the middle of the board
+    SPAWN_Y = 0  # Start at the top
+
     def __init__(self, shape_type: str = None):
         """Initialize a new tetromino.
 
@@ -60,12 +65,12 @@ class Tetromino:
             shape_type: The type of tetromino to create. If None, a random one is chosen.
         """
         if shape_type is None:
-            shape_type = random.choice(list(self.SHAPES.keys()))
+            shape_type = random.choice(SHAPE_TYPES)
         
         self.shape_type = shape_type
         self.rotation = 0
-        self.x = 5  # Start in the middle of the board
-        self.y = 0  # Start at the top
+        self.x = self.SPAWN_X
+        self.y = self.SPAWN_Y
 
     @property
     def shape(self) -> List[Tuple[int, int]]:
@@ -83,11 +88,194 @@ class Tetromino:
         else:
             self.rotation = (self.rotation - 1) % 4
 
+    def is_at_spawn(self) -> bool:
+        """Check whether the tetromino has not moved or rotated since spawning."""
+        return self.rotation == 0 and self.x == self.SPAWN_X and self.y == self.SPAWN_Y
+
     def get_positions(self) -> List[Tuple[int, int]]:
         """Get the absolute positions of the tetromino blocks on the board."""
         return [(self.x + dx, self.y + dy) for dx, dy in self.shape]
 
 
+# Shape types in a fixed order, built once instead of on every spawn
+SHAPE_TYPES: Tuple[str, ...] = tuple(Tetromino.SHAPES)
+
+
 def get_random_tetromino() -> Tetromino:
     """Create a new random tetromino."""
     return Tetromino()
+
+
+class PieceGenerator(ABC):
+    """A reproducible stream of shape types, generated in blocks.
+
+    Block ``k`` of the stream is produced by an RNG seeded from the
+    generator seed and ``k`` alone, so blocks can be generated ahead of time
+    and the position in the stream is fully described by the pair
+    (block index, offset). Subclasses decide how a block is filled.
+    """
+
+    # Name used to select the generator in create_generator
+    kind = ""
+
+    def __init__(self, seed: Optional[int] = None, block_size: int = 70):
+        """Initialize the generator.
+
+        Args:
+            seed: Seed of the stream. A random seed is chosen if None.
+            block_size: Number of shape types generated at a time.
+        """
+        self.block_size = block_size
+        self.reseed(seed)
+
+    def reseed(self, seed: Optional[int] = None) -> None:
+        """Start a new stream.
+
+        Args:
+            seed: Seed of the new stream. A random seed is chosen if None.
+        """
+        self.seed = seed if seed is not None else random.getrandbits(32)
+        self._blocks: Dict[int, List[str]] = {}
+        self.reset()
+
+    def reset(self) -> None:
+        """Restart the stream from its first piece."""
+        self.block_index = 0
+        self.offset = 0
+
+    @abstractmethod
+    def _fill_block(self, rng: random.Random) -> List[str]:
+        """Generate one block of shape types.
+
+        Args:
+            rng: RNG dedicated to this block.
+
+        Returns:
+            A list of ``block_size`` shape types.
+        """
+
+    def _get_block(self, index: int) -> List[str]:
+        """Get a block of the stream, keeping only the most recent ones cached."""
+        block = self._blocks.get(index)
+        if block is None:
+            block = self._fill_block(random.Random((self.seed << 32) + index))
+            if len(self._blocks) >= 2:
+                self._blocks.pop(min(self._blocks))
+            self._blocks[index] = block
+        return block
+
+    def next_type(self) -> str:
+        """Get the next shape type of the stream."""
+        shape_type = self._get_block(self.block_index)[self.offset]
+        self.offset += 1
+        if self.offset == self.block_size:
+            self.block_index += 1
+            self.offset = 0
+        return shape_type
+
+    def next_piece(self) -> Tetromino:
+        """Create the next piece of the stream."""
+        return Tetromino(self.next_type())
+
+    def peek(self, count: int) -> List[str]:
+        """Get upcoming shape types without consuming them.
+
+        Args:
+            count: Number of shape types to return.
+
+        Returns:
+            The next ``count`` shape types of the stream.
+        """
+        shape_types: List[str] = []
+        block_index = self.block_index
+        offset = self.offset
+        while len(shape_types) < count:
+            block = self._get_block(block_index)
+            shape_types.extend(block[offset:offset + count - len(shape_types)])
+            block_index += 1
+            offset = 0
+        return shape_types
+
+    def generate(self, count: int) -> List[str]:
+        """Consume and return the next shape types in bulk.
+
+        Args:
+            count: Number of shape types to return.
+
+        Returns:
+            The next ``count`` shape types of the stream.
+        """
+        shape_types = self.peek(count)
+        position = self.block_index * self.block_size + self.offset + count
+        self.block_index, self.offset = divmod(position, self.block_size)
+        return shape_types
+
+    def get_state(self) -> Tuple[int, int]:
+        """Get the position in the stream as (block index, offset)."""
+        return self.block_index, self.offset
+
+    def set_state(self, state: Tuple[int, int]) -> None:
+        """Move to a position returned by get_state.
+
+        Args:
+            state: The (block index, offset) pair.
+        """
+        self.block_index, self.offset = state
+
+
+class UniformGenerator(PieceGenerator):
+    """Picks every shape type independently and uniformly at random."""
+
+    kind = "uniform"
+
+    def _fill_block(self, rng: random.Random) -> List[str]:
+        """Generate one block of independent uniform picks."""
+        return [rng.choice(SHAPE_TYPES) for _ in range(self.block_size)]
+
+
+class BagGenerator(PieceGenerator):
+    """Deals shape types from shuffled bags holding one of each type."""
+
+    kind = "bag"
+
+    def __init__(self, seed: Optional[int] = None, block_size: int = 70):
+        """Initialize the generator.
+
+        Args:
+            seed: Seed of the stream. A random seed is chosen if None.
+            block_size: Number of shape types generated at a time; must be a
+                multiple of the bag size.
+        """
+        if block_size % len(SHAPE_TYPES):
+            raise ValueError(f"block size must be a multiple of {len(SHAPE_TYPES)}")
+        super().__init__(seed, block_size)
+
+    def _fill_block(self, rng: random.Random) -> List[str]:
+        """Generate one block of shuffled bags."""
+        shape_types: List[str] = []
+        for _ in range(self.block_size // len(SHAPE_TYPES)):
+            bag = list(SHAPE_TYPES)
+            rng.shuffle(bag)
+            shape_types.extend(bag)
+        return shape_types
+
+
+GENERATORS: Dict[str, Type[PieceGenerator]] = {
+    UniformGenerator.kind: UniformGenerator,
+    BagGenerator.kind: BagGenerator,
+}
+
+
+def create_generator(kind: str = "uniform", seed: Optional[int] = None) -> PieceGenerator:
+    """Create a piece generator by name.
+
+    Args:
+        kind: "uniform" or "bag".
+        seed: Seed of the stream. A random seed is chosen if None.
+
+    Returns:
+        The generator.
+    """
+    if kind not in GENERATORS:
+        raise ValueError(f"unknown piece generator: {kind}")
+    return GENERATORS[kind](seed)
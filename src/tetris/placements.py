@@ -0,0 +1,181 @@
+"""Enumeration of the final resting spots a piece can reach."""
+
+import random
+import time
+from collections import deque
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+from tetris.board import Board
+from tetris.bitboard import BitBoard
+from tetris.engine import Action
+from tetris.pieces import Tetromino
+
+
+class Placement(NamedTuple):
+    """A final resting spot of a piece."""
+
+    shape_type: str
+    rotation: int
+    x: int
+    y: int
+
+
+def _rotation_period(shape_type: str) -> int:
+    """Get the number of distinct rotations of a shape."""
+    rotations = [sorted(offsets) for offsets in Tetromino.SHAPES[shape_type]]
+    for period in (1, 2):
+        if all(rotations[r] == rotations[r % period] for r in range(4)):
+            return period
+    return 4
+
+
+# Rotations repeat with this period (O: 1; I, S, Z: 2; J, L, T: 4), so a
+# rotation index can be reduced modulo the period without changing the cells.
+ROTATION_PERIODS: Dict[str, int] = {
+    shape_type: _rotation_period(shape_type) for shape_type in Tetromino.SHAPES
+}
+
+# Search moves as (action, dx, dy, rotation steps)
+_MOVES = (
+    (Action.LEFT, -1, 0, 0),
+    (Action.RIGHT, 1, 0, 0),
+    (Action.DOWN, 0, 1, 0),
+    (Action.ROTATE, 0, 0, 1),
+)
+
+State = Tuple[int, int, int]
+
+
+class PlacementGenerator:
+    """Finds every placement reachable by legal moves and rotations.
+
+    The search is a breadth-first walk over (rotation, x, y) states with a
+    visited set, so every state is checked against the board once. Rotations
+    are reduced modulo ``ROTATION_PERIODS`` so symmetric rotations of O, I, S
+    and Z share states and produce a single placement. Running totals are kept
+    so throughput can be tracked across searches.
+    """
+
+    def __init__(self):
+        """Initialize the generator with empty statistics."""
+        self.searches = 0
+        self.states_visited = 0
+        self.placements_found = 0
+        self.seconds = 0.0
+        self._parents: Dict[State, Tuple[Optional[State], Action]] = {}
+        self._shape_type: Optional[str] = None
+
+    def generate(self, board: Board, piece: Tetromino) -> List[Placement]:
+        """Find the placements of a piece on a board.
+
+        Args:
+            board: The board to search. It is not modified.
+            piece: The piece to place, starting from its current position.
+
+        Returns:
+            The distinct placements, in breadth-first order.
+        """
+        start_time = time.perf_counter()
+        shape_type = piece.shape_type
+        period = ROTATION_PERIODS[shape_type]
+        fits = board.fits
+
+        start = (piece.rotation % period, piece.x, piece.y)
+        parents: Dict[State, Tuple[Optional[State], Action]] = {}
+        placements: List[Placement] = []
+
+        if fits(shape_type, start[0], start[1], start[2]):
+            parents[start] = (None, Action.NONE)
+            queue = deque([start])
+            while queue:
+                state = queue.popleft()
+                rotation, x, y = state
+                for action, dx, dy, turn in _MOVES:
+                    new_state = ((rotation + turn) % period, x + dx, y + dy)
+                    if new_state in parents:
+                        continue
+                    if fits(shape_type, new_state[0], new_state[1], new_state[2]):
+                        parents[new_state] = (state, action)
+                        queue.append(new_state)
+
+                # A state is a placement when the piece cannot move down
+                if not fits(shape_type, rotation, x, y + 1):
+                    placements.append(Placement(shape_type, rotation, x, y))
+
+        self._parents = parents
+        self._shape_type = shape_type
+        self.searches += 1
+        self.states_visited += len(parents)
+        self.placements_found += len(placements)
+        self.seconds += time.perf_counter() - start_time
+        return placements
+
+    def path_to(self, placement: Placement) -> List[Action]:
+        """Get the actions that move the piece to a placement and lock it.
+
+        Args:
+            placement: A placement returned by the last call to generate.
+
+        Returns:
+            The shortest list of actions, ending with a hard drop.
+        """
+        if placement.shape_type != self._shape_type:
+            raise ValueError("placement does not come from the last search")
+
+        actions = [Action.DROP]
+        state: Optional[State] = (placement.rotation, placement.x, placement.y)
+        while state is not None:
+            state, action = self._parents[state]
+            if action != Action.NONE:
+                actions.append(action)
+        actions.reverse()
+        return actions
+
+    @property
+    def placements_per_second(self) -> float:
+        """Placements found per second of search time."""
+        return self.placements_found / self.seconds if self.seconds > 0 else 0.0
+
+    def stats(self) -> Dict[str, Any]:
+        """Get the running search statistics.
+
+        Returns:
+            A dictionary of counters and throughput.
+        """
+        return {
+            "searches": self.searches,
+            "states_visited": self.states_visited,
+            "placements_found": self.placements_found,
+            "seconds": self.seconds,
+            "placements_per_second": self.placements_per_second,
+        }
+
+
+def benchmark(pieces: int = 1000, seed: int = 0) -> Dict[str, Any]:
+    """Measure placement throughput on boards from a seeded random game.
+
+    Args:
+        pieces: Number of pieces to search and place.
+        seed: Seed of the random game.
+
+    Returns:
+        The generator statistics after the run.
+    """
+    rng = random.Random(seed)
+    board = BitBoard()
+    generator = PlacementGenerator()
+    shape_types = tuple(Tetromino.SHAPES)
+
+    for _ in range(pieces):
+        piece = Tetromino(rng.choice(shape_types))
+        placements = generator.generate(board, piece)
+        if not placements:
+            board.reset()
+            continue
+        placement = rng.choice(placements)
+        piece.rotation, piece.x, piece.y = placement.rotation, placement.x, placement.y
+        board.add_piece_to_grid(piece)
+        board.clear_lines()
+        if board.is_game_over():
+            board.reset()
+
+    return generator.stats()
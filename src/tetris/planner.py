@@ -0,0 +1,238 @@
+"""Multi-piece lookahead planning with beam search."""
+
+import time
+from concurrent.futures import ProcessPoolExecutor
+from heapq import nlargest
+from operator import itemgetter
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+from tetris.ai import HeuristicAI, HeuristicWeights
+from tetris.board import Board
+from tetris.pieces import Tetromino
+from tetris.placements import Placement, PlacementGenerator
+from tetris.zobrist import TranspositionTable
+
+# A search node is (value, lines reward so far, board, first placement)
+Node = Tuple[float, float, Board, Placement]
+
+# A cached expansion is a list of (placement, lines cleared, static value);
+# child boards are rebuilt only for the states that survive the beam
+Expansion = List[Tuple[Placement, int, float]]
+
+# A beam candidate is (value, lines reward so far, parent board, first
+# placement, placement on the parent board)
+Candidate = Tuple[float, float, Board, Placement, Placement]
+
+# Approximate size of one cached expansion, about 25 placements
+EXPANSION_ENTRY_BYTES = 4096
+
+_node_value = itemgetter(0)
+
+
+class BeamPlanner(HeuristicAI):
+    """Chooses moves by beam search over the current and preview pieces.
+
+    The current piece is expanded into every reachable placement, and each
+    following preview piece expands the surviving states again. Only the
+    ``beam_width`` best states are kept at each depth, scored by the line
+    rewards collected on the way plus the heuristic value of the final
+    board. The first placement of the best state is played.
+
+    When searching more than one preview piece, expansions are cached in a
+    transposition table keyed on (board hash, piece type), so states reached
+    through different move orders are only expanded once. The cache keeps
+    placements and values only, not child boards, and is sized by memory.
+    """
+
+    def __init__(self, weights: Optional[HeuristicWeights] = None, depth: int = 1,
+                 beam_width: int = 8, time_budget: Optional[float] = None,
+                 workers: int = 1, table: Optional[TranspositionTable] = None,
+                 expansion_memory: int = 64 * 1024 * 1024):
+        """Initialize the planner.
+
+        Args:
+            weights: Feature weights. The defaults are used if None.
+            depth: Number of preview pieces to search after the current one.
+            beam_width: Number of states kept at each depth.
+            time_budget: Seconds a search may take. When the budget runs out
+                the best move of the last completed depth is played.
+            workers: Search the root children in this many processes when
+                greater than 1.
+            table: Optional transposition table for chosen moves, see
+                HeuristicAI.
+            expansion_memory: Approximate bytes used by the expansion
+                cache. No cache is kept at depth 1, where expansions are
+                never reused.
+        """
+        super().__init__(weights, table)
+        self.lookahead = depth
+        self.beam_width = beam_width
+        self.time_budget = time_budget
+        self.workers = workers
+        self.expander = PlacementGenerator()
+        self.expansions: Optional[TranspositionTable] = None
+        if depth > 1:
+            capacity = max(1, expansion_memory // EXPANSION_ENTRY_BYTES)
+            self.expansions = TranspositionTable(capacity)
+        self.timeouts = 0
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+    def _expand(self, board: Board, shape_type: str) -> Expansion:
+        """Get every placement of a newly spawned piece and its result."""
+        key = (board.get_zobrist_hash(), shape_type)
+        if self.expansions is not None:
+            expansion = self.expansions.get(key)
+            if expansion is not None:
+                return expansion
+
+        expansion = []
+        for placement in self.expander.generate(board, Tetromino(shape_type)):
+            child, lines_cleared = self.place(board, placement)
+            expansion.append((placement, lines_cleared, self.evaluate(child, 0)))
+        if self.expansions is not None:
+            self.expansions.put(key, expansion)
+        return expansion
+
+    def _roots(self, board: Board, piece: Tetromino) -> List[Node]:
+        """Expand the current piece into the first level of search nodes."""
+        lines_weight = self.weights.lines
+        nodes = []
+        for placement in self.generator.generate(board, piece):
+            child, lines_cleared = self.place(board, placement)
+            reward = lines_weight * lines_cleared
+            nodes.append((reward + self.evaluate(child, 0), reward, child, placement))
+        return nodes
+
+    def _beam(self, nodes: List[Node], preview: Sequence[str],
+              deadline: Optional[float]) -> Tuple[Node, int, bool]:
+        """Run the beam search from the given nodes.
+
+        Args:
+            nodes: The first level of the search.
+            preview: Shape types of the pieces to search after the first.
+            deadline: perf_counter() time at which to stop, or None.
+
+        Returns:
+            The best node of the deepest level completed in time, the number
+            of preview pieces that level is below the nodes, and whether the
+            search stopped because every state tops out.
+        """
+        lines_weight = self.weights.lines
+        beam = nlargest(self.beam_width, nodes, key=_node_value)
+
+        for depth, shape_type in enumerate(preview):
+            expanded: List[Candidate] = []
+            for _, reward, board, root in beam:
+                if deadline is not None and time.perf_counter() > deadline:
+                    self.timeouts += 1
+                    return beam[0], depth, False
+                for placement, lines_cleared, value in self._expand(board, shape_type):
+                    child_reward = reward + lines_weight * lines_cleared
+                    expanded.append((child_reward + value, child_reward, board, root,
+                                     placement))
+
+            # Every state tops out; keep the best move found so far
+            if not expanded:
+                return beam[0], depth, True
+            beam = [
+                (value, reward, self.place(board, placement)[0], root)
+                for value, reward, board, root, placement
+                in nlargest(self.beam_width, expanded, key=_node_value)
+            ]
+
+        return beam[0], len(preview), False
+
+    def choose(self, board: Board, piece: Tetromino,
+               preview: Sequence[str] = ()) -> Optional[Placement]:
+        """Choose the first move of the best plan for the current and preview pieces.
+
+        Args:
+            board: The board to play on.
+            piece: The piece to place.
+            preview: Upcoming shape types; at most ``depth`` are searched.
+
+        Returns:
+            The best placement, or None if the piece cannot be placed.
+        """
+        deadline = None
+        if self.time_budget is not None:
+            deadline = time.perf_counter() + self.time_budget
+
+        nodes = self._roots(board, piece)
+        if not nodes:
+            return None
+
+        preview = list(preview)[:self.lookahead]
+        if self.workers > 1 and preview:
+            return self._choose_parallel(nodes, preview, deadline)
+        return self._beam(nodes, preview, deadline)[0][3]
+
+    def _choose_parallel(self, nodes: List[Node], preview: List[str],
+                         deadline: Optional[float]) -> Placement:
+        """Search the subtree of every root child in a worker process.
+
+        Each worker runs its share of the subtrees one after another, so the
+        time left is split between the subtrees a worker runs, and the
+        search still ends by the deadline.
+
+        Subtrees may stop at different depths, and values of boards at
+        different depths are not comparable. Subtrees in which every state
+        tops out rank last, then deeper subtrees rank first, and values only
+        decide between subtrees searched to the same depth.
+        """
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(self.workers)
+
+        budget = None
+        if deadline is not None:
+            remaining = max(0.0, deadline - time.perf_counter())
+            budget = remaining * min(self.workers, len(nodes)) / len(nodes)
+        weights = self.weights.to_dict()
+        futures = [
+            self._executor.submit(
+                _search_subtree, node, preview, weights, self.beam_width, budget
+            )
+            for node in nodes
+        ]
+        ranks = []
+        for future in futures:
+            value, depth, topped_out, timeouts = future.result()
+            ranks.append((not topped_out, depth, value))
+            self.timeouts += timeouts
+        best = max(range(len(nodes)), key=ranks.__getitem__)
+        return nodes[best][3]
+
+    def close(self) -> None:
+        """Shut down the worker processes, if any."""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def stats(self) -> Dict[str, Any]:
+        """Get the search statistics.
+
+        Returns:
+            A dictionary with evaluation, timeout and cache counters.
+        """
+        return {
+            "evaluations": self.evaluations,
+            "timeouts": self.timeouts,
+            "expansions": self.expansions.stats() if self.expansions is not None else None,
+            "placements": self.expander.stats(),
+        }
+
+
+def _search_subtree(node: Node, preview: List[str], weights: Dict[str, float],
+                    beam_width: int,
+                    time_budget: Optional[float]) -> Tuple[float, int, bool, int]:
+    """Beam search below one root child in a worker process.
+
+    Returns:
+        The value of the best state found below the node, the depth it was
+        found at, whether every state of the subtree tops out, and the number
+        of searches that ran out of time.
+    """
+    planner = BeamPlanner(HeuristicWeights.from_dict(weights), depth=len(preview),
+                          beam_width=beam_width)
+    deadline = None if time_budget is None else time.perf_counter() + time_budget
+    best, depth, topped_out = planner._beam([node], preview, deadline)
+    return best[0], depth, topped_out, planner.timeouts
@@ -1,41 +1,257 @@
 """Screen recorder for Tetris gameplay."""
 
 import os
+import queue
+import sys
+import threading
 import time
 import cv2
 import numpy as np
 import pygame
 from datetime import datetime
+from multiprocessing import Pool
+from tetris.constants import FPS, SCREEN_WIDTH, SCREEN_HEIGHT
+
+# What capture_frame does when the encoder queue is full
+BACKPRESSURE_POLICIES = ("block", "drop_oldest", "drop_newest")
+
+# Pixel formats that can be read straight from surface memory, keyed on
+# (bytes per pixel, RGB masks): the cv2 conversion to BGR, or None for a copy
+if sys.byteorder == "little":
+    VIEW_CONVERSIONS = {
+        (4, (0xFF0000, 0xFF00, 0xFF)): cv2.COLOR_BGRA2BGR,
+        (4, (0xFF, 0xFF00, 0xFF0000)): cv2.COLOR_RGBA2BGR,
+        (3, (0xFF0000, 0xFF00, 0xFF)): None,
+    }
+else:
+    VIEW_CONVERSIONS = {}
+
+
+def surface_to_bgr(surface, out):
+    """Convert a surface to a BGR video frame in a single copy.
+
+    Common pixel formats are read through a view of the surface memory and
+    converted by one cv2 call; others go through a pixels3d view.
+
+    Args:
+        surface: Pygame surface to read
+        out: Preallocated (height, width, 3) uint8 array to write to
+
+    Returns:
+        out
+    """
+    width, height = surface.get_size()
+    bytesize = surface.get_bytesize()
+    key = (bytesize, tuple(surface.get_masks()[:3]))
+    if key in VIEW_CONVERSIONS:
+        pixels = np.ndarray((height, width, bytesize), np.uint8, surface.get_buffer(),
+                            strides=(surface.get_pitch(), bytesize, 1))
+        code = VIEW_CONVERSIONS[key]
+        if code is None:
+            np.copyto(out, pixels)
+        else:
+            cv2.cvtColor(pixels, code, dst=out)
+        return out
+
+    try:
+        pixels = pygame.surfarray.pixels3d(surface)
+    except ValueError:
+        pixels = pygame.surfarray.array3d(surface)  # Palette and 16-bit surfaces
+    np.copyto(out, pixels.transpose(1, 0, 2)[:, :, ::-1])
+    return out
+
+
+def array3d_to_bgr(surface):
+    """Convert a surface to a BGR video frame through three full copies.
+
+    This is the reference the view-based conversion is measured against.
+
+    Args:
+        surface: Pygame surface to read
+
+    Returns:
+        A new (height, width, 3) uint8 array
+    """
+    frame = pygame.surfarray.array3d(surface)
+    frame = np.transpose(frame, (1, 0, 2))
+    return cv2.cvtColor(frame, cv2.COLOR_RGB2BGR)
+
+
+def benchmark_capture(frame_size=(SCREEN_WIDTH, SCREEN_HEIGHT), frames=100):
+    """Compare the view-based frame conversion with the array3d one.
+
+    Args:
+        frame_size: (width, height) of the captured surface
+        frames: Number of frames to convert with each method
+
+    Returns:
+        A dictionary with milliseconds per frame of both methods and the
+        speedup of the view-based one.
+    """
+    pygame.init()
+    surface = pygame.Surface(frame_size)
+    surface.fill((40, 80, 120))
+    out = np.empty((frame_size[1], frame_size[0], 3), np.uint8)
+
+    start = time.perf_counter()
+    for _ in range(frames):
+        array3d_to_bgr(surface)
+    array3d_ms = (time.perf_counter() - start) * 1000 / frames
+
+    start = time.perf_counter()
+    for _ in range(frames):
+        surface_to_bgr(surface, out)
+    view_ms = (time.perf_counter() - start) * 1000 / frames
+
+    return {
+        "frames": frames,
+        "array3d_ms": array3d_ms,
+        "view_ms": view_ms,
+        "speedup": array3d_ms / view_ms if view_ms else float("inf"),
+    }
+
 
 class GameRecorder:
-    """Records Tetris gameplay and saves it as a video file."""
+    """Records Tetris gameplay and streams it to a video file.
+
+    Captured frames are converted to BGR into a pool of preallocated buffers
+    and handed to a bounded queue, from which a dedicated encoder thread
+    writes them and returns the buffers to the pool. The game loop only pays
+    for one copy of the pixels. When the encoder falls behind, the
+    backpressure policy decides whether capture waits for room, drops the
+    oldest queued frame or drops the new frame.
+    """
     
-    def __init__(self, fps=30, output_dir="recordings"):
+    def __init__(self, fps=30, output_dir="recordings", max_duration=None, codec="mp4v",
+                 queue_size=8, policy="block"):
         """Initialize the recorder.
         
         Args:
             fps: Frames per second for the output video
             output_dir: Directory to save recordings
+            max_duration: Optional recording limit in seconds; None records
+                until stop_recording is called
+            codec: FourCC code of the video codec
+            queue_size: Maximum number of frames waiting for the encoder
+            policy: Backpressure policy, one of BACKPRESSURE_POLICIES
         """
+        if policy not in BACKPRESSURE_POLICIES:
+            raise ValueError(f"unknown backpressure policy: {policy}")
+
         self.fps = fps
         self.output_dir = output_dir
+        self.max_duration = max_duration
+        self.codec = codec
+        self.queue_size = queue_size
+        self.policy = policy
         self.recording = False
-        self.frames = []
         self.start_time = None
-        self.max_duration = 30  # Maximum recording duration in seconds
+        self.writer = None
+        self.filename = None
+        self.frame_size = None
+        self.frames_captured = 0
+        self.frames_written = 0
+        self.frames_dropped = 0
+        self.max_queued = 0
+        self.queue = None
+        self.free_buffers = None
+        self.encoder = None
+        self.encoder_error = None
         
         # Create output directory if it doesn't exist
         os.makedirs(output_dir, exist_ok=True)
     
-    def start_recording(self):
-        """Start recording gameplay."""
+    def start_recording(self, frame_size=None, filename=None):
+        """Start recording gameplay.
+
+        The video file is opened and the encoder thread started right away.
+        Frames are written as they are captured, so memory use is bounded by
+        the queue size, not the length of the recording.
+
+        Args:
+            frame_size: (width, height) of the video. Defaults to the size of
+                the display surface.
+            filename: Path of the video. Defaults to a timestamped file in
+                the output directory.
+        """
+        if frame_size is None:
+            surface = pygame.display.get_surface()
+            frame_size = surface.get_size() if surface else (SCREEN_WIDTH, SCREEN_HEIGHT)
+
+        if filename is None:
+            # Generate filename with timestamp
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            filename = os.path.join(self.output_dir, f"tetris_gameplay_{timestamp}.mp4")
+        self.filename = filename
+
+        fourcc = cv2.VideoWriter_fourcc(*self.codec)
+        self.writer = cv2.VideoWriter(self.filename, fourcc, self.fps, frame_size)
+        if not self.writer.isOpened():
+            self.writer = None
+            raise RuntimeError(f"Could not open video writer for {self.filename}")
+
+        self.frame_size = frame_size
+        self.frames_captured = 0
+        self.frames_written = 0
+        self.frames_dropped = 0
+        self.max_queued = 0
+        self.encoder_error = None
+        self.queue = queue.Queue(self.queue_size)
+        # Enough buffers for a full queue, the frame being encoded and the
+        # frame being captured
+        self.free_buffers = queue.Queue()
+        for _ in range(self.queue_size + 2):
+            self.free_buffers.put(np.empty((frame_size[1], frame_size[0], 3), np.uint8))
+        self.encoder = threading.Thread(target=self._encode_frames, name="recorder-encoder",
+                                        daemon=True)
+        self.encoder.start()
         self.recording = True
-        self.frames = []
         self.start_time = time.time()
         print("Recording started...")
+
+    def _encode_frames(self):
+        """Write queued frames until the end-of-recording marker."""
+        while True:
+            frame = self.queue.get()
+            if frame is None:
+                return
+
+            if self.encoder_error is None:  # Otherwise just drain the queue
+                try:
+                    self.writer.write(frame)
+                    self.frames_written += 1
+                except Exception as error:
+                    self.encoder_error = error
+            self.free_buffers.put(frame)
+
+    def _enqueue(self, frame):
+        """Hand a frame to the encoder, applying the backpressure policy."""
+        if self.policy == "block":
+            self.queue.put(frame)
+        elif self.policy == "drop_newest":
+            try:
+                self.queue.put_nowait(frame)
+            except queue.Full:
+                self.free_buffers.put(frame)
+                self.frames_dropped += 1
+        else:
+            while True:
+                try:
+                    self.queue.put_nowait(frame)
+                    break
+                except queue.Full:
+                    try:
+                        self.free_buffers.put(self.queue.get_nowait())
+                        self.frames_dropped += 1
+                    except queue.Empty:
+                        pass
+        self.max_queued = max(self.max_queued, self.queue.qsize())
     
     def capture_frame(self, surface):
         """Capture the current frame from the pygame surface.
+
+        The surface is converted straight into a pooled BGR buffer, which
+        is the only copy made; encoding runs on the encoder thread.
         
         Args:
             surface: Pygame surface to capture
@@ -44,85 +260,213 @@ class GameRecorder:
             return
             
         # Check if we've exceeded the maximum duration
-        if time.time() - self.start_time > self.max_duration:
+        if self.max_duration is not None and time.time() - self.start_time > self.max_duration:
             self.stop_recording()
             return
             
-        # Convert pygame surface to numpy array
-        frame = pygame.surfarray.array3d(surface)
-        # Transpose to get the correct format for OpenCV
-        frame = np.transpose(frame, (1, 0, 2))
-        # Convert from RGB to BGR (OpenCV format)
-        frame = cv2.cvtColor(frame, cv2.COLOR_RGB2BGR)
-        
-        self.frames.append(frame)
+        self.frames_captured += 1
+        if self.policy == "drop_newest" and self.queue.full():
+            self.frames_dropped += 1  # Don't convert a frame that is dropped
+            return
+
+        # Copy the pixels; the surface is drawn over by the next frame
+        buffer = self.free_buffers.get()
+        if surface.get_size() == self.frame_size:
+            surface_to_bgr(surface, buffer)
+        else:
+            width, height = surface.get_size()
+            frame = surface_to_bgr(surface, np.empty((height, width, 3), np.uint8))
+            cv2.resize(frame, self.frame_size, dst=buffer)
+        self._enqueue(buffer)
+
+    def summary(self):
+        """Get the frame counters of the current or last recording.
+
+        Returns:
+            A dictionary of captured, written, dropped and queued frame
+            counts, the peak queue depth and the backpressure policy.
+        """
+        return {
+            "frames_captured": self.frames_captured,
+            "frames_written": self.frames_written,
+            "frames_dropped": self.frames_dropped,
+            "frames_queued": self.queue.qsize() if self.queue is not None else 0,
+            "max_queued": self.max_queued,
+            "policy": self.policy,
+        }
     
     def stop_recording(self):
-        """Stop recording and save the video."""
-        if not self.recording or not self.frames:
-            return
+        """Stop recording, wait for queued frames and close the video file.
+
+        Returns:
+            The path of the saved video, or None if no frame was recorded.
+        """
+        if not self.recording:
+            return None
             
         self.recording = False
+        self.queue.put(None)
+        self.encoder.join()
+        self.encoder = None
+        self.writer.release()
+        self.writer = None
+        if self.encoder_error is not None:
+            raise RuntimeError("Encoding the recording failed") from self.encoder_error
+
+        if not self.frames_written:
+            if os.path.exists(self.filename):
+                os.remove(self.filename)
+            return None
         
-        # Generate filename with timestamp
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = os.path.join(self.output_dir, f"tetris_gameplay_{timestamp}.mp4")
-        
-        # Get dimensions from the first frame
-        height, width = self.frames[0].shape[:2]
-        
-        # Initialize video writer
-        fourcc = cv2.VideoWriter_fourcc(*'mp4v')
-        out = cv2.VideoWriter(filename, fourcc, self.fps, (width, height))
-        
-        # Write frames to video
-        for frame in self.frames:
-            out.write(frame)
-        
-        # Release resources
-        out.release()
-        
-        print(f"Recording saved to {filename}")
-        self.frames = []
+        summary = self.summary()
+        print(f"Recording saved to {self.filename} "
+              f"({summary['frames_written']} frames written, "
+              f"{summary['frames_dropped']} dropped, "
+              f"peak queue {summary['max_queued']})")
+        return self.filename
 
-def create_demo_recording(game_instance, duration=20):
+def create_demo_recording(game_instance, duration=20, offline=False, recorder=None):
     """Create a demo recording of gameplay.
+
+    Frames are captured on a game-time schedule at the recorder's frame
+    rate, so the video plays at the speed the game was played. In real-time
+    mode the game runs at FPS and is shown on screen, and a frame is
+    repeated if the loop falls behind. In offline mode the game advances in
+    fixed 1/FPS steps as fast as possible and is only rendered when a frame
+    is due.
     
+    The game is played from the state it is in, so pass a new game. If it
+    records a replay, the replay is closed when the demo ends.
+
     Args:
         game_instance: Instance of TetrisGame
-        duration: Duration of recording in seconds
+        duration: Duration of recording in seconds of game time
+        offline: Run faster than real time
+        recorder: GameRecorder to use; a default one is created if None
+
+    Returns:
+        The recorder, stopped
     """
-    # Initialize the game
-    game_instance.reset_game()
-    recorder = GameRecorder()
+    # Measure game time from the start of the recording
+    game_instance.last_update_time = time.monotonic()
+    if recorder is None:
+        recorder = GameRecorder()
     recorder.start_recording()
-    
-    # Store the original _render method
-    original_render = game_instance._render
-    
-    # Override the render method to capture frames
-    def wrapped_render():
-        original_render()
-        recorder.capture_frame(pygame.display.get_surface())
-    
-    # Replace the render method
-    game_instance._render = wrapped_render
-    
-    # Set a timer to stop recording
-    start_time = time.time()
+
+    frame_interval = 1.0 / recorder.fps
+    step = 1.0 / FPS if offline else None
+    game_time = 0.0
+    next_capture = 0.0
+    clock = pygame.time.Clock()
     
     # Run the game with recording
     running = True
-    while time.time() - start_time < duration and running:
+    while game_time < duration and running:
         # Handle events and check if we should exit
         running = game_instance._handle_events()
-        game_instance._update_game()
-        game_instance._render()
+        game_time += game_instance._update_game(step)
+
+        # Count the video frames that fall into the elapsed game time
+        frames_due = 0
+        while next_capture <= game_time:
+            frames_due += 1
+            next_capture += frame_interval
+
+        if not offline:
+            game_instance._render()
+            clock.tick(FPS)
+        elif frames_due:
+            game_instance._render()
+
+        surface = pygame.display.get_surface()
+        for _ in range(frames_due):
+            recorder.capture_frame(surface)
         
     # Stop recording
+    game_instance.close_replay()
     recorder.stop_recording()
     
-    # Restore original render method
-    game_instance._render = original_render
-    
     return recorder
+
+
+def render_replay(path, output_dir=None, fps=30):
+    """Re-simulate a replay off-screen and encode it to a video file.
+
+    The game is drawn by an off-screen Renderer, and only on the ticks where
+    a video frame is due, so the video is made faster than real time.
+
+    Args:
+        path: Path of the replay file
+        output_dir: Directory of the video; the replay's directory if None
+        fps: Frames per second of the video
+
+    Returns:
+        The path of the video, or None if the replay has no frames
+    """
+    from tetris.game import TetrisGame
+    from tetris.renderer import Renderer
+    from tetris.replay import ReplayPlayer, load_replay
+
+    replay = load_replay(path)
+    renderer = Renderer(offscreen=True)
+    game = TetrisGame(replay.create_engine(), renderer=renderer)
+    player = ReplayPlayer(replay, game.engine)
+
+    if output_dir is None:
+        output_dir = os.path.dirname(path) or "."
+    name = os.path.splitext(os.path.basename(path))[0]
+    recorder = GameRecorder(fps=fps, output_dir=output_dir)
+    recorder.start_recording(renderer.screen.get_size(), os.path.join(output_dir, f"{name}.mp4"))
+
+    frames = 0
+    while True:
+        # Video frames up to the current tick, counted in whole numbers so
+        # rounding never loses one
+        frames_due = player.tick * fps // replay.tick_rate + 1 - frames
+        frames += frames_due
+        if frames_due:
+            game._render()
+            for _ in range(frames_due):
+                recorder.capture_frame(renderer.screen)
+
+        if player.finished:
+            break
+        player.advance()
+
+    renderer.close()
+    return recorder.stop_recording()
+
+
+def _render_task(task):
+    """Unpack a task tuple for Pool.imap_unordered."""
+    path, output_dir, fps = task
+    return path, render_replay(path, output_dir, fps)
+
+
+def render_replays(directory, workers=1, output_dir=None, fps=30):
+    """Encode every replay in a directory to video across a process pool.
+
+    Args:
+        directory: Directory of the .replay files
+        workers: Number of worker processes. Videos are made in-process if
+            1 or less.
+        output_dir: Directory of the videos; the replay directory if None
+        fps: Frames per second of the videos
+
+    Yields:
+        (replay path, video path) of each replay in completion order
+    """
+    paths = sorted(
+        os.path.join(directory, name) for name in os.listdir(directory)
+        if name.endswith(".replay")
+    )
+    tasks = [(path, output_dir, fps) for path in paths]
+
+    if workers <= 1:
+        for task in tasks:
+            yield _render_task(task)
+        return
+
+    with Pool(min(workers, len(tasks)) or 1) as pool:
+        for result in pool.imap_unordered(_render_task, tasks):
+            yield result
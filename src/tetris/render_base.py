@@ -0,0 +1,131 @@
+"""Interface shared by the rendering backends."""
+
+from abc import ABC, abstractmethod
+from enum import IntEnum
+from typing import Any, Dict, List, Optional, Tuple
+from tetris.board import Board
+from tetris.pieces import Tetromino
+
+# What a non-empty board cell shows: (shape type, is ghost)
+Cell = Tuple[str, bool]
+
+# The state of any board cell, None when empty
+CellState = Optional[Cell]
+
+
+class Command(IntEnum):
+    """Player input, independent of the backend that read it."""
+
+    QUIT = 0
+    RESTART = 1
+    PAUSE = 2
+    LEFT = 3
+    RIGHT = 4
+    DOWN = 5
+    ROTATE = 6
+    DROP = 7
+    # The backend lost its screen contents and needs a new frame
+    REDRAW = 8
+
+
+def board_cells(board: Board) -> Dict[Tuple[int, int], Cell]:
+    """Get the state of every non-empty cell, including the falling piece.
+
+    Args:
+        board: The board to draw.
+
+    Returns:
+        A mapping of (x, y) to the cell state of every non-empty cell.
+    """
+    cells: Dict[Tuple[int, int], Cell] = {}
+    for y in range(board.height):
+        for x, shape_type in enumerate(board.grid[y]):
+            if shape_type is not None:
+                cells[(x, y)] = (shape_type, False)
+
+    piece = board.current_piece
+    if piece:
+        # The ghost marks where the current piece would land
+        if board.is_valid_position(piece):
+            drop = board.landing_y(piece) - piece.y
+            if drop > 0:
+                for x, y in piece.get_positions():
+                    if 0 <= y + drop < board.height and 0 <= x < board.width:
+                        cells[(x, y + drop)] = (piece.shape_type, True)
+
+        for x, y in piece.get_positions():
+            if 0 <= y < board.height and 0 <= x < board.width:
+                cells[(x, y)] = (piece.shape_type, False)
+    return cells
+
+
+class BaseRenderer(ABC):
+    """Draws frames of the game and reads player input.
+
+    A frame is drawn by ``clear_screen``, the ``draw_*`` methods and
+    ``update_display``, in that order.
+    """
+
+    @abstractmethod
+    def clear_screen(self) -> None:
+        """Start a new frame."""
+
+    @abstractmethod
+    def draw_board(self, board: Board) -> None:
+        """Draw the game board.
+
+        Args:
+            board: The game board to draw.
+        """
+
+    @abstractmethod
+    def draw_next_piece(self, piece: Optional[Tetromino]) -> None:
+        """Draw the next piece preview.
+
+        Args:
+            piece: The next piece to draw.
+        """
+
+    @abstractmethod
+    def draw_score(self, score: int, level: int, lines: int) -> None:
+        """Draw the score, level, and lines information.
+
+        Args:
+            score: Current score.
+            level: Current level.
+            lines: Number of lines cleared.
+        """
+
+    @abstractmethod
+    def draw_controls(self) -> None:
+        """Draw the controls information."""
+
+    @abstractmethod
+    def draw_game_over(self) -> None:
+        """Draw the game over screen."""
+
+    @abstractmethod
+    def draw_pause(self) -> None:
+        """Draw the pause screen."""
+
+    @abstractmethod
+    def update_display(self) -> None:
+        """Show the finished frame."""
+
+    @abstractmethod
+    def poll_input(self) -> List[Command]:
+        """Read the input received since the last call.
+
+        Returns:
+            The commands in the order they were received.
+        """
+
+    def invalidate(self) -> None:
+        """Force the next frame to be drawn in full."""
+
+    def close(self) -> None:
+        """Release the display."""
+
+    def stats(self) -> Dict[str, Any]:
+        """Get backend-specific rendering statistics."""
+        return {}
@@ -1,32 +1,150 @@
 """Renderer for the Tetris game."""
 
 import pygame
-from typing import Tuple, Optional
+from typing import Any, Dict, List, Tuple, Optional
 from tetris.board import Board
 from tetris.pieces import Tetromino
+from tetris.render_base import BaseRenderer, Cell, CellState, Command, board_cells
+from tetris.text_cache import DigitAtlas, TextCache
 from tetris.constants import (
     BLOCK_SIZE, GRID_WIDTH, GRID_HEIGHT, SCREEN_WIDTH, SCREEN_HEIGHT,
-    BLACK, WHITE, GRAY, COLORS
+    BLACK, WHITE, GRAY, COLORS, KEY_REPEAT_DELAY, KEY_REPEAT_INTERVAL
 )
 
+Color = Tuple[int, int, int]
 
-class Renderer:
-    """Handles rendering of the Tetris game."""
+# Title and hint of each full-screen overlay
+OVERLAYS = {
+    "game_over": ("GAME OVER", "Press R to restart or ESC to quit"),
+    "pause": ("PAUSED", "Press P to continue"),
+}
 
-    def __init__(self, screen_width: int = SCREEN_WIDTH, screen_height: int = SCREEN_HEIGHT):
+# Keys and the commands they send
+KEY_COMMANDS = {
+    pygame.K_ESCAPE: Command.QUIT,
+    pygame.K_r: Command.RESTART,
+    pygame.K_p: Command.PAUSE,
+    pygame.K_LEFT: Command.LEFT,
+    pygame.K_RIGHT: Command.RIGHT,
+    pygame.K_DOWN: Command.DOWN,
+    pygame.K_UP: Command.ROTATE,
+    pygame.K_SPACE: Command.DROP,
+}
+
+# Lines of the controls panel
+CONTROLS = (
+    "Controls:",
+    "Left/Right : Move",
+    "Up : Rotate",
+    "Down : Soft Drop",
+    "Space : Hard Drop",
+    "P : Pause",
+    "R : Restart",
+    "Esc : Quit",
+)
+
+
+def to_display_format(surface: pygame.Surface) -> pygame.Surface:
+    """Convert a surface to the display's pixel format for fast blits.
+
+    Args:
+        surface: The surface to convert.
+
+    Returns:
+        The converted surface, or the surface itself if no display is open.
+    """
+    if pygame.display.get_surface() is None:
+        return surface
+    return surface.convert()
+
+
+def build_block_sprite(color: Color, size: int = BLOCK_SIZE,
+                       ghost: bool = False) -> pygame.Surface:
+    """Pre-render a block so it can be drawn with a single blit.
+
+    Args:
+        color: RGB color of the block.
+        size: Width and height of the block in pixels.
+        ghost: Render the landing outline instead of a solid block. Its
+            black pixels are transparent.
+
+    Returns:
+        The block sprite in the display's pixel format.
+    """
+    sprite = to_display_format(pygame.Surface((size, size)))
+    if ghost:
+        sprite.fill(BLACK)
+        pygame.draw.rect(sprite, color, (2, 2, size - 4, size - 4), 2)
+        sprite.set_colorkey(BLACK)
+    else:
+        sprite.fill(color)
+        pygame.draw.rect(sprite, WHITE, (0, 0, size, size), 1)
+    return sprite
+
+
+class Renderer(BaseRenderer):
+    """Handles rendering of the Tetris game.
+
+    The screen fill, board grid, empty preview box and controls panel are
+    composed once into a background surface, so a frame starts with a single
+    blit and areas are cleared by copying them back from the background. The
+    background is only rebuilt by ``resize`` or ``invalidate_background``.
+
+    In dirty-rectangle mode the renderer remembers what it drew last frame and
+    only redraws the board cells, preview and HUD fields that changed, pushing
+    just those areas with ``pygame.display.update``. A pause or game over
+    overlay covers the whole screen, so frames showing one are pushed in full
+    and the frame after one is redrawn from scratch.
+
+    An off-screen renderer draws the same frames to a plain surface without
+    opening a window, e.g. to encode videos in worker processes.
+    """
+
+    def __init__(self, screen_width: int = SCREEN_WIDTH, screen_height: int = SCREEN_HEIGHT,
+                 dirty_rects: bool = False, offscreen: bool = False):
         """Initialize the renderer.
 
         Args:
             screen_width: Width of the screen in pixels.
             screen_height: Height of the screen in pixels.
+            dirty_rects: Redraw and update only the areas that changed.
+            offscreen: Draw to a surface in memory instead of a window.
+                Frames are read from ``screen``, and there is no input.
         """
-        pygame.init()
-        self.screen = pygame.display.set_mode((screen_width, screen_height))
-        pygame.display.set_caption("Tetris")
+        self.offscreen = offscreen
+        if offscreen:
+            pygame.font.init()
+            self.screen = pygame.Surface((screen_width, screen_height))
+        else:
+            pygame.init()
+            self.screen = pygame.display.set_mode((screen_width, screen_height))
+            pygame.display.set_caption("Tetris")
+
+            # Set up key repeat for smoother controls
+            pygame.key.set_repeat(KEY_REPEAT_DELAY, KEY_REPEAT_INTERVAL)
         
         self.font = pygame.font.Font(None, 36)
         self.small_font = pygame.font.Font(None, 24)
-        
+
+        # Rendered strings, and glyphs for the numeric HUD values
+        self.text_cache = TextCache()
+        self.hud_digits = DigitAtlas(self.font, WHITE)
+
+        # One solid and one ghost sprite per block color and size
+        self.sprites: Dict[Tuple[Color, int, bool], pygame.Surface] = {}
+        for color in COLORS.values():
+            self.get_block_sprite(color)
+            self.get_block_sprite(color, ghost=True)
+
+        self.dirty_rects = dirty_rects
+        self._layout(screen_width, screen_height)
+        self.invalidate_background()
+
+    def _layout(self, screen_width: int, screen_height: int) -> None:
+        """Position the board, preview, HUD and controls for a screen size."""
+        self.screen_width = screen_width
+        self.screen_height = screen_height
+
         # Calculate board position to center it
         self.board_width = GRID_WIDTH * BLOCK_SIZE
         self.board_height = GRID_HEIGHT * BLOCK_SIZE
@@ -38,105 +156,271 @@ class Renderer:
         self.preview_y = self.board_y + 100
         self.preview_size = 4 * BLOCK_SIZE
 
-    def draw_block(self, x: int, y: int, color: Tuple[int, int, int]) -> None:
-        """Draw a single block.
-
-        Args:
-            x: X coordinate in pixels.
-            y: Y coordinate in pixels.
-            color: RGB color tuple.
-        """
-        pygame.draw.rect(
-            self.screen,
-            color,
-            (x, y, BLOCK_SIZE, BLOCK_SIZE)
+        # Areas restored from the background as a whole. The board area
+        # includes its last grid lines, and the preview area includes the
+        # "Next" label and room for pieces overhanging the box.
+        self.board_rect = pygame.Rect(
+            self.board_x, self.board_y, self.board_width + 1, self.board_height + 1
         )
-        pygame.draw.rect(
-            self.screen,
-            WHITE,
-            (x, y, BLOCK_SIZE, BLOCK_SIZE),
-            1  # Border width
+        self.preview_rect = pygame.Rect(
+            self.preview_x, self.preview_y - 40,
+            self.preview_size + BLOCK_SIZE, self.preview_size + 40 + BLOCK_SIZE
+        )
+        self.score_rect = pygame.Rect(
+            self.preview_x, self.preview_y + self.preview_size + 50,
+            screen_width - self.preview_x, 150
+        )
+        self.controls_rect = pygame.Rect(
+            20, self.board_y, max(0, self.board_x - 20), len(CONTROLS) * 30
         )
 
-    def draw_board(self, board: Board) -> None:
-        """Draw the game board.
+    def _build_background(self) -> pygame.Surface:
+        """Compose everything that never changes during a game.
 
-        Args:
-            board: The game board to draw.
+        Returns:
+            A screen-sized surface with the board grid, the empty preview box
+            and the controls panel.
         """
-        # Draw board background
+        background = to_display_format(pygame.Surface((self.screen_width, self.screen_height)))
+        background.fill(BLACK)
+
+        # Board background and grid lines
         pygame.draw.rect(
-            self.screen,
+            background,
             BLACK,
             (self.board_x, self.board_y, self.board_width, self.board_height)
         )
-        
-        # Draw grid lines
         for x in range(GRID_WIDTH + 1):
             pygame.draw.line(
-                self.screen,
+                background,
                 GRAY,
                 (self.board_x + x * BLOCK_SIZE, self.board_y),
                 (self.board_x + x * BLOCK_SIZE, self.board_y + self.board_height),
                 1
             )
-        
         for y in range(GRID_HEIGHT + 1):
             pygame.draw.line(
-                self.screen,
+                background,
                 GRAY,
                 (self.board_x, self.board_y + y * BLOCK_SIZE),
                 (self.board_x + self.board_width, self.board_y + y * BLOCK_SIZE),
                 1
             )
-        
-        # Draw placed blocks
-        for y in range(board.height):
-            for x in range(board.width):
-                block_type = board.get_cell_type(x, y)
-                if block_type:
-                    self.draw_block(
-                        self.board_x + x * BLOCK_SIZE,
-                        self.board_y + y * BLOCK_SIZE,
-                        COLORS[block_type]
-                    )
-        
-        # Draw current piece
-        if board.current_piece:
-            for x, y in board.current_piece.get_positions():
-                if 0 <= y < board.height and 0 <= x < board.width:
-                    self.draw_block(
-                        self.board_x + x * BLOCK_SIZE,
-                        self.board_y + y * BLOCK_SIZE,
-                        COLORS[board.current_piece.shape_type]
-                    )
 
-    def draw_next_piece(self, piece: Optional[Tetromino]) -> None:
-        """Draw the next piece preview.
-
-        Args:
-            piece: The next piece to draw.
-        """
-        # Draw preview box
+        # Preview box and its "Next" label
         pygame.draw.rect(
-            self.screen,
+            background,
             BLACK,
             (self.preview_x, self.preview_y, self.preview_size, self.preview_size)
         )
         pygame.draw.rect(
-            self.screen,
+            background,
             WHITE,
             (self.preview_x, self.preview_y, self.preview_size, self.preview_size),
             2  # Border width
         )
-        
-        # Draw "Next" text
-        next_text = self.font.render("Next", True, WHITE)
-        self.screen.blit(
-            next_text,
-            (self.preview_x, self.preview_y - 40)
+        next_text = self.text_cache.render(self.font, "Next", WHITE)
+        background.blit(next_text, (self.preview_x, self.preview_y - 40))
+
+        # Controls panel on the left with proper margin
+        x_pos = self.controls_rect.x
+        y_pos = self.controls_rect.y
+        for text in CONTROLS:
+            control_text = self.text_cache.render(self.small_font, text, WHITE)
+            background.blit(control_text, (x_pos, y_pos))
+            y_pos += 30
+
+        return background
+
+    def invalidate_background(self) -> None:
+        """Rebuild the background layer, e.g. after a size or theme change."""
+        self.background = self._build_background()
+        # Overlays are built for the current screen size on first use
+        self.overlays: Dict[str, pygame.Surface] = {}
+        self.invalidate()
+
+    def _build_overlay(self, title: str, hint: str) -> pygame.Surface:
+        """Compose a semi-transparent full-screen overlay with its text.
+
+        Args:
+            title: Large centered text.
+            hint: Smaller text below the title.
+
+        Returns:
+            A screen-sized surface with per-pixel alpha.
+        """
+        overlay = pygame.Surface((self.screen_width, self.screen_height), pygame.SRCALPHA)
+        overlay.fill((0, 0, 0, 128))  # Black with alpha
+
+        title_text = self.text_cache.render(self.font, title, WHITE)
+        hint_text = self.text_cache.render(self.small_font, hint, WHITE)
+        overlay.blit(
+            title_text,
+            (self.screen_width // 2 - title_text.get_width() // 2, self.screen_height // 2 - 50)
         )
-        
+        overlay.blit(
+            hint_text,
+            (self.screen_width // 2 - hint_text.get_width() // 2, self.screen_height // 2 + 10)
+        )
+        return overlay
+
+    def get_overlay(self, name: str) -> pygame.Surface:
+        """Get a full-screen overlay, building it on first use.
+
+        Args:
+            name: A key of OVERLAYS.
+
+        Returns:
+            The overlay surface.
+        """
+        overlay = self.overlays.get(name)
+        if overlay is None:
+            overlay = self._build_overlay(*OVERLAYS[name])
+            self.overlays[name] = overlay
+        return overlay
+
+    def resize(self, screen_width: int, screen_height: int) -> None:
+        """Change the screen size and lay the screen out again.
+
+        Args:
+            screen_width: Width of the screen in pixels.
+            screen_height: Height of the screen in pixels.
+        """
+        if self.offscreen:
+            self.screen = pygame.Surface((screen_width, screen_height))
+        else:
+            self.screen = pygame.display.set_mode((screen_width, screen_height))
+        self._layout(screen_width, screen_height)
+        self.invalidate_background()
+
+    def invalidate(self) -> None:
+        """Force the next frame to be redrawn and updated in full."""
+        self._full_redraw = True
+        self._overlay_drawn = False
+        self._dirty: List[pygame.Rect] = []
+        self._cells: Dict[Tuple[int, int], Cell] = {}
+        self._preview_type: Optional[str] = None
+        self._score_values: Optional[Tuple[int, int, int]] = None
+
+    def get_block_sprite(self, color: Color, size: int = BLOCK_SIZE,
+                         ghost: bool = False) -> pygame.Surface:
+        """Get the sprite of a block, building it on first use.
+
+        Args:
+            color: RGB color of the block.
+            size: Width and height of the block in pixels.
+            ghost: Get the landing outline instead of a solid block.
+
+        Returns:
+            The block sprite.
+        """
+        key = (color, size, ghost)
+        sprite = self.sprites.get(key)
+        if sprite is None:
+            sprite = build_block_sprite(color, size, ghost)
+            self.sprites[key] = sprite
+        return sprite
+
+    def draw_block(self, x: int, y: int, color: Tuple[int, int, int]) -> None:
+        """Draw a single block.
+
+        Args:
+            x: X coordinate in pixels.
+            y: Y coordinate in pixels.
+            color: RGB color tuple.
+        """
+        self.screen.blit(self.get_block_sprite(color), (x, y))
+
+    def draw_ghost_block(self, x: int, y: int, color: Tuple[int, int, int]) -> None:
+        """Draw the outline of a block where the current piece will land.
+
+        Args:
+            x: X coordinate in pixels.
+            y: Y coordinate in pixels.
+            color: RGB color tuple.
+        """
+        self.screen.blit(self.get_block_sprite(color, ghost=True), (x, y))
+
+    def _draw_cell_state(self, x: int, y: int, state: CellState) -> None:
+        """Draw one board cell over its grid lines.
+
+        Args:
+            x: X coordinate in pixels.
+            y: Y coordinate in pixels.
+            state: What the cell shows.
+        """
+        if state is None:
+            return
+        shape_type, ghost = state
+        if ghost:
+            self.draw_ghost_block(x, y, COLORS[shape_type])
+        else:
+            self.draw_block(x, y, COLORS[shape_type])
+
+    def _redraw_cell(self, x: int, y: int, state: CellState) -> None:
+        """Repaint one board cell from the background and mark it dirty.
+
+        A cell owns its top and left grid lines; the right and bottom lines
+        belong to its neighbors or the board edge.
+        """
+        left = self.board_x + x * BLOCK_SIZE
+        top = self.board_y + y * BLOCK_SIZE
+        rect = pygame.Rect(left, top, BLOCK_SIZE, BLOCK_SIZE)
+        self.screen.blit(self.background, rect, rect)
+        self._draw_cell_state(left, top, state)
+        self._dirty.append(rect)
+
+    def draw_board(self, board: Board) -> None:
+        """Draw the game board.
+
+        Args:
+            board: The game board to draw.
+        """
+        cells = board_cells(board)
+
+        if self.dirty_rects and not self._full_redraw:
+            previous = self._cells
+            for position in previous.keys() | cells.keys():
+                state = cells.get(position)
+                if previous.get(position) != state:
+                    self._redraw_cell(position[0], position[1], state)
+            self._cells = cells
+            return
+        self._cells = cells
+
+        # Restore the empty board and its grid lines from the background
+        self.screen.blit(self.background, self.board_rect, self.board_rect)
+
+        # Draw placed blocks, the ghost piece and the current piece in one
+        # batched blit
+        sprite = self.get_block_sprite
+        self.screen.blits(
+            [
+                (
+                    sprite(COLORS[shape_type], ghost=ghost),
+                    (self.board_x + x * BLOCK_SIZE, self.board_y + y * BLOCK_SIZE)
+                )
+                for (x, y), (shape_type, ghost) in cells.items()
+            ],
+            doreturn=False
+        )
+
+    def draw_next_piece(self, piece: Optional[Tetromino]) -> None:
+        """Draw the next piece preview.
+
+        Args:
+            piece: The next piece to draw.
+        """
+        shape_type = piece.shape_type if piece else None
+        if self.dirty_rects and not self._full_redraw:
+            if shape_type == self._preview_type:
+                return
+            self._dirty.append(self.preview_rect)
+        self._preview_type = shape_type
+
+        # Restore the empty preview box and its label from the background
+        self.screen.blit(self.background, self.preview_rect, self.preview_rect)
+
         if piece:
             # Center the piece in the preview box
             center_x = self.preview_x + self.preview_size // 2
@@ -158,96 +442,101 @@ class Renderer:
             level: Current level.
             lines: Number of lines cleared.
         """
-        # Draw score
-        score_text = self.font.render(f"Score: {score}", True, WHITE)
-        self.screen.blit(
-            score_text,
-            (self.preview_x, self.preview_y + self.preview_size + 50)
-        )
-        
-        # Draw level
-        level_text = self.font.render(f"Level: {level}", True, WHITE)
-        self.screen.blit(
-            level_text,
-            (self.preview_x, self.preview_y + self.preview_size + 100)
-        )
-        
-        # Draw lines
-        lines_text = self.font.render(f"Lines: {lines}", True, WHITE)
-        self.screen.blit(
-            lines_text,
-            (self.preview_x, self.preview_y + self.preview_size + 150)
-        )
+        values = (score, level, lines)
+        if self.dirty_rects and not self._full_redraw:
+            if values == self._score_values:
+                return
+            self._dirty.append(self.score_rect)
+        self._score_values = values
+        self.screen.blit(self.background, self.score_rect, self.score_rect)
+
+        # Labels come from the text cache and values from the digit atlas,
+        # so a changed value never rasterizes text
+        y_pos = self.preview_y + self.preview_size + 50
+        for label, value in (("Score: ", score), ("Level: ", level), ("Lines: ", lines)):
+            label_text = self.text_cache.render(self.font, label, WHITE)
+            self.screen.blit(label_text, (self.preview_x, y_pos))
+            self.hud_digits.draw(
+                self.screen, value, (self.preview_x + label_text.get_width(), y_pos)
+            )
+            y_pos += 50
 
     def draw_game_over(self) -> None:
         """Draw the game over screen."""
-        # Semi-transparent overlay
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 128))  # Black with alpha
-        self.screen.blit(overlay, (0, 0))
-        
-        # Game over text
-        game_over_text = self.font.render("GAME OVER", True, WHITE)
-        restart_text = self.small_font.render("Press R to restart or ESC to quit", True, WHITE)
-        
-        self.screen.blit(
-            game_over_text,
-            (SCREEN_WIDTH // 2 - game_over_text.get_width() // 2, SCREEN_HEIGHT // 2 - 50)
-        )
-        self.screen.blit(
-            restart_text,
-            (SCREEN_WIDTH // 2 - restart_text.get_width() // 2, SCREEN_HEIGHT // 2 + 10)
-        )
+        self._overlay_drawn = True
+        self.screen.blit(self.get_overlay("game_over"), (0, 0))
 
     def draw_pause(self) -> None:
         """Draw the pause screen."""
-        # Semi-transparent overlay
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 128))  # Black with alpha
-        self.screen.blit(overlay, (0, 0))
-        
-        # Pause text
-        pause_text = self.font.render("PAUSED", True, WHITE)
-        continue_text = self.small_font.render("Press P to continue", True, WHITE)
-        
-        self.screen.blit(
-            pause_text,
-            (SCREEN_WIDTH // 2 - pause_text.get_width() // 2, SCREEN_HEIGHT // 2 - 50)
-        )
-        self.screen.blit(
-            continue_text,
-            (SCREEN_WIDTH // 2 - continue_text.get_width() // 2, SCREEN_HEIGHT // 2 + 10)
-        )
+        self._overlay_drawn = True
+        self.screen.blit(self.get_overlay("pause"), (0, 0))
 
     def draw_controls(self) -> None:
         """Draw the controls information."""
-        controls = [
-            "Controls:",
-            "Left/Right : Move",
-            "Up : Rotate",
-            "Down : Soft Drop",
-            "Space : Hard Drop",
-            "P : Pause",
-            "R : Restart",
-            "Esc : Quit"
-        ]
-        
-        # Position controls on the left with proper margin
-        x_pos = 20  # Fixed margin from left edge
-        y_pos = self.board_y
-        
-        for text in controls:
-            control_text = self.small_font.render(text, True, WHITE)
-            self.screen.blit(
-                control_text,
-                (x_pos, y_pos)
-            )
-            y_pos += 30
+        if self.dirty_rects and not self._full_redraw:
+            return
+
+        # The controls are part of the background layer
+        self.screen.blit(self.background, self.controls_rect, self.controls_rect)
+
+    def poll_input(self) -> List[Command]:
+        """Read the pygame events received since the last call.
+
+        Returns:
+            The commands in the order they were received.
+        """
+        commands: List[Command] = []
+        if self.offscreen:
+            return commands
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                commands.append(Command.QUIT)
+            elif event.type == pygame.WINDOWEXPOSED:
+                # Exposed areas are not covered by the next dirty rects
+                self.invalidate()
+                commands.append(Command.REDRAW)
+            elif event.type == pygame.KEYDOWN:
+                command = KEY_COMMANDS.get(event.key)
+                if command is not None:
+                    commands.append(command)
+        return commands
+
+    def close(self) -> None:
+        """Shut down pygame, unless drawing off-screen."""
+        if not self.offscreen:
+            pygame.quit()
+
+    def stats(self) -> Dict[str, Any]:
+        """Get the rendering cache statistics.
+
+        Returns:
+            A dictionary with the text cache counters, the number of values
+            drawn from the digit atlas and the number of block sprites.
+        """
+        return {
+            "text_cache": self.text_cache.stats(),
+            "digits_drawn": self.hud_digits.numbers_drawn,
+            "sprites": len(self.sprites),
+        }
 
     def clear_screen(self) -> None:
-        """Clear the screen."""
-        self.screen.fill(BLACK)
+        """Clear the screen to the background layer."""
+        if self.dirty_rects and not self._full_redraw:
+            return
+        self.screen.blit(self.background, (0, 0))
 
     def update_display(self) -> None:
         """Update the display."""
-        pygame.display.flip()
+        if self.offscreen:
+            pass  # The frame is complete in the screen surface
+        elif self.dirty_rects and not (self._full_redraw or self._overlay_drawn):
+            if self._dirty:
+                pygame.display.update(self._dirty)
+        else:
+            pygame.display.flip()
+
+        # An overlay darkens the whole screen, so the frame after it is
+        # redrawn from scratch.
+        self._full_redraw = not self.dirty_rects or self._overlay_drawn
+        self._overlay_drawn = False
+        self._dirty = []
@@ -0,0 +1,443 @@
+"""Input-log replays of Tetris games.
+
+A game is fully determined by its piece sequence and the timed actions
+played in it, so a replay stores only those: a header with the generator,
+its seed and the rules version, the (tick, action) events and a summary of
+the final state. The file is JSON lines::
+
+    {"format": "tetris-replay", "version": 2, "rules": 1, "tick_rate": 60, ...}
+    [0, 4]
+    [37, 5]
+    {"keyframe": 600, "state": {"grid": [...], "score": 100, ...}}
+    [612, 1]
+    {"end": 4210, "score": 1200, "lines": 12, "level": 2, "pieces": 118, ...}
+    {"index": [[600, 1187], [1200, 2398], ...]}
+
+Time is counted in ticks of ``1 / tick_rate`` seconds. Events of tick ``t``
+are applied before the gravity step of tick ``t``.
+
+Every ``keyframe_interval`` ticks the writer stores an engine snapshot taken
+at the start of the tick, and the last line indexes the byte offset of each
+keyframe. A reader can then start from the nearest keyframe instead of
+tick 0, and only parse the file from there on.
+"""
+
+import bisect
+import json
+import os
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, BinaryIO, Dict, List, NamedTuple, Optional, Tuple
+from tetris.bitboard import BitBoard
+from tetris.engine import Action, GameEngine
+from tetris.pieces import GENERATORS
+from tetris.render_base import BaseRenderer, Command
+from tetris.scheduler import FixedStepScheduler
+
+FORMAT = "tetris-replay"
+FORMAT_VERSION = 2
+# Version 1 files have no keyframes and no index
+READABLE_VERSIONS = (1, 2)
+
+# Bumped whenever a change to the game logic changes how a game plays out
+RULES_VERSION = 1
+
+# Ticks between keyframes, ten seconds at 60 ticks per second
+KEYFRAME_INTERVAL = 600
+
+Event = Tuple[int, Action]
+
+
+class Keyframe(NamedTuple):
+    """An engine snapshot at the start of a tick."""
+
+    tick: int
+    # Index in Replay.events of the first event of the tick
+    event: int
+    state: Dict[str, Any]
+
+
+@dataclass
+class Replay:
+    """A recorded game, or its part from a keyframe on."""
+
+    generator: str
+    seed: int
+    block_size: int
+    tick_rate: int
+    rules: int = RULES_VERSION
+    events: List[Event] = field(default_factory=list)
+    keyframes: List[Keyframe] = field(default_factory=list)
+    # Final state written when recording stopped, None if it never did
+    end: Optional[Dict[str, Any]] = None
+    # Tick of the first keyframe if the replay was loaded from there
+    start_tick: int = 0
+
+    @property
+    def ticks(self) -> int:
+        """Number of ticks the game lasted."""
+        if self.end is not None:
+            return self.end["end"]
+        last_event = self.events[-1][0] if self.events else 0
+        last_keyframe = self.keyframes[-1].tick if self.keyframes else 0
+        return max(last_event, last_keyframe)
+
+    def header(self) -> Dict[str, Any]:
+        """Get the header record of the replay file."""
+        return {
+            "format": FORMAT,
+            "version": FORMAT_VERSION,
+            "rules": self.rules,
+            "tick_rate": self.tick_rate,
+            "generator": self.generator,
+            "seed": self.seed,
+            "block_size": self.block_size,
+        }
+
+    def create_engine(self) -> GameEngine:
+        """Create an engine at the start of the recorded game.
+
+        Returns:
+            A new engine with the replay's piece generator.
+        """
+        generator = GENERATORS[self.generator](self.seed, self.block_size)
+        return GameEngine(BitBoard(), generator=generator)
+
+
+def end_record(engine: GameEngine, ticks: int) -> Dict[str, Any]:
+    """Describe the final state of a game.
+
+    Args:
+        engine: The engine of the game.
+        ticks: Number of ticks the game lasted.
+
+    Returns:
+        The end record of a replay file.
+    """
+    return {
+        "end": ticks,
+        "score": engine.score,
+        "lines": engine.lines_cleared,
+        "level": engine.level,
+        "pieces": engine.pieces_placed,
+        "game_over": engine.game_over,
+    }
+
+
+class ReplayWriter:
+    """Writes the events of a game to a replay file as they happen."""
+
+    def __init__(self, path: str, engine: GameEngine, tick_rate: int,
+                 keyframe_interval: int = KEYFRAME_INTERVAL):
+        """Open the file and write the header.
+
+        Args:
+            path: Path of the replay file.
+            engine: The engine of the game, just reset.
+            tick_rate: Ticks per second of game time.
+            keyframe_interval: Ticks between keyframes.
+        """
+        generator = engine.generator
+        self.path = path
+        self.replay = Replay(generator.kind, generator.seed, generator.block_size, tick_rate)
+        self.engine = engine
+        self.keyframe_interval = keyframe_interval
+        self.closed = False
+        # Byte offset of the next record, and of every keyframe
+        self.offset = 0
+        self.index: List[Tuple[int, int]] = []
+        self._file: BinaryIO = open(path, "wb")
+        self._write(self.replay.header())
+
+    @classmethod
+    def create(cls, directory: str, engine: GameEngine, tick_rate: int,
+               keyframe_interval: int = KEYFRAME_INTERVAL) -> "ReplayWriter":
+        """Start a replay file with a unique name in a directory.
+
+        Args:
+            directory: Directory of the replay; it is created if needed.
+            engine: The engine of the game, just reset.
+            tick_rate: Ticks per second of game time.
+            keyframe_interval: Ticks between keyframes.
+
+        Returns:
+            The writer.
+        """
+        os.makedirs(directory, exist_ok=True)
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        path = os.path.join(directory, f"tetris_{timestamp}.replay")
+        index = 1
+        while os.path.exists(path):
+            index += 1
+            path = os.path.join(directory, f"tetris_{timestamp}_{index}.replay")
+        return cls(path, engine, tick_rate, keyframe_interval)
+
+    def _write(self, record: Any) -> None:
+        """Write one record as a line of JSON."""
+        line = json.dumps(record, separators=(",", ":")).encode() + b"\n"
+        self._file.write(line)
+        self.offset += len(line)
+
+    def record(self, tick: int, action: Action) -> None:
+        """Record an action.
+
+        Args:
+            tick: Tick the action was played in.
+            action: The action.
+        """
+        self.replay.events.append((tick, action))
+        self._write([tick, int(action)])
+
+    def start_tick(self, tick: int) -> None:
+        """Store a keyframe if one is due, before any event of the tick.
+
+        Args:
+            tick: The tick that is starting.
+        """
+        if tick % self.keyframe_interval:
+            return
+        state = self.engine.snapshot()
+        self.replay.keyframes.append(Keyframe(tick, len(self.replay.events), state))
+        self.index.append((tick, self.offset))
+        self._write({"keyframe": tick, "state": state})
+
+    def close(self, ticks: int) -> None:
+        """Write the end record and the keyframe index, and close the file.
+
+        Args:
+            ticks: Number of ticks the game lasted.
+        """
+        if self.closed:
+            return
+        self.replay.end = end_record(self.engine, ticks)
+        self._write(self.replay.end)
+        self._write({"index": self.index})
+        self._file.close()
+        self.closed = True
+
+
+def _read_last_line(f: BinaryIO) -> bytes:
+    """Read the last line of a file without reading the rest."""
+    position = f.seek(0, os.SEEK_END)
+    data = b""
+    while position > 0:
+        size = min(4096, position)
+        position -= size
+        f.seek(position)
+        data = f.read(size) + data
+        newline = data.rfind(b"\n", 0, len(data) - 1)
+        if newline >= 0:
+            return data[newline + 1:]
+    return data
+
+
+def _read_index(f: BinaryIO) -> List[Tuple[int, int]]:
+    """Read the keyframe index of a replay file.
+
+    Returns:
+        (tick, byte offset) of every keyframe, or an empty list if the file
+        has no index.
+    """
+    try:
+        record = json.loads(_read_last_line(f))
+    except ValueError:
+        return []  # Cut off in the middle of a line
+    if not isinstance(record, dict) or "index" not in record:
+        return []
+    return [(tick, offset) for tick, offset in record["index"]]
+
+
+def _read_header(f: BinaryIO, path: str) -> Dict[str, Any]:
+    """Read and check the header of a replay file."""
+    header = json.loads(f.readline())
+    if header.get("format") != FORMAT or header.get("version") not in READABLE_VERSIONS:
+        raise ValueError(f"{path} is not a readable replay file")
+    if header["generator"] not in GENERATORS:
+        raise ValueError(f"unknown piece generator: {header['generator']}")
+    return header
+
+
+def read_header(path: str) -> Dict[str, Any]:
+    """Read the header of a replay file, without its events.
+
+    Args:
+        path: Path of the replay file.
+
+    Returns:
+        The header record.
+    """
+    with open(path, "rb") as f:
+        return _read_header(f, path)
+
+
+def load_replay(path: str, start_tick: Optional[int] = None) -> Replay:
+    """Read a replay file.
+
+    Args:
+        path: Path of the replay file.
+        start_tick: If given, only read the file from the last keyframe at
+            or before this tick, using the keyframe index.
+
+    Returns:
+        The replay. Its end record is None if the recording was cut off.
+    """
+    with open(path, "rb") as f:
+        header = _read_header(f, path)
+        replay = Replay(header["generator"], header["seed"], header["block_size"],
+                        header["tick_rate"], header["rules"])
+        offsets = []
+        if start_tick:
+            offsets = [offset for tick, offset in _read_index(f) if tick <= start_tick]
+            if offsets:
+                f.seek(offsets[-1])
+            else:
+                f.seek(0)
+                f.readline()
+
+        for line in f:
+            record = json.loads(line)
+            if isinstance(record, list):
+                replay.events.append((record[0], Action(record[1])))
+            elif "keyframe" in record:
+                replay.keyframes.append(
+                    Keyframe(record["keyframe"], len(replay.events), record["state"])
+                )
+            elif "end" in record:
+                replay.end = record
+
+    if offsets:
+        replay.start_tick = replay.keyframes[0].tick
+    return replay
+
+
+class ReplayPlayer:
+    """Re-simulates a replay one tick at a time."""
+
+    def __init__(self, replay: Replay, engine: Optional[GameEngine] = None):
+        """Set up an engine at the start of the replay.
+
+        Args:
+            replay: The replay to play.
+            engine: The engine to play on, as created by
+                ``Replay.create_engine``. A new one is created if None.
+        """
+        if replay.rules != RULES_VERSION:
+            raise ValueError(
+                f"replay uses rules version {replay.rules}, this game plays {RULES_VERSION}"
+            )
+        self.replay = replay
+        self.engine = engine if engine is not None else replay.create_engine()
+        self.tick = 0
+        self.done = False
+        self._next_event = 0
+        self._tick_seconds = 1.0 / replay.tick_rate
+        self._keyframe_ticks = [keyframe.tick for keyframe in replay.keyframes]
+        if replay.start_tick:
+            self._restore(0)
+
+    @property
+    def finished(self) -> bool:
+        """Whether every tick of the replay has been played."""
+        return self.done or self.engine.game_over
+
+    def _restore(self, index: int) -> None:
+        """Continue from a keyframe."""
+        keyframe = self.replay.keyframes[index]
+        self.engine.restore(keyframe.state)
+        self.tick = keyframe.tick
+        self.done = False
+        self._next_event = keyframe.event
+
+    def seek(self, tick: int) -> None:
+        """Move to the start of a tick, before its events are applied.
+
+        The nearest keyframe at or before the tick is restored if it is
+        ahead of the current position, or if the tick lies behind it, and
+        only the ticks after it are simulated.
+
+        Args:
+            tick: The tick to move to. Ticks past the end stop at the end.
+        """
+        if tick < self.replay.start_tick:
+            raise ValueError(f"tick {tick} is before the first loaded keyframe")
+
+        index = bisect.bisect_right(self._keyframe_ticks, tick) - 1
+        if index >= 0 and (tick < self.tick or self._keyframe_ticks[index] > self.tick):
+            self._restore(index)
+        elif tick < self.tick:
+            self.engine.reset()
+            self.tick = 0
+            self.done = False
+            self._next_event = 0
+
+        while self.tick < tick and not self.finished:
+            self.advance()
+
+    def advance(self) -> None:
+        """Apply the events of the current tick, then its gravity step.
+
+        The last tick of the replay only has events.
+        """
+        events = self.replay.events
+        while self._next_event < len(events) and events[self._next_event][0] <= self.tick:
+            self.engine.step(events[self._next_event][1])
+            self._next_event += 1
+        if self.tick < self.replay.ticks:
+            self.engine.tick(self._tick_seconds)
+            self.tick += 1
+        else:
+            self.done = True
+
+    def run(self) -> GameEngine:
+        """Play the rest of the replay.
+
+        Returns:
+            The engine in its final state.
+        """
+        while not self.finished:
+            self.advance()
+        return self.engine
+
+    def matches_end(self) -> bool:
+        """Check the simulated game against the recorded final state.
+
+        Returns:
+            True if the replay has no end record or the final states agree.
+        """
+        end = self.replay.end
+        if end is None:
+            return True
+        return end_record(self.engine, end["end"]) == end
+
+
+def watch_replay(replay: Replay, renderer: Optional[BaseRenderer] = None,
+                 start_tick: int = 0) -> ReplayPlayer:
+    """Show a replay on screen at its original speed.
+
+    Args:
+        replay: The replay to show.
+        renderer: The backend to draw with. A pygame Renderer is created if
+            None.
+        start_tick: Tick to start showing from.
+
+    Returns:
+        The player, stopped at the end of the replay or when the viewer quit.
+    """
+    from tetris.game import TetrisGame
+
+    # The game resets its engine, so the player takes over after that
+    game = TetrisGame(replay.create_engine(), renderer=renderer)
+    player = ReplayPlayer(replay, game.engine)
+    player.seek(start_tick)
+    scheduler = FixedStepScheduler(replay.tick_rate)
+    running = True
+    while running and not player.finished:
+        running = Command.QUIT not in game.renderer.poll_input()
+        for _ in range(scheduler.advance()):
+            if not player.finished:
+                player.advance()
+        if scheduler.should_render():
+            game._render_frame()
+        scheduler.wait()
+    game.renderer.close()
+    return player
@@ -0,0 +1,122 @@
+"""Fixed-timestep scheduling of simulation ticks and rendered frames.
+
+The simulation advances in ticks of exactly ``1 / tick_rate`` seconds,
+however long frames take to render. Time is read from a monotonic clock in
+integer nanoseconds and accumulated in integers, so the number of ticks run
+for a sequence of clock readings never depends on rounding. Tests and
+replays inject a fake clock to make the schedule fully deterministic.
+"""
+
+import time
+from typing import Any, Callable, Dict
+
+NANOSECONDS = 1_000_000_000
+
+
+class FixedStepScheduler:
+    """Decides how many ticks to simulate and whether to render a frame.
+
+    Each loop iteration calls ``advance`` and runs the ticks it returns,
+    asks ``should_render`` whether to draw, then calls ``wait`` to sleep
+    until the next tick is due. After a stall, at most
+    ``max_ticks_per_update`` ticks are run at once and the rest of the
+    backlog is dropped, so the game slows down instead of freezing to
+    catch up. While the simulation is behind, rendering is skipped, but
+    never for more than ``max_frame_skip`` frames in a row.
+    """
+
+    def __init__(self, tick_rate: int, max_ticks_per_update: int = 5,
+                 max_frame_skip: int = 5, clock: Callable[[], int] = time.monotonic_ns,
+                 sleep: Callable[[float], None] = time.sleep):
+        """Initialize the scheduler.
+
+        Args:
+            tick_rate: Simulation ticks per second.
+            max_ticks_per_update: Most ticks run by one ``advance``.
+            max_frame_skip: Most frames skipped in a row while behind.
+            clock: Monotonic clock returning nanoseconds.
+            sleep: Function sleeping for a number of seconds.
+        """
+        if tick_rate <= 0 or max_ticks_per_update <= 0:
+            raise ValueError("tick_rate and max_ticks_per_update must be positive")
+
+        self.tick_rate = tick_rate
+        self.max_ticks_per_update = max_ticks_per_update
+        self.max_frame_skip = max_frame_skip
+        self.clock = clock
+        self.sleep = sleep
+        self.reset()
+
+    def reset(self) -> None:
+        """Start counting time from now, with no ticks pending."""
+        self._last_time = self.clock()
+        # Elapsed time not yet simulated, in nanoseconds times tick_rate,
+        # so a tick is exactly NANOSECONDS units
+        self._pending = 0
+        self._skipped_in_row = 0
+        self.ticks = 0
+        self.ticks_dropped = 0
+        self.frames_rendered = 0
+        self.frames_skipped = 0
+
+    def _read_clock(self) -> None:
+        """Add the time since the last reading to the pending time."""
+        now = self.clock()
+        self._pending += (now - self._last_time) * self.tick_rate
+        self._last_time = now
+
+    def advance(self) -> int:
+        """Get the number of ticks to simulate now.
+
+        Returns:
+            The whole ticks that elapsed, at most ``max_ticks_per_update``.
+        """
+        self._read_clock()
+        ticks, self._pending = divmod(self._pending, NANOSECONDS)
+        if ticks > self.max_ticks_per_update:
+            self.ticks_dropped += ticks - self.max_ticks_per_update
+            ticks = self.max_ticks_per_update
+        self.ticks += ticks
+        return ticks
+
+    def behind(self) -> bool:
+        """Check whether another tick is already due."""
+        self._read_clock()
+        return self._pending >= NANOSECONDS
+
+    def should_render(self) -> bool:
+        """Decide whether to render a frame now.
+
+        Returns:
+            False if the simulation is behind and fewer than
+            ``max_frame_skip`` frames were skipped in a row, True otherwise.
+        """
+        if self._skipped_in_row < self.max_frame_skip and self.behind():
+            self._skipped_in_row += 1
+            self.frames_skipped += 1
+            return False
+        self._skipped_in_row = 0
+        self.frames_rendered += 1
+        return True
+
+    def wait(self) -> None:
+        """Sleep until the next tick is due, if it is not already."""
+        self._read_clock()
+        remaining = NANOSECONDS - self._pending
+        if remaining > 0:
+            # Round up to whole nanoseconds, so the tick is due on waking
+            self.sleep(-(-remaining // self.tick_rate) / NANOSECONDS)
+
+    def stats(self) -> Dict[str, Any]:
+        """Get the scheduling counters.
+
+        Returns:
+            A dictionary of ticks run and dropped, and frames rendered and
+            skipped.
+        """
+        return {
+            "ticks": self.ticks,
+            "ticks_dropped": self.ticks_dropped,
+            "frames_rendered": self.frames_rendered,
+            "frames_skipped": self.frames_skipped,
+        }
@@ -0,0 +1,231 @@
+"""Multi-process self-play for headless Tetris games."""
+
+import random
+import time
+from dataclasses import dataclass
+from multiprocessing import Pool
+from typing import Callable, Dict, Iterator, List, Optional, Tuple, Any
+from tetris.ai import HeuristicAI, HeuristicWeights
+from tetris.bitboard import BitBoard
+from tetris.engine import Action, GameEngine
+from tetris.pieces import create_generator
+from tetris.planner import BeamPlanner
+
+# A policy maps the engine state (and a private RNG) to the actions for the
+# current piece. The actions are applied in order and must end with a DROP.
+Policy = Callable[[GameEngine, random.Random], List[Action]]
+
+# Evaluation weights passed to policies that take them
+Weights = Optional[Dict[str, float]]
+
+
+def random_policy(engine: GameEngine, rng: random.Random) -> List[Action]:
+    """Rotate and shift the current piece randomly, then hard drop it.
+
+    Args:
+        engine: The game engine to play.
+        rng: Random number generator owned by the caller.
+
+    Returns:
+        The actions to play for the current piece.
+    """
+    actions = [Action.ROTATE] * rng.randrange(4)
+    shift = rng.randrange(-5, 6)
+    actions += [Action.RIGHT if shift > 0 else Action.LEFT] * abs(shift)
+    actions.append(Action.DROP)
+    return actions
+
+
+def _random_policy_factory(weights: Weights) -> Policy:
+    """Create the random policy; it takes no weights."""
+    return random_policy
+
+
+def _heuristic_policy_factory(weights: Weights) -> Policy:
+    """Create a heuristic AI policy with the given weights."""
+    ai = HeuristicAI(HeuristicWeights.from_dict(weights) if weights else None)
+    return ai.actions
+
+
+def _beam_policy_factory(weights: Weights) -> Policy:
+    """Create a one-piece lookahead beam search policy with the given weights."""
+    planner = BeamPlanner(HeuristicWeights.from_dict(weights) if weights else None)
+    return planner.actions
+
+
+# Policy factories by name, each taking optional evaluation weights
+POLICIES: Dict[str, Callable[[Weights], Policy]] = {
+    "random": _random_policy_factory,
+    "heuristic": _heuristic_policy_factory,
+    "beam": _beam_policy_factory,
+}
+
+
+@dataclass
+class GameResult:
+    """Outcome of a single self-play game."""
+
+    game: int
+    seed: int
+    score: int
+    lines: int
+    level: int
+    pieces: int
+    wall_time: float
+
+
+def play_game(game: int, seed: int, policy: str = "random",
+              max_pieces: Optional[int] = None, weights: Weights = None,
+              randomizer: str = "uniform") -> GameResult:
+    """Play one headless game to the end.
+
+    Args:
+        game: Index of the game, used to identify the result.
+        seed: Seed for the piece sequence and the policy.
+        policy: Name of the policy in POLICIES.
+        max_pieces: Stop after this many pieces even if the game is not over.
+        weights: Evaluation weights for the policy.
+        randomizer: Name of the piece generator, "uniform" or "bag".
+
+    Returns:
+        The result of the game.
+
+    Raises:
+        ValueError: If the policy is unknown.
+    """
+    if policy not in POLICIES:
+        raise ValueError(f"unknown policy: {policy}")
+    choose_actions = POLICIES[policy](weights)
+    rng = random.Random(seed)
+    engine = GameEngine(BitBoard(), generator=create_generator(randomizer, seed))
+
+    start_time = time.perf_counter()
+    while not engine.game_over:
+        if max_pieces is not None and engine.pieces_placed >= max_pieces:
+            break
+        for action in choose_actions(engine, rng):
+            engine.step(action)
+
+    return GameResult(
+        game=game,
+        seed=seed,
+        score=engine.score,
+        lines=engine.lines_cleared,
+        level=engine.level,
+        pieces=engine.pieces_placed,
+        wall_time=time.perf_counter() - start_time,
+    )
+
+
+def _play_task(task: Tuple[int, int, str, Optional[int], Weights, str]) -> GameResult:
+    """Unpack a task tuple for Pool.imap_unordered."""
+    return play_game(*task)
+
+
+def game_seeds(seed: int, games: int) -> List[int]:
+    """Derive one independent seed per game from a base seed.
+
+    Args:
+        seed: The base seed of the run.
+        games: Number of games.
+
+    Returns:
+        A list of per-game seeds.
+    """
+    rng = random.Random(seed)
+    return [rng.getrandbits(32) for _ in range(games)]
+
+
+def run_selfplay(workers: int, games: int, seed: int, policy: str = "random",
+                 max_pieces: Optional[int] = None, weights: Weights = None,
+                 randomizer: str = "uniform") -> Iterator[GameResult]:
+    """Play games across a process pool and yield results as they finish.
+
+    Args:
+        workers: Number of worker processes. Games run in-process if 1 or less.
+        games: Number of games to play.
+        seed: Base seed of the run.
+        policy: Name of the policy in POLICIES.
+        max_pieces: Per-game piece limit.
+        weights: Evaluation weights for the policy.
+        randomizer: Name of the piece generator, "uniform" or "bag".
+
+    Yields:
+        The result of each game in completion order.
+    """
+    tasks = [(game, game_seed, policy, max_pieces, weights, randomizer)
+             for game, game_seed in enumerate(game_seeds(seed, games))]
+
+    if workers <= 1:
+        for task in tasks:
+            yield _play_task(task)
+        return
+
+    with Pool(workers) as pool:
+        for result in pool.imap_unordered(_play_task, tasks):
+            yield result
+
+
+def summarize(results: List[GameResult], elapsed: float) -> Dict[str, Any]:
+    """Aggregate game results into a summary.
+
+    Args:
+        results: The results of all games.
+        elapsed: Wall time of the whole run in seconds.
+
+    Returns:
+        A dictionary of aggregate statistics.
+    """
+    games = len(results)
+    if games == 0:
+        return {"games": 0, "elapsed": elapsed}
+
+    scores = [result.score for result in results]
+    pieces = sum(result.pieces for result in results)
+    return {
+        "games": games,
+        "mean_score": sum(scores) / games,
+        "max_score": max(scores),
+        "min_score": min(scores),
+        "mean_lines": sum(result.lines for result in results) / games,
+        "mean_level": sum(result.level for result in results) / games,
+        "total_pieces": pieces,
+        "game_time": sum(result.wall_time for result in results),
+        "elapsed": elapsed,
+        "pieces_per_second": pieces / elapsed if elapsed > 0 else 0.0,
+    }
+
+
+def main(workers: int, games: int, seed: int, policy: str = "random",
+         max_pieces: Optional[int] = None, weights: Weights = None,
+         randomizer: str = "uniform") -> Dict[str, Any]:
+    """Run self-play and print each result followed by the summary.
+
+    Args:
+        workers: Number of worker processes.
+        games: Number of games to play.
+        seed: Base seed of the run.
+        policy: Name of the policy in POLICIES.
+        max_pieces: Per-game piece limit.
+        weights: Evaluation weights for the policy.
+        randomizer: Name of the piece generator, "uniform" or "bag".
+
+    Returns:
+        The summary of the run.
+    """
+    results = []
+    start_time = time.perf_counter()
+    for result in run_selfplay(workers, games, seed, policy, max_pieces, weights,
+                               randomizer):
+        results.append(result)
+        print(
+            f"game {result.game}: score={result.score} lines={result.lines} "
+            f"level={result.level} pieces={result.pieces} "
+            f"time={result.wall_time:.3f}s"
+        )
+
+    summary = summarize(results, time.perf_counter() - start_time)
+    print("Summary:")
+    for key, value in summary.items():
+        print(f"  {key}: {value:.3f}" if isinstance(value, float) else f"  {key}: {value}")
+    return summary
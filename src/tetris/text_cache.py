@@ -0,0 +1,141 @@
+"""Caches for rendered text, so unchanged strings are never rasterized twice."""
+
+import pygame
+from collections import OrderedDict
+from typing import Any, Dict, Tuple
+
+Color = Tuple[int, int, int]
+
+
+class TextCache:
+    """Bounded LRU cache of rendered text surfaces.
+
+    Entries are keyed on (font, text, color), so the same string rendered
+    with another font or color is cached separately.
+    """
+
+    def __init__(self, capacity: int = 256):
+        """Initialize an empty cache.
+
+        Args:
+            capacity: Maximum number of cached surfaces.
+        """
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+
+        self.capacity = capacity
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._surfaces: "OrderedDict[Tuple[pygame.font.Font, str, Color], pygame.Surface]" = (
+            OrderedDict()
+        )
+
+    def __len__(self) -> int:
+        """Get the number of cached surfaces."""
+        return len(self._surfaces)
+
+    def render(self, font: pygame.font.Font, text: str, color: Color) -> pygame.Surface:
+        """Get the antialiased rendering of a string.
+
+        Args:
+            font: The font to render with.
+            text: The string to render.
+            color: RGB color of the text.
+
+        Returns:
+            The rendered text. It is shared, so callers must not draw on it.
+        """
+        key = (font, text, color)
+        surface = self._surfaces.get(key)
+        if surface is not None:
+            self._surfaces.move_to_end(key)
+            self.hits += 1
+            return surface
+
+        self.misses += 1
+        surface = font.render(text, True, color)
+        self._surfaces[key] = surface
+        if len(self._surfaces) > self.capacity:
+            self._surfaces.popitem(last=False)
+            self.evictions += 1
+        return surface
+
+    def clear(self) -> None:
+        """Remove all cached surfaces, keeping the counters."""
+        self._surfaces.clear()
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups that were hits."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def stats(self) -> Dict[str, Any]:
+        """Get the cache counters.
+
+        Returns:
+            A dictionary of entry count, hits, misses, evictions and hit rate.
+        """
+        return {
+            "entries": len(self),
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hit_rate,
+        }
+
+
+class DigitAtlas:
+    """Pre-rendered glyphs for drawing numbers without rasterizing text.
+
+    Every digit is rendered once; a number is drawn by blitting its glyphs
+    side by side, so changing values cost a few blits instead of a render.
+    """
+
+    CHARACTERS = "0123456789-"
+
+    def __init__(self, font: pygame.font.Font, color: Color):
+        """Render the glyphs of a font and color.
+
+        Args:
+            font: The font to render with.
+            color: RGB color of the glyphs.
+        """
+        self.glyphs = {
+            character: font.render(character, True, color) for character in self.CHARACTERS
+        }
+        self.height = max(glyph.get_height() for glyph in self.glyphs.values())
+        self.numbers_drawn = 0
+
+    def size(self, value: int) -> Tuple[int, int]:
+        """Get the size of a drawn number.
+
+        Args:
+            value: The number.
+
+        Returns:
+            The width and height in pixels.
+        """
+        return sum(self.glyphs[character].get_width() for character in str(value)), self.height
+
+    def draw(self, surface: pygame.Surface, value: int, position: Tuple[int, int]) -> pygame.Rect:
+        """Draw a number.
+
+        Args:
+            surface: The surface to draw on.
+            value: The number.
+            position: Top-left corner in pixels.
+
+        Returns:
+            The area covered by the number.
+        """
+        x, y = position
+        blits = []
+        for character in str(value):
+            glyph = self.glyphs[character]
+            blits.append((glyph, (x, y)))
+            x += glyph.get_width()
+        surface.blits(blits, doreturn=False)
+        self.numbers_drawn += 1
+        return pygame.Rect(position[0], y, x - position[0], self.height)
@@ -0,0 +1,291 @@
+"""Parallel tuning of the AI evaluation weights with the cross-entropy method."""
+
+import json
+import os
+import random
+import statistics
+import time
+from dataclasses import dataclass, field, asdict, fields
+from multiprocessing import Pool
+from typing import Any, Dict, List, Optional, Tuple
+from tetris.ai import HeuristicWeights
+from tetris.selfplay import game_seeds, play_game
+
+# Names of the tuned features, in HeuristicWeights field order
+FEATURES: Tuple[str, ...] = tuple(f.name for f in fields(HeuristicWeights))
+
+# Results a candidate can be scored on
+METRICS = ("score", "lines", "pieces")
+
+
+@dataclass
+class TunerState:
+    """Search distribution and best result after a number of generations."""
+
+    generation: int
+    mean: Dict[str, float]
+    std: Dict[str, float]
+    best_weights: Optional[Dict[str, float]] = None
+    best_fitness: float = float("-inf")
+    history: List[Dict[str, Any]] = field(default_factory=list)
+
+
+def _evaluate_task(
+    task: Tuple[int, int, Dict[str, float], Optional[int], str]
+) -> Tuple[int, float]:
+    """Play one seeded game with a candidate's weights.
+
+    Returns:
+        The candidate index and the game's value of the metric.
+    """
+    candidate, seed, weights, max_pieces, metric = task
+    result = play_game(candidate, seed, "heuristic", max_pieces, weights)
+    return candidate, float(getattr(result, metric))
+
+
+class CrossEntropyTuner:
+    """Searches evaluation weights with the cross-entropy method.
+
+    Each generation samples candidates from a normal distribution per
+    feature, plays every candidate on the same fixed set of seeded headless
+    games across a process pool, and refits the distribution to the elite
+    candidates. The state is checkpointed to disk after every generation so
+    an interrupted run can resume where it stopped. The checkpoint records
+    the settings that decide the search, and is only resumed with the same
+    settings.
+    """
+
+    def __init__(self, population: int = 32, elite_fraction: float = 0.25,
+                 games: int = 8, max_pieces: Optional[int] = 2000, seed: int = 0,
+                 workers: int = 1, checkpoint: Optional[str] = None,
+                 initial_std: float = 0.5, noise: float = 0.05, metric: str = "score"):
+        """Initialize the tuner.
+
+        Args:
+            population: Candidates sampled per generation.
+            elite_fraction: Fraction of the best candidates used to refit.
+            games: Seeded games played by every candidate.
+            max_pieces: Per-game piece limit, or None to play to the end.
+            seed: Seed of the game set and of the sampling.
+            workers: Number of worker processes.
+            checkpoint: Path of the JSON checkpoint, or None.
+            initial_std: Initial standard deviation of every weight.
+            noise: Extra deviation added after each refit to avoid collapse.
+            metric: Game result to maximize: "score", "lines" or "pieces".
+        """
+        if metric not in METRICS:
+            raise ValueError(f"unknown metric: {metric}")
+
+        self.population = population
+        self.games = games
+        self.elite_count = max(1, int(population * elite_fraction))
+        self.max_pieces = max_pieces
+        self.seed = seed
+        self.workers = workers
+        self.checkpoint = checkpoint
+        self.initial_std = initial_std
+        self.noise = noise
+        self.metric = metric
+        self.seeds = game_seeds(seed, games)
+        self.state = TunerState(
+            generation=0,
+            mean=HeuristicWeights().to_dict(),
+            std={feature: initial_std for feature in FEATURES},
+        )
+
+    def config(self) -> Dict[str, Any]:
+        """Get the settings a checkpoint can only be resumed with.
+
+        Returns:
+            A dictionary of the seed, game set, population, elite size,
+            metric, piece limit, and the initial and added deviations.
+        """
+        return {
+            "seed": self.seed,
+            "games": self.games,
+            "population": self.population,
+            "elite_count": self.elite_count,
+            "metric": self.metric,
+            "max_pieces": self.max_pieces,
+            "initial_std": self.initial_std,
+            "noise": self.noise,
+        }
+
+    def load_checkpoint(self) -> bool:
+        """Restore the state from the checkpoint file, if it exists.
+
+        Returns:
+            True if a checkpoint was loaded.
+
+        Raises:
+            ValueError: If the checkpoint was written with other settings.
+        """
+        if not self.checkpoint or not os.path.exists(self.checkpoint):
+            return False
+
+        with open(self.checkpoint) as f:
+            data = json.load(f)
+        saved = data.pop("config", {})
+        config = self.config()
+        changed = [key for key in config if saved.get(key) != config[key]]
+        if changed:
+            raise ValueError(
+                f"checkpoint {self.checkpoint} was written with other settings: "
+                + ", ".join(f"{key}={saved.get(key)!r}" for key in changed)
+            )
+        if data.get("best_fitness") is None:
+            data["best_fitness"] = float("-inf")
+        self.state = TunerState(**data)
+        return True
+
+    def save_checkpoint(self) -> None:
+        """Write the state to the checkpoint file atomically."""
+        if not self.checkpoint:
+            return
+
+        data = asdict(self.state)
+        if data["best_fitness"] == float("-inf"):
+            data["best_fitness"] = None
+        data["config"] = self.config()
+        temp_path = f"{self.checkpoint}.tmp"
+        with open(temp_path, "w") as f:
+            json.dump(data, f, indent=2)
+        os.replace(temp_path, self.checkpoint)
+
+    def sample(self) -> List[Dict[str, float]]:
+        """Sample the candidates of the current generation.
+
+        The sampling RNG is derived from the seed and generation number, so a
+        resumed run samples the same candidates as an uninterrupted one.
+
+        Returns:
+            One weight dictionary per candidate.
+        """
+        rng = random.Random(f"{self.seed}:{self.state.generation}")
+        return [
+            {
+                feature: rng.gauss(self.state.mean[feature], self.state.std[feature])
+                for feature in FEATURES
+            }
+            for _ in range(self.population)
+        ]
+
+    def evaluate(self, candidates: List[Dict[str, float]],
+                 pool: Optional[Any] = None) -> List[float]:
+        """Play every candidate on the fixed game set.
+
+        Args:
+            candidates: Weights of the candidates.
+            pool: Process pool to spread the games over, or None to play
+                in-process.
+
+        Returns:
+            The mean metric of each candidate.
+        """
+        tasks = [
+            (index, seed, weights, self.max_pieces, self.metric)
+            for index, weights in enumerate(candidates)
+            for seed in self.seeds
+        ]
+        results = pool.imap_unordered(_evaluate_task, tasks) if pool else map(_evaluate_task, tasks)
+
+        totals = [0.0] * len(candidates)
+        for index, value in results:
+            totals[index] += value
+        return [total / len(self.seeds) for total in totals]
+
+    def step(self, pool: Optional[Any] = None) -> Dict[str, Any]:
+        """Run one generation and refit the search distribution.
+
+        Args:
+            pool: Process pool to evaluate candidates in, or None.
+
+        Returns:
+            The summary of the generation.
+        """
+        start_time = time.perf_counter()
+        candidates = self.sample()
+        fitness = self.evaluate(candidates, pool)
+
+        ranked = sorted(range(len(candidates)), key=fitness.__getitem__, reverse=True)
+        elite = [candidates[index] for index in ranked[:self.elite_count]]
+        for feature in FEATURES:
+            values = [weights[feature] for weights in elite]
+            self.state.mean[feature] = statistics.fmean(values)
+            spread = statistics.pstdev(values) if len(values) > 1 else 0.0
+            self.state.std[feature] = spread + self.noise
+
+        best = ranked[0]
+        if fitness[best] > self.state.best_fitness:
+            self.state.best_fitness = fitness[best]
+            self.state.best_weights = candidates[best]
+
+        self.state.generation += 1
+        summary = {
+            "generation": self.state.generation,
+            "best_fitness": fitness[best],
+            "mean_fitness": statistics.fmean(fitness),
+            "elite_fitness": statistics.fmean(
+                fitness[index] for index in ranked[:self.elite_count]
+            ),
+            "seconds": time.perf_counter() - start_time,
+        }
+        self.state.history.append(summary)
+        self.save_checkpoint()
+        return summary
+
+    def run(self, generations: int) -> TunerState:
+        """Run until the given total number of generations is reached.
+
+        Args:
+            generations: Total generations, including resumed ones.
+
+        Returns:
+            The final state.
+        """
+        if self.workers <= 1:
+            while self.state.generation < generations:
+                self._report(self.step())
+            return self.state
+
+        with Pool(self.workers) as pool:
+            while self.state.generation < generations:
+                self._report(self.step(pool))
+        return self.state
+
+    @staticmethod
+    def _report(summary: Dict[str, Any]) -> None:
+        """Print the summary of a generation."""
+        print(
+            f"generation {summary['generation']}: best={summary['best_fitness']:.1f} "
+            f"elite={summary['elite_fitness']:.1f} mean={summary['mean_fitness']:.1f} "
+            f"time={summary['seconds']:.1f}s"
+        )
+
+
+def main(generations: int, output: Optional[str] = None, resume: bool = False,
+         **options: Any) -> TunerState:
+    """Run the tuner and optionally write the best weights to a file.
+
+    Args:
+        generations: Total number of generations.
+        output: Path of a JSON file for the best weights, usable with --weights.
+        resume: Continue from the checkpoint if it exists.
+        **options: Arguments for CrossEntropyTuner.
+
+    Returns:
+        The final state.
+    """
+    tuner = CrossEntropyTuner(**options)
+    if resume and tuner.load_checkpoint():
+        print(f"Resuming from generation {tuner.state.generation}")
+
+    state = tuner.run(generations)
+    print(f"Best fitness: {state.best_fitness:.1f}")
+    print(f"Best weights: {json.dumps(state.best_weights)}")
+
+    if output and state.best_weights:
+        with open(output, "w") as f:
+            json.dump(state.best_weights, f, indent=2)
+        print(f"Weights saved to {output}")
+    return state
@@ -0,0 +1,161 @@
+"""Zobrist hashing and a transposition table for board states."""
+
+import random
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Any, Dict, Hashable, List, Optional, Tuple
+
+# Fixed seed so hashes are identical across processes and runs
+ZOBRIST_SEED = 0x7E7215
+
+
+@lru_cache(maxsize=None)
+def zobrist_keys(width: int, height: int) -> Tuple[Tuple[int, ...], ...]:
+    """Get the 64-bit Zobrist keys of a board size.
+
+    Args:
+        width: Width of the board in blocks.
+        height: Height of the board in blocks.
+
+    Returns:
+        A tuple of rows, each holding one key per column.
+    """
+    rng = random.Random(ZOBRIST_SEED)
+    return tuple(
+        tuple(rng.getrandbits(64) for _ in range(width)) for _ in range(height)
+    )
+
+
+def row_hash(keys: Tuple[int, ...], mask: int) -> int:
+    """Hash the occupied cells of one row.
+
+    Args:
+        keys: The Zobrist keys of the row.
+        mask: Occupancy bitmask of the row, bit x for column x.
+
+    Returns:
+        The XOR of the keys of all occupied cells.
+    """
+    value = 0
+    x = 0
+    while mask:
+        if mask & 1:
+            value ^= keys[x]
+        mask >>= 1
+        x += 1
+    return value
+
+
+class TranspositionTable:
+    """Bounded cache of search results keyed on board states.
+
+    Two replacement policies are supported:
+
+    - ``"lru"`` keeps the most recently used entries and evicts the oldest.
+    - ``"depth"`` hashes keys into ``capacity`` slots and only replaces an
+      entry with one searched at least as deep.
+    """
+
+    POLICIES = ("lru", "depth")
+
+    def __init__(self, capacity: int = 100000, policy: str = "lru"):
+        """Initialize an empty table.
+
+        Args:
+            capacity: Maximum number of entries.
+            policy: Replacement policy, "lru" or "depth".
+        """
+        if policy not in self.POLICIES:
+            raise ValueError(f"unknown replacement policy: {policy}")
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+
+        self.capacity = capacity
+        self.policy = policy
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: "OrderedDict[Hashable, Tuple[int, Any]]" = OrderedDict()
+        self._slots: List[Optional[Tuple[Hashable, int, Any]]] = []
+        if policy == "depth":
+            self._slots = [None] * capacity
+
+    def __len__(self) -> int:
+        """Get the number of stored entries."""
+        if self.policy == "lru":
+            return len(self._entries)
+        return sum(slot is not None for slot in self._slots)
+
+    def get(self, key: Hashable, depth: int = 0) -> Optional[Any]:
+        """Look up an entry searched at least as deep as required.
+
+        Args:
+            key: The entry key, usually (board hash, piece type).
+            depth: Minimum search depth of a usable entry.
+
+        Returns:
+            The stored value, or None on a miss.
+        """
+        if self.policy == "lru":
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] >= depth:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+        else:
+            slot = self._slots[hash(key) % self.capacity]
+            if slot is not None and slot[0] == key and slot[1] >= depth:
+                self.hits += 1
+                return slot[2]
+
+        self.misses += 1
+        return None
+
+    def put(self, key: Hashable, value: Any, depth: int = 0) -> None:
+        """Store an entry, evicting according to the replacement policy.
+
+        Args:
+            key: The entry key, usually (board hash, piece type).
+            value: The value to store.
+            depth: Search depth the value was computed with.
+        """
+        if self.policy == "lru":
+            self._entries[key] = (depth, value)
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.capacity:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+            return
+
+        index = hash(key) % self.capacity
+        slot = self._slots[index]
+        if slot is None or slot[0] == key or depth >= slot[1]:
+            if slot is not None and slot[0] != key:
+                self.evictions += 1
+            self._slots[index] = (key, depth, value)
+
+    def clear(self) -> None:
+        """Remove all entries, keeping the counters."""
+        self._entries.clear()
+        if self.policy == "depth":
+            self._slots = [None] * self.capacity
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups that were hits."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def stats(self) -> Dict[str, Any]:
+        """Get the table counters.
+
+        Returns:
+            A dictionary of entry count, hits, misses, evictions and hit rate.
+        """
+        return {
+            "entries": len(self),
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hit_rate,
+        }
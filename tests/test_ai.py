@@ -0,0 +1,86 @@
+"""Tests for the heuristic AI and the incremental board features."""
+
+import json
+import random
+import pytest
+from tetris.ai import HeuristicAI, HeuristicWeights
+from tetris.bitboard import BitBoard
+from tetris.board import Board
+from tetris.engine import GameEngine
+from tetris.placements import PlacementGenerator
+from tetris.pieces import Tetromino
+
+
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_incremental_features_match_grid_scan(seed):
+    """Test that BitBoard features match a full scan of the grid."""
+    rng = random.Random(seed)
+    board = BitBoard()
+    generator = PlacementGenerator()
+
+    for _ in range(300):
+        piece = Tetromino(rng.choice(list(Tetromino.SHAPES)))
+        placements = generator.generate(board, piece)
+        if not placements:
+            board.reset()
+            continue
+        placement = rng.choice(placements)
+        piece.rotation, piece.x, piece.y = placement.rotation, placement.x, placement.y
+        board.add_piece_to_grid(piece)
+        board.clear_lines()
+
+        assert board.get_column_heights() == Board.get_column_heights(board)
+        assert board.get_column_holes() == Board.get_column_holes(board)
+        assert board.get_row_fills() == Board.get_row_fills(board)
+
+
+def test_copy_is_independent():
+    """Test that copying a BitBoard does not share state."""
+    board = BitBoard()
+    child = board.copy()
+    child.add_piece_to_grid(Tetromino("O"))
+
+    assert board.get_occupied_cells() == set()
+    assert board.get_column_heights() == [0] * 10
+    assert child.get_column_heights() != [0] * 10
+
+
+def test_weights_are_configurable(tmp_path):
+    """Test loading weights from a JSON file."""
+    path = tmp_path / "weights.json"
+    path.write_text(json.dumps({"holes": -1.0}))
+
+    weights = HeuristicWeights.load(str(path))
+    assert weights.holes == -1.0
+    assert weights.lines == HeuristicWeights().lines
+    assert HeuristicWeights.from_dict(weights.to_dict()) == weights
+
+    with pytest.raises(ValueError, match="hole, lnes"):
+        HeuristicWeights.from_dict({"hole": -1.0, "lnes": 1.0, "lines": 1.0})
+
+
+def test_ai_prefers_clearing_lines():
+    """Test that the AI completes an open row."""
+    board = BitBoard()
+    for x in range(1, 8, 2):
+        piece = Tetromino("O")
+        piece.x = x
+        piece.y = 18
+        board.add_piece_to_grid(piece)
+
+    # Columns 0..7 hold a 2-high wall with a two-wide well on the right
+    placement = HeuristicAI().choose(board, Tetromino("O"))
+    assert (placement.x, placement.y) == (9, 18)
+
+
+def test_ai_plays_through_engine():
+    """Test that the AI survives and clears lines in a seeded game."""
+    engine = GameEngine(BitBoard(), seed=3)
+    ai = HeuristicAI()
+    for _ in range(100):
+        for action in ai.actions(engine):
+            engine.step(action)
+
+    assert not engine.game_over
+    assert engine.lines_cleared > 0
+    assert ai.evaluations > 0
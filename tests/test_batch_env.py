@@ -0,0 +1,84 @@
+"""Tests for the BatchEnv class."""
+
+import random
+import numpy as np
+import pytest
+from tetris.batch_env import BatchEnv, SHAPE_TYPES, NO_PIECE
+from tetris.board import Board
+from tetris.pieces import Tetromino
+
+
+def test_batch_initialization():
+    """Test that the batch initializes empty boards without pieces."""
+    env = BatchEnv(4)
+    assert env.grid.shape == (4, 20, 10)
+    assert not env.grid.any()
+    assert (env.piece_type == NO_PIECE).all()
+    assert not env.is_game_over().any()
+
+
+def test_spawn_and_move():
+    """Test spawning pieces and moving a subset of boards."""
+    env = BatchEnv(3)
+    assert env.spawn([0, 3, 5]).all()
+
+    moved = env.move(-1, 0, np.array([True, False, True]))
+    assert moved.tolist() == [True, False, True]
+    assert env.x.tolist() == [4, 5, 4]
+
+
+def test_drop_and_clear_lines():
+    """Test dropping pieces and clearing a full row on one board."""
+    env = BatchEnv(2)
+    env.grid[0, 19, :8] = 1
+    o_piece = SHAPE_TYPES.index("O")
+
+    env.spawn([o_piece, o_piece])
+    env.move(4, 0)
+    assert env.drop().all()
+    assert (env.piece_type == NO_PIECE).all()
+
+    assert env.clear_lines().tolist() == [1, 0]
+    assert env.grid[0, 19].tolist() == [0] * 8 + [o_piece + 1] * 2
+    assert env.grid[1, 18:, 8:].all()
+
+
+@pytest.mark.parametrize("seed", [0, 1])
+def test_matches_scalar_board(seed):
+    """Test that random play on the batch matches the scalar Board."""
+    rng = random.Random(seed)
+    num_boards = 8
+    env = BatchEnv(num_boards)
+    boards = [Board() for _ in range(num_boards)]
+
+    for _ in range(300):
+        types = [rng.randrange(len(SHAPE_TYPES)) for _ in range(num_boards)]
+        spawned = env.spawn(types)
+        for i, board in enumerate(boards):
+            board.current_piece = Tetromino(SHAPE_TYPES[types[i]])
+            assert spawned[i] == board.is_valid_position(board.current_piece)
+
+        for _ in range(rng.randrange(8)):
+            dx = np.array([rng.choice([-1, 0, 1]) for _ in range(num_boards)])
+            dy = np.array([rng.choice([0, 1]) for _ in range(num_boards)])
+            moved = env.move(dx, dy)
+            rotate_mask = np.array([rng.random() < 0.5 for _ in range(num_boards)])
+            rotated = env.rotate(rotate_mask)
+            for i, board in enumerate(boards):
+                assert moved[i] == board.move_piece(int(dx[i]), int(dy[i]))
+                if rotate_mask[i]:
+                    assert rotated[i] == board.rotate_piece()
+
+        env.drop()
+        cleared = env.clear_lines()
+        for i, board in enumerate(boards):
+            board.drop_piece()
+            assert cleared[i] == board.clear_lines()
+            assert env.to_board(i).grid == board.grid
+
+        over = env.is_game_over()
+        for i, board in enumerate(boards):
+            assert over[i] == board.is_game_over()
+            if over[i]:
+                board.reset()
+                env.grid[i] = 0
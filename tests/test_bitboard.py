@@ -0,0 +1,148 @@
+"""Tests for the BitBoard class."""
+
+import random
+import pytest
+from tetris.board import Board
+from tetris.bitboard import BitBoard, PIECE_MASKS
+from tetris.pieces import Tetromino
+
+
+def test_piece_masks_cover_all_rotations():
+    """Test that every shape and rotation has a four-cell mask."""
+    for shape_type in Tetromino.SHAPES:
+        for rotation in range(4):
+            _, _, rows = PIECE_MASKS[(shape_type, rotation)]
+            assert sum(bin(bits).count("1") for _, bits in rows) == 4
+
+
+def test_is_valid_position():
+    """Test the is_valid_position method."""
+    board = BitBoard(10, 20)
+
+    piece = Tetromino("I")
+    piece.x = 5
+    piece.y = 5
+    assert board.is_valid_position(piece)
+
+    piece.x = -1
+    assert not board.is_valid_position(piece)
+
+    # Cells above the board are allowed
+    piece.x = 5
+    piece.y = -1
+    assert board.is_valid_position(piece)
+
+    piece.y = 18
+    assert not board.is_valid_position(piece)
+
+
+def test_add_piece_and_collide():
+    """Test that added pieces update the row masks and block collisions."""
+    board = BitBoard(10, 20)
+
+    piece = Tetromino("O")
+    piece.x = 1
+    piece.y = 18
+    board.add_piece_to_grid(piece)
+
+    assert board.rows[18] == 0b11
+    assert board.rows[19] == 0b11
+    assert board.get_cell_type(0, 19) == "O"
+    assert board.get_occupied_cells() == {(0, 18), (1, 18), (0, 19), (1, 19)}
+
+    other = Tetromino("I")
+    other.x = 1
+    other.y = 16
+    assert not board.is_valid_position(other)
+
+
+def test_clear_lines_and_game_over():
+    """Test clearing full rows and detecting game over."""
+    board = BitBoard(10, 20)
+
+    for x in range(0, 10, 2):
+        piece = Tetromino("O")
+        piece.x = x + 1
+        piece.y = 18
+        board.add_piece_to_grid(piece)
+
+    assert board.clear_lines() == 2
+    assert board.rows == [0] * 20
+    assert board.get_occupied_cells() == set()
+    assert not board.is_game_over()
+
+    piece = Tetromino("I")
+    piece.x = 5
+    piece.y = 1
+    board.add_piece_to_grid(piece)
+    assert board.is_game_over()
+
+
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_matches_reference_board(seed):
+    """Test that random games play out identically on Board and BitBoard."""
+    rng = random.Random(seed)
+    reference = Board(10, 20)
+    bitboard = BitBoard(10, 20)
+
+    for _ in range(200):
+        shape_type = rng.choice(list(Tetromino.SHAPES))
+        rotations = rng.randrange(4)
+        shift = rng.randrange(-5, 6)
+
+        results = []
+        for board in (reference, bitboard):
+            board.current_piece = Tetromino(shape_type)
+            if not board.is_valid_position(board.current_piece):
+                results.append(None)
+                continue
+            for _ in range(rotations):
+                board.rotate_piece()
+            step = 1 if shift > 0 else -1
+            for _ in range(abs(shift)):
+                board.move_piece(step, 0)
+            results.append(board.landing_y(board.current_piece))
+            board.drop_piece()
+            results.append(board.clear_lines())
+
+        assert results[:len(results) // 2] == results[len(results) // 2:]
+        assert reference.grid == bitboard.grid
+        assert reference.is_game_over() == bitboard.is_game_over()
+        if reference.is_game_over():
+            reference.reset()
+            bitboard.reset()
+
+
+def test_landing_y_below_overhang():
+    """Test that a piece tucked under an overhang lands on the floor below it."""
+    board = BitBoard(10, 20)
+    roof = Tetromino("I")
+    roof.rotation, roof.x, roof.y = 1, 5, 15
+    board.add_piece_to_grid(roof)
+
+    piece = Tetromino("O")
+    piece.x, piece.y = 5, 16
+    assert board.is_valid_position(piece)
+    assert board.landing_y(piece) == 18
+    assert board.landing_y(Tetromino("O")) == 13
+
+
+def test_set_rows_rebuilds_features():
+    """Test that loading cells gives the same features as placing pieces."""
+    rng = random.Random(4)
+    board = BitBoard(10, 20)
+    for _ in range(12):
+        piece = Tetromino(rng.choice(list(Tetromino.SHAPES)))
+        piece.rotation = rng.randrange(4)
+        piece.x = rng.randrange(2, 8)
+        piece.y = board.landing_y(piece)
+        board.add_piece_to_grid(piece)
+
+    loaded = BitBoard(10, 20)
+    loaded.set_rows(board.get_rows())
+    assert loaded.grid == board.grid
+    assert loaded.rows == board.rows
+    assert loaded.row_fills == board.row_fills
+    assert loaded.heights == board.heights
+    assert loaded.holes == board.holes
+    assert loaded.get_zobrist_hash() == board.get_zobrist_hash()
@@ -182,3 +182,30 @@ def test_drop_piece():
     # The piece should be at the bottom of the board
     assert board.current_piece is None
     assert board.grid[19][5] == "I"
+
+
+def test_landing_y():
+    """Test that landing_y finds the resting row without moving the piece."""
+    board = Board(10, 20)
+    piece = Tetromino("O")
+    assert board.landing_y(piece) == 18
+    assert piece.y == 0
+
+    # A block under one column stops the piece on top of it
+    board.grid[15][5] = "I"
+    assert board.landing_y(piece) == 13
+
+
+def test_rows_round_trip():
+    """Test that get_rows and set_rows preserve the cells."""
+    board = Board(10, 20)
+    piece = Tetromino("T")
+    piece.y = 18
+    board.add_piece_to_grid(piece)
+    rows = board.get_rows()
+    assert rows[17:] == [".....T....", ".....TT...", ".....T...."]
+    assert rows[0] == "." * 10
+
+    copy = Board(10, 20)
+    copy.set_rows(rows)
+    assert copy.grid == board.grid
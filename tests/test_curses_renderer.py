@@ -0,0 +1,119 @@
+"""Tests for the CursesRenderer class."""
+
+import curses
+import subprocess
+import sys
+import pytest
+from tetris.curses_renderer import CursesRenderer
+from tetris.engine import Action, GameEngine
+from tetris.game import TetrisGame
+from tetris.render_base import BaseRenderer, Command
+
+
+class FakeScreen:
+    """Stand-in for a curses window that records what is written."""
+
+    def __init__(self, keys=()):
+        self.keys = list(keys)
+        self.cells = {}
+        self.writes = 0
+
+    def addstr(self, row, col, text, attr=0):
+        self.writes += 1
+        for offset, character in enumerate(text):
+            self.cells[(row, col + offset)] = character
+
+    def getch(self):
+        return self.keys.pop(0) if self.keys else -1
+
+    def text(self, row):
+        columns = [col for r, col in self.cells if r == row]
+        return "".join(self.cells.get((row, col), " ") for col in range(max(columns) + 1))
+
+    def nodelay(self, flag):
+        pass
+
+    def keypad(self, flag):
+        pass
+
+    def clear(self):
+        self.cells = {}
+
+    def refresh(self):
+        pass
+
+
+def _draw_frame(renderer, engine):
+    """Draw one frame the way TetrisGame does."""
+    renderer.clear_screen()
+    renderer.draw_board(engine.board)
+    renderer.draw_next_piece(engine.board.next_piece)
+    renderer.draw_score(engine.score, engine.level, engine.lines_cleared)
+    renderer.draw_controls()
+    renderer.update_display()
+
+
+def test_only_changed_cells_are_written():
+    """Test that identical frames write nothing and small moves write little."""
+    screen = FakeScreen()
+    renderer = CursesRenderer(screen)
+    engine = GameEngine(seed=3)
+
+    _draw_frame(renderer, engine)
+    first = renderer.stats()["cells_written"]
+    assert first > 200
+    assert "Score: 0" in screen.text(renderer.board_row + 6)
+
+    _draw_frame(renderer, engine)
+    assert renderer.stats()["cells_written"] == first
+
+    engine.step(Action.LEFT)
+    _draw_frame(renderer, engine)
+    assert 0 < renderer.stats()["cells_written"] - first <= 32
+
+    # The terminal shows the same picture as a fresh full redraw
+    fresh = FakeScreen()
+    reference = CursesRenderer(fresh)
+    _draw_frame(reference, engine)
+    assert screen.cells == fresh.cells
+
+
+def test_poll_input_maps_keys():
+    """Test that keys are translated into commands."""
+    screen = FakeScreen([curses.KEY_LEFT, ord(" "), ord("p"), ord("x"), 27])
+    renderer = CursesRenderer(screen)
+    assert renderer.poll_input() == [Command.LEFT, Command.DROP, Command.PAUSE, Command.QUIT]
+    assert renderer.poll_input() == []
+
+
+def test_game_runs_on_curses_backend():
+    """Test that TetrisGame plays and renders through the curses backend."""
+    screen = FakeScreen([curses.KEY_RIGHT, ord(" "), ord("p")])
+    game = TetrisGame(GameEngine(seed=2), renderer=CursesRenderer(screen))
+
+    assert game._handle_events()
+    assert game.engine.pieces_placed == 1
+    assert game.paused
+    game._render_frame()
+    assert "PAUSED" in screen.text(game.renderer.board_row + 9)
+
+    screen.keys.append(ord("q"))
+    assert not game._handle_events()
+
+
+def test_curses_game_does_not_import_pygame():
+    """Test that a curses game can be set up without loading pygame."""
+    code = "import sys, tetris.game, tetris.curses_renderer; print('pygame' in sys.modules)"
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True,
+                            check=True)
+    assert result.stdout.strip() == "False"
+
+
+def test_incomplete_backend_cannot_be_created():
+    """Test that a backend missing drawing methods fails on creation."""
+    class HalfRenderer(BaseRenderer):
+        def clear_screen(self):
+            pass
+
+    with pytest.raises(TypeError):
+        HalfRenderer()
@@ -0,0 +1,126 @@
+"""Tests for the GameEngine class."""
+
+import json
+import subprocess
+import sys
+from tetris.engine import Action, GameEngine
+from tetris.bitboard import BitBoard
+from tetris.constants import INITIAL_FALL_FREQUENCY
+from tetris.pieces import BagGenerator
+
+
+def test_engine_does_not_import_pygame():
+    """Test that the engine can be imported without pygame."""
+    result = subprocess.run(
+        [sys.executable, "-c", "import sys, tetris.engine; print('pygame' in sys.modules)"],
+        capture_output=True, text=True, check=True
+    )
+    assert result.stdout.strip() == "False"
+
+
+def test_engine_initialization():
+    """Test that the engine initializes correctly."""
+    engine = GameEngine()
+    assert engine.score == 0
+    assert engine.level == 1
+    assert engine.lines_cleared == 0
+    assert engine.pieces_placed == 0
+    assert not engine.game_over
+    assert engine.board.current_piece is not None
+    assert engine.board.next_piece is not None
+
+
+def test_step_moves_piece():
+    """Test that actions move the current piece."""
+    engine = GameEngine()
+    piece = engine.board.current_piece
+    x = piece.x
+
+    assert engine.step(Action.LEFT)
+    assert piece.x == x - 1
+    assert engine.step(Action.RIGHT)
+    assert piece.x == x
+    assert not engine.step(Action.NONE)
+
+
+def test_drop_locks_piece_and_spawns_next():
+    """Test that a hard drop places the piece and spawns the next one."""
+    engine = GameEngine(BitBoard())
+    next_piece = engine.board.next_piece
+
+    assert engine.step(Action.DROP)
+    assert engine.pieces_placed == 1
+    assert engine.board.current_piece is next_piece
+    assert len(engine.board.get_occupied_cells()) == 4
+
+
+def test_tick_applies_gravity():
+    """Test that gravity only moves the piece once the fall interval passes."""
+    engine = GameEngine()
+    piece = engine.board.current_piece
+    y = piece.y
+
+    engine.tick(INITIAL_FALL_FREQUENCY / 2)
+    assert piece.y == y
+
+    engine.tick(INITIAL_FALL_FREQUENCY)
+    assert piece.y == y + 1
+
+
+def test_soft_drop_resets_fall_timer():
+    """Test that moving down resets the gravity timer."""
+    engine = GameEngine()
+    engine.tick(INITIAL_FALL_FREQUENCY / 2)
+    engine.step(Action.DOWN)
+    assert engine.fall_timer == 0.0
+
+
+def test_game_runs_to_game_over():
+    """Test that repeatedly dropping pieces eventually ends the game."""
+    engine = GameEngine()
+    for _ in range(1000):
+        if engine.game_over:
+            break
+        engine.step(Action.DROP)
+
+    assert engine.game_over
+    assert not engine.step(Action.DROP)
+
+
+def test_engine_uses_given_generator():
+    """Test that the engine deals pieces from its generator and restarts it on reset."""
+    engine = GameEngine(generator=BagGenerator(seed=11))
+    expected = BagGenerator(seed=11).generate(14)
+
+    dealt = [engine.board.current_piece.shape_type]
+    for _ in range(13):
+        engine.step(Action.DROP)
+        engine.board.grid = [[None] * engine.board.width for _ in range(engine.board.height)]
+        dealt.append(engine.board.current_piece.shape_type)
+    assert dealt == expected
+
+    engine.reset()
+    assert engine.board.current_piece.shape_type == expected[0]
+    assert engine.get_preview(3) == expected[1:4]
+    assert engine.seed == 11
+
+
+def test_snapshot_restores_the_game():
+    """Test that a restored engine plays on exactly like the original."""
+    actions = [Action.LEFT, Action.ROTATE, Action.DOWN, Action.RIGHT, Action.DROP]
+    engine = GameEngine(BitBoard(), generator=BagGenerator(3))
+    for index in range(40):
+        engine.step(actions[index % len(actions)])
+        engine.tick(0.3)
+
+    snapshot = json.loads(json.dumps(engine.snapshot()))
+    restored = GameEngine(BitBoard(), generator=BagGenerator(3))
+    restored.restore(snapshot)
+    assert restored.snapshot() == engine.snapshot()
+
+    for index in range(40):
+        for game in (engine, restored):
+            game.step(actions[index % len(actions)])
+            game.tick(0.3)
+    assert restored.snapshot() == engine.snapshot()
+    assert restored.board.get_zobrist_hash() == engine.board.get_zobrist_hash()
@@ -3,7 +3,12 @@
 import pytest
 import pygame
 from unittest.mock import patch, MagicMock
+from tetris.ai import HeuristicAI
+from tetris.bitboard import BitBoard
+from tetris.engine import GameEngine
 from tetris.game import TetrisGame
+from tetris.render_base import Command
+from tetris.scheduler import FixedStepScheduler
 
 
 @pytest.fixture
@@ -24,9 +29,8 @@ def game():
 
 def test_game_initialization(game):
     """Test that the game initializes correctly."""
-    assert game.board is not None
+    assert isinstance(game.board, BitBoard)
     assert game.renderer is not None
-    assert game.clock is not None
     assert game.score == 0
     assert game.level == 1
     assert game.lines_cleared == 0
@@ -159,3 +163,64 @@ def test_handle_events_pause(mock_event_get, game):
     # Check that the game is unpaused
     assert result  # Game should continue
     assert not game.paused
+
+
+def test_ai_plays_game():
+    """Test that the AI places pieces one action per update."""
+    pygame.init()
+    game = TetrisGame(GameEngine(BitBoard(), seed=1), ai=HeuristicAI())
+
+    for _ in range(200):
+        game._update_game()
+
+    assert game.engine.pieces_placed > 0
+    assert not game.game_over
+    pygame.quit()
+
+
+def test_frame_hold_skips_unchanged_overlay_frames(game):
+    """Test that a paused game renders its overlay once until the state changes."""
+    with patch.object(game, "_render") as render:
+        assert game._render_frame()
+        assert game._render_frame()
+
+        game.paused = True
+        assert game._render_frame()
+        assert not game._render_frame()
+        assert not game._render_frame()
+
+        game.paused = False
+        game.game_over = True
+        assert game._render_frame()
+        assert not game._render_frame()
+
+        game.hold_frames = False
+        assert game._render_frame()
+        assert render.call_count == 5
+
+
+def test_run_simulates_fixed_ticks_under_slow_rendering():
+    """Test that slow frames delay rendering but not simulation ticks."""
+    pygame.init()
+    now = [0]
+
+    def sleep(seconds):
+        now[0] += round(seconds * 1_000_000_000)
+
+    def slow_render():
+        now[0] += 25_000_000  # Rendering takes a tick and a half
+
+    scheduler = FixedStepScheduler(60, clock=lambda: now[0], sleep=sleep)
+    game = TetrisGame(GameEngine(BitBoard(), seed=1), ai=HeuristicAI(), scheduler=scheduler)
+    inputs = [[]] * 200 + [[Command.QUIT]]
+    with patch.object(game.renderer, "poll_input", side_effect=inputs), \
+            patch.object(game, "_render", side_effect=slow_render):
+        game.run()
+
+    stats = scheduler.stats()
+    assert stats["frames_rendered"] < stats["ticks"]
+    assert stats["ticks_dropped"] == 0
+    assert game.ticks == stats["ticks"]
+    # Every tick of elapsed time was simulated, except the one the last
+    # frame was still rendering in
+    assert stats["ticks"] == now[0] * 60 // 1_000_000_000 - 1
@@ -1,7 +1,10 @@
 """Tests for the Tetromino class."""
 
 import pytest
-from tetris.pieces import Tetromino, get_random_tetromino
+from tetris.pieces import (
+    SHAPE_TYPES, BagGenerator, PieceGenerator, Tetromino, UniformGenerator,
+    create_generator, get_random_tetromino,
+)
 
 
 def test_tetromino_initialization():
@@ -97,3 +100,58 @@ def test_random_tetromino():
     # Check that we got at least 2 different shapes
     # (This could theoretically fail, but it's very unlikely)
     assert len(set(piece.shape_type for piece in pieces)) > 1
+
+
+@pytest.mark.parametrize("kind", ["uniform", "bag"])
+def test_generator_is_reproducible(kind):
+    """Test that generators with the same seed produce the same stream."""
+    first = create_generator(kind, seed=42)
+    second = create_generator(kind, seed=42)
+    other = create_generator(kind, seed=43)
+
+    sequence = [first.next_type() for _ in range(200)]
+    assert sequence == second.generate(200)
+    assert sequence != other.generate(200)
+    assert all(shape_type in SHAPE_TYPES for shape_type in sequence)
+
+    first.reset()
+    assert first.generate(200) == sequence
+
+
+def test_bag_generator_deals_every_shape_once_per_bag():
+    """Test that each group of seven pieces holds every shape type."""
+    generator = BagGenerator(seed=7)
+    sequence = generator.generate(7 * 30)
+    for start in range(0, len(sequence), 7):
+        assert sorted(sequence[start:start + 7]) == sorted(SHAPE_TYPES)
+
+    with pytest.raises(ValueError):
+        BagGenerator(seed=7, block_size=10)
+
+
+def test_generator_peek_and_state():
+    """Test that peeking does not consume pieces and states can be restored."""
+    generator = UniformGenerator(seed=5, block_size=8)
+    generator.generate(5)
+    upcoming = generator.peek(20)
+    assert generator.peek(20) == upcoming
+
+    state = generator.get_state()
+    assert generator.generate(20) == upcoming
+    generator.set_state(state)
+    assert [generator.next_piece().shape_type for _ in range(20)] == upcoming
+
+
+def test_create_generator_rejects_unknown_kind():
+    """Test that an unknown generator name raises an error."""
+    with pytest.raises(ValueError):
+        create_generator("random")
+
+
+def test_generator_subclass_must_fill_blocks():
+    """Test that a generator without a block filler cannot be created."""
+    class IncompleteGenerator(PieceGenerator):
+        kind = "incomplete"
+
+    with pytest.raises(TypeError):
+        IncompleteGenerator(1)
@@ -0,0 +1,60 @@
+"""Tests for the placement generator."""
+
+import pytest
+from tetris.bitboard import BitBoard
+from tetris.board import Board
+from tetris.engine import GameEngine
+from tetris.placements import PlacementGenerator, ROTATION_PERIODS, benchmark
+from tetris.pieces import Tetromino
+
+
+def test_rotation_periods():
+    """Test that symmetric shapes have shorter rotation periods."""
+    assert ROTATION_PERIODS["O"] == 1
+    assert ROTATION_PERIODS["I"] == ROTATION_PERIODS["S"] == ROTATION_PERIODS["Z"] == 2
+    assert ROTATION_PERIODS["J"] == ROTATION_PERIODS["L"] == ROTATION_PERIODS["T"] == 4
+
+
+@pytest.mark.parametrize("board_class", [Board, BitBoard])
+@pytest.mark.parametrize("shape_type, expected", [("I", 17), ("O", 9), ("T", 34)])
+def test_empty_board_placement_counts(board_class, shape_type, expected):
+    """Test the number of distinct placements on an empty board."""
+    placements = PlacementGenerator().generate(board_class(), Tetromino(shape_type))
+    assert len(placements) == expected
+    assert len(set(placements)) == expected
+
+
+def test_finds_tucked_placement():
+    """Test that placements under an overhang are found by sliding."""
+    board = BitBoard()
+    roof = Tetromino("I")
+    roof.rotation = 1
+    roof.x, roof.y = 6, 17
+    board.add_piece_to_grid(roof)
+
+    placements = PlacementGenerator().generate(board, Tetromino("O"))
+    assert any(p.x == 6 and p.y == 18 for p in placements)
+
+
+def test_path_reaches_placement():
+    """Test that playing a path through the engine lands on the placement."""
+    engine = GameEngine(BitBoard(), seed=5)
+    generator = PlacementGenerator()
+    piece = engine.board.current_piece
+    placements = generator.generate(engine.board, piece)
+    target = placements[-1]
+
+    for action in generator.path_to(target)[:-1]:
+        engine.step(action)
+    cells = set(piece.get_positions())
+    expected = Tetromino(target.shape_type)
+    expected.rotation, expected.x, expected.y = target.rotation, target.x, target.y
+    assert cells == set(expected.get_positions())
+
+
+def test_benchmark_reports_throughput():
+    """Test that the benchmark reports search statistics."""
+    stats = benchmark(pieces=20)
+    assert stats["searches"] == 20
+    assert stats["placements_found"] > 0
+    assert stats["placements_per_second"] > 0
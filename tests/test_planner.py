@@ -0,0 +1,133 @@
+"""Tests for the beam search planner."""
+
+from tetris.bitboard import BitBoard
+from tetris.engine import Action, GameEngine
+from tetris.pieces import Tetromino
+from tetris.planner import BeamPlanner
+
+
+def test_engine_preview_queue():
+    """Test that the preview queue does not change the piece sequence."""
+    plain = GameEngine(seed=2)
+    previewed = GameEngine(seed=2, preview_size=3)
+    assert len(previewed.get_preview()) == 3
+    assert previewed.get_preview(1) == plain.get_preview()
+
+    upcoming = previewed.get_preview()
+    for shape_type in upcoming:
+        plain.step(Action.DROP)
+        previewed.step(Action.DROP)
+        assert plain.board.current_piece.shape_type == shape_type
+        assert previewed.board.current_piece.shape_type == shape_type
+
+
+def test_lookahead_uses_next_piece():
+    """Test that the planner keeps a well open for an upcoming I piece."""
+    board = BitBoard()
+    for x in range(1, 8, 2):
+        for y in (16, 18):
+            piece = Tetromino("O")
+            piece.x, piece.y = x, y
+            board.add_piece_to_grid(piece)
+    piece = Tetromino("O")
+    piece.x, piece.y = 9, 16
+    board.add_piece_to_grid(piece)
+    piece.y = 18
+    board.add_piece_to_grid(piece)
+
+    # Only column 8 is open, waiting for the I piece
+    planner = BeamPlanner(depth=1)
+    placement = planner.choose(board, Tetromino("O"), ["I"])
+    assert placement.x not in (8, 9)
+    assert planner.stats()["evaluations"] > 0
+
+
+def test_time_budget_returns_a_move():
+    """Test that an exhausted time budget still returns a move."""
+    planner = BeamPlanner(depth=3, time_budget=0.0)
+    placement = planner.choose(BitBoard(), Tetromino("T"), ["I", "O", "S"])
+    assert placement is not None
+    assert planner.timeouts == 1
+
+
+def test_expansions_are_cached():
+    """Test that repeated searches reuse cached expansions."""
+    planner = BeamPlanner(depth=2, beam_width=4)
+    planner.choose(BitBoard(), Tetromino("T"), ["I", "O"])
+    misses = planner.expansions.misses
+    planner.choose(BitBoard(), Tetromino("T"), ["I", "O"])
+    assert planner.expansions.misses == misses
+    assert planner.expansions.hits > 0
+
+
+def test_expansion_cache_is_compact():
+    """Test that the cache keeps no boards and is skipped at depth 1."""
+    assert BeamPlanner(depth=1).expansions is None
+
+    planner = BeamPlanner(depth=2, expansion_memory=1 << 20)
+    assert planner.expansions.capacity == 256
+    planner.choose(BitBoard(), Tetromino("T"), ["I", "O"])
+    for _, expansion in planner.expansions._entries.values():
+        assert not any(isinstance(item, BitBoard) for entry in expansion for item in entry)
+
+
+def test_parallel_search_plays_moves():
+    """Test that the multi-process search plays valid moves."""
+    planner = BeamPlanner(depth=1, workers=2)
+    engine = GameEngine(BitBoard(), seed=4)
+    try:
+        for _ in range(10):
+            for action in planner.actions(engine):
+                engine.step(action)
+    finally:
+        planner.close()
+
+    assert engine.pieces_placed == 10
+    assert not engine.game_over
+
+
+def test_parallel_search_counts_timeouts():
+    """Test that subtrees running out of time in workers are counted."""
+    planner = BeamPlanner(depth=2, workers=2, time_budget=0.0)
+    try:
+        placement = planner.choose(BitBoard(), Tetromino("T"), ["I", "O"])
+    finally:
+        planner.close()
+
+    assert placement is not None
+    assert planner.timeouts == len(planner._roots(BitBoard(), Tetromino("T")))
+
+
+def test_parallel_search_avoids_top_out():
+    """Test that a subtree that tops out never outranks surviving ones."""
+    board = BitBoard()
+    board.set_rows([
+        "..........", "..........", "..........", "..XX.XX..X", "XX..XXXXXX",
+        "XX...XX..X", "X...X..X.X", "XX.X..XXXX", "XX....XX..", "X..X.XXXXX",
+        "X..XX.XX..", "X..XX..XXX", ".XXXX..X..", ".XXXXXX...", "X.X.XX.XXX",
+        "XX..X.XXXX", ".X.....XXX", "X.X.XXXX..", ".XXXX..XX.", "X..XXX...X",
+    ])
+    planner = BeamPlanner(depth=1, workers=2)
+    try:
+        placement = planner.choose(board, Tetromino("I"), ["S"])
+    finally:
+        planner.close()
+
+    # One root child blocks the spawn of the S piece, which scores well
+    # when compared to boards one piece deeper
+    roots = planner._roots(board, Tetromino("I"))
+    assert any(not planner.expander.generate(child, Tetromino("S")) for _, _, child, _ in roots)
+    child = planner.place(board, placement)[0]
+    assert planner.expander.generate(child, Tetromino("S"))
+
+
+def test_planner_plays_through_engine():
+    """Test that the planner survives and clears lines in a seeded game."""
+    engine = GameEngine(BitBoard(), seed=3, preview_size=2)
+    planner = BeamPlanner(depth=2, beam_width=4)
+    for _ in range(100):
+        for action in planner.actions(engine):
+            engine.step(action)
+
+    assert not engine.game_over
+    assert engine.lines_cleared > 0
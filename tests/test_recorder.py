@@ -0,0 +1,220 @@
+"""Tests for the GameRecorder class."""
+
+import os
+import threading
+import time
+import cv2
+import numpy as np
+import pytest
+import pygame
+from tetris.ai import HeuristicAI
+from tetris.bitboard import BitBoard
+from tetris.engine import GameEngine
+from tetris.game import TetrisGame
+from tetris.recorder import (GameRecorder, array3d_to_bgr, benchmark_capture,
+                             create_demo_recording, render_replays, surface_to_bgr)
+from tetris.replay import ReplayPlayer, load_replay
+from tetris.constants import SCREEN_HEIGHT, SCREEN_WIDTH
+
+
+@pytest.fixture
+def surface():
+    """Create a small surface to record."""
+    pygame.init()
+    yield pygame.Surface((64, 48))
+    pygame.quit()
+
+
+def _read_frames(filename):
+    """Count the frames of a video file and get its frame size."""
+    capture = cv2.VideoCapture(filename)
+    count = 0
+    size = None
+    while True:
+        ok, frame = capture.read()
+        if not ok:
+            break
+        count += 1
+        size = (frame.shape[1], frame.shape[0])
+    capture.release()
+    return count, size
+
+
+def test_frames_are_streamed_to_disk(surface, tmp_path):
+    """Test that captured frames are written as they arrive."""
+    recorder = GameRecorder(fps=10, output_dir=str(tmp_path))
+    recorder.start_recording(frame_size=(64, 48))
+    for index in range(12):
+        surface.fill((index * 20, 0, 0))
+        recorder.capture_frame(surface)
+    assert recorder.frames_captured == 12
+    assert not hasattr(recorder, "frames")
+
+    filename = recorder.stop_recording()
+    assert filename is not None
+    assert recorder.summary()["frames_written"] == 12
+    assert _read_frames(filename) == (12, (64, 48))
+    assert recorder.stop_recording() is None
+
+
+def test_max_duration_is_optional(surface, tmp_path):
+    """Test that recording stops at max_duration only when it is set."""
+    recorder = GameRecorder(output_dir=str(tmp_path), max_duration=0.5)
+    recorder.start_recording(frame_size=(64, 48))
+    recorder.start_time -= 1.0
+    recorder.capture_frame(surface)
+    assert not recorder.recording
+    assert recorder.frames_written == 0
+    assert not list(tmp_path.iterdir())
+
+    assert GameRecorder(output_dir=str(tmp_path)).max_duration is None
+
+
+class StalledWriter:
+    """Video writer wrapper that blocks until released."""
+
+    def __init__(self, writer):
+        self.writer = writer
+        self.released = threading.Event()
+
+    def write(self, frame):
+        self.released.wait()
+        self.writer.write(frame)
+
+    def release(self):
+        self.writer.release()
+
+
+@pytest.mark.parametrize("policy", ["drop_oldest", "drop_newest"])
+def test_full_queue_drops_frames(surface, tmp_path, policy):
+    """Test that the drop policies never block and count what they drop."""
+    recorder = GameRecorder(fps=10, output_dir=str(tmp_path), queue_size=2, policy=policy)
+    recorder.start_recording(frame_size=(64, 48))
+    writer = recorder.writer = StalledWriter(recorder.writer)
+
+    # The encoder takes the first frame and stalls on it
+    recorder.capture_frame(surface)
+    while not recorder.queue.empty():
+        time.sleep(0.001)
+
+    for _ in range(5):
+        recorder.capture_frame(surface)
+    summary = recorder.summary()
+    assert summary["frames_captured"] == 6
+    assert summary["frames_dropped"] == 3
+    assert summary["frames_queued"] == 2
+    assert summary["max_queued"] == 2
+
+    writer.released.set()
+    assert recorder.stop_recording() is not None
+    assert recorder.summary()["frames_written"] == 3
+
+
+def test_unknown_policy_is_rejected(tmp_path):
+    """Test that an unknown backpressure policy raises an error."""
+    with pytest.raises(ValueError):
+        GameRecorder(output_dir=str(tmp_path), policy="skip")
+
+
+@pytest.mark.parametrize("offline", [True, False])
+def test_demo_capture_follows_game_time(tmp_path, offline):
+    """Test that demos capture one frame per video frame of game time."""
+    game = TetrisGame(GameEngine(BitBoard(), seed=1), ai=HeuristicAI())
+    recorder = GameRecorder(fps=10, output_dir=str(tmp_path))
+
+    start = time.perf_counter()
+    create_demo_recording(game, duration=1.0, offline=offline, recorder=recorder)
+    elapsed = time.perf_counter() - start
+
+    summary = recorder.summary()
+    assert 10 <= summary["frames_captured"] <= 11
+    assert summary["frames_written"] == summary["frames_captured"]
+    if offline:
+        assert elapsed < 1.0
+        assert game.engine.pieces_placed > 0
+    else:
+        assert elapsed >= 0.9
+
+
+def test_demo_closes_its_replay(tmp_path):
+    """Test that a demo played with replays on leaves one complete replay."""
+    replay_dir = tmp_path / "replays"
+    replay_dir.mkdir()
+    game = TetrisGame(GameEngine(BitBoard(), seed=1), ai=HeuristicAI(),
+                      replay_dir=str(replay_dir))
+    recorder = GameRecorder(fps=10, output_dir=str(tmp_path))
+    create_demo_recording(game, duration=1.0, offline=True, recorder=recorder)
+
+    paths = list(replay_dir.iterdir())
+    assert len(paths) == 1
+    replay = load_replay(str(paths[0]))
+    assert replay.end["end"] == game.ticks > 0
+    assert replay.end["pieces"] == game.engine.pieces_placed
+    player = ReplayPlayer(replay)
+    player.run()
+    assert player.matches_end()
+
+
+@pytest.mark.parametrize("depth, flags", [(32, 0), (24, 0), (32, pygame.SRCALPHA), (16, 0)])
+def test_view_conversion_matches_array3d(depth, flags):
+    """Test that the view-based conversion gives the same frame as array3d."""
+    pygame.init()
+    surface = pygame.Surface((13, 7), flags, depth)
+    surface.fill((255, 0, 0, 255), (0, 0, 5, 7))
+    surface.fill((0, 255, 0, 255), (5, 0, 4, 7))
+    surface.fill((8, 64, 248, 255), (9, 0, 4, 3))
+
+    out = np.empty((7, 13, 3), np.uint8)
+    assert surface_to_bgr(surface, out) is out
+    assert np.array_equal(out, array3d_to_bgr(surface))
+    assert not surface.get_locked()
+
+
+def test_capture_reuses_frame_buffers(surface, tmp_path):
+    """Test that captures are converted into a fixed pool of buffers."""
+    recorder = GameRecorder(fps=10, output_dir=str(tmp_path), queue_size=2)
+    recorder.start_recording(frame_size=(32, 24))
+    buffers = {id(buffer) for buffer in recorder.free_buffers.queue}
+    assert len(buffers) == 4
+
+    for index in range(10):
+        surface.fill((index * 20, 0, 0))
+        recorder.capture_frame(surface)
+    assert recorder.stop_recording() is not None
+    assert {id(buffer) for buffer in recorder.free_buffers.queue} == buffers
+    assert _read_frames(recorder.filename) == (10, (32, 24))
+
+
+def test_benchmark_capture():
+    """Test that the capture benchmark times both conversions."""
+    stats = benchmark_capture((64, 48), frames=3)
+    assert stats["frames"] == 3
+    assert stats["array3d_ms"] > 0
+    assert stats["view_ms"] > 0
+
+
+def _record_replays(directory, seeds):
+    """Record a short AI game per seed to replay files."""
+    for seed in seeds:
+        game = TetrisGame(GameEngine(BitBoard(), seed=seed), ai=HeuristicAI(),
+                          replay_dir=str(directory))
+        for _ in range(120):
+            game._update_game(1.0 / 60)
+        game.close_replay()
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_render_replays(tmp_path, workers):
+    """Test that every replay in a directory is encoded to its own video."""
+    pygame.init()
+    replays = tmp_path / "replays"
+    _record_replays(replays, [1, 2])
+    pygame.quit()
+
+    videos = tmp_path / "videos"
+    results = dict(render_replays(str(replays), workers, str(videos), fps=10))
+    assert len(results) == 2
+    for replay_path, video_path in results.items():
+        assert video_path == str(videos / (os.path.basename(replay_path)[:-7] + ".mp4"))
+        # 120 ticks at 60 ticks per second are 2 seconds of video
+        assert _read_frames(video_path) == (21, (SCREEN_WIDTH, SCREEN_HEIGHT))
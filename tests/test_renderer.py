@@ -0,0 +1,204 @@
+"""Tests for the Renderer class."""
+
+import pytest
+import pygame
+from unittest.mock import patch
+from tetris.engine import Action, GameEngine
+from tetris.render_base import Command
+from tetris.renderer import Renderer
+
+
+@pytest.fixture(autouse=True)
+def pygame_session():
+    """Initialize pygame around each test."""
+    pygame.init()
+    yield
+    pygame.quit()
+
+
+def _draw_frame(renderer, engine, paused=False):
+    """Draw one frame the way TetrisGame does."""
+    renderer.clear_screen()
+    renderer.draw_board(engine.board)
+    renderer.draw_next_piece(engine.board.next_piece)
+    renderer.draw_score(engine.score, engine.level, engine.lines_cleared)
+    renderer.draw_controls()
+    if paused:
+        renderer.draw_pause()
+    renderer.update_display()
+
+
+def _play_frames(engine):
+    """Yield after each action of a short scripted game."""
+    actions = [Action.LEFT, Action.ROTATE, Action.DOWN, Action.DROP, Action.NONE,
+               Action.RIGHT, Action.RIGHT, Action.DROP]
+    for index in range(60):
+        engine.step(actions[index % len(actions)])
+        yield index
+
+
+def test_dirty_rects_match_full_redraw():
+    """Test that dirty-rectangle frames are pixel-identical to full redraws."""
+    engine = GameEngine(seed=5)
+    renderer = Renderer(dirty_rects=True)
+    frames = []
+    states = []
+    for index in _play_frames(engine):
+        paused = index == 30
+        _draw_frame(renderer, engine, paused)
+        frames.append(pygame.surfarray.array3d(renderer.screen))
+        states.append((engine.board.copy(), engine.score, engine.level,
+                       engine.lines_cleared, paused))
+
+    reference = Renderer()
+    for frame, (board, score, level, lines, paused) in zip(frames, states):
+        reference.clear_screen()
+        reference.draw_board(board)
+        reference.draw_next_piece(board.next_piece)
+        reference.draw_score(score, level, lines)
+        reference.draw_controls()
+        if paused:
+            reference.draw_pause()
+        reference.update_display()
+        assert (pygame.surfarray.array3d(reference.screen) == frame).all()
+
+
+def test_dirty_rects_update_only_changes():
+    """Test that only changed areas are pushed to the display."""
+    engine = GameEngine(seed=5)
+    renderer = Renderer(dirty_rects=True)
+    _draw_frame(renderer, engine)
+
+    with patch("pygame.display.update") as update, patch("pygame.display.flip") as flip:
+        # Nothing changed
+        _draw_frame(renderer, engine)
+        update.assert_not_called()
+
+        # Moving the piece only touches board cells
+        engine.step(Action.LEFT)
+        _draw_frame(renderer, engine)
+        rects = update.call_args[0][0]
+        assert 0 < len(rects) <= 16
+        assert all(renderer.board_x <= rect.x < renderer.board_x + renderer.board_width
+                   for rect in rects)
+
+        # An overlay frame and the frame after it are redrawn in full
+        _draw_frame(renderer, engine, paused=True)
+        _draw_frame(renderer, engine)
+        assert flip.call_count == 2
+
+
+def test_expose_redraws_in_full():
+    """Test that an exposed window is redrawn in full in dirty-rects mode."""
+    engine = GameEngine(seed=5)
+    renderer = Renderer(dirty_rects=True)
+    _draw_frame(renderer, engine)
+    renderer.poll_input()
+
+    pygame.event.post(pygame.event.Event(pygame.WINDOWEXPOSED))
+    assert Command.REDRAW in renderer.poll_input()
+    with patch("pygame.display.flip") as flip:
+        _draw_frame(renderer, engine)
+        flip.assert_called_once()
+
+
+@pytest.mark.parametrize("ghost", [False, True])
+def test_block_sprites_match_drawn_blocks(ghost):
+    """Test that blitted sprites look like blocks drawn with draw.rect."""
+    renderer = Renderer()
+    color = (0, 255, 255)
+    renderer.screen.fill((0, 0, 0))
+    if ghost:
+        renderer.draw_ghost_block(40, 40, color)
+    else:
+        renderer.draw_block(40, 40, color)
+    blitted = pygame.surfarray.array3d(renderer.screen)
+
+    renderer.screen.fill((0, 0, 0))
+    if ghost:
+        pygame.draw.rect(renderer.screen, color, (42, 42, 26, 26), 2)
+    else:
+        pygame.draw.rect(renderer.screen, color, (40, 40, 30, 30))
+        pygame.draw.rect(renderer.screen, (255, 255, 255), (40, 40, 30, 30), 1)
+    assert (pygame.surfarray.array3d(renderer.screen) == blitted).all()
+
+
+def test_block_sprites_are_cached_per_size():
+    """Test that sprites are built once per color, size and style."""
+    renderer = Renderer()
+    color = (255, 0, 0)
+    assert renderer.get_block_sprite(color) is renderer.get_block_sprite(color)
+    large = renderer.get_block_sprite(color, size=60)
+    assert large.get_size() == (60, 60)
+    assert large is not renderer.get_block_sprite(color)
+
+
+def test_background_layer_and_resize():
+    """Test that frames start from the cached background and resizing rebuilds it."""
+    renderer = Renderer()
+    background = renderer.background
+    renderer.clear_screen()
+    renderer.draw_controls()
+    assert (pygame.surfarray.array3d(renderer.screen)
+            == pygame.surfarray.array3d(background)).all()
+
+    # Grid lines are part of the background
+    assert background.get_at((renderer.board_x, renderer.board_y))[:3] == (128, 128, 128)
+
+    renderer.resize(640, 700)
+    assert renderer.background is not background
+    assert renderer.background.get_size() == (640, 700)
+    assert renderer.board_x == (640 - renderer.board_width) // 2
+    _draw_frame(renderer, GameEngine(seed=1), paused=True)
+
+
+def test_hud_text_is_cached():
+    """Test that redrawing the HUD renders no new text."""
+    renderer = Renderer()
+    engine = GameEngine(seed=1)
+    _draw_frame(renderer, engine)
+    misses = renderer.stats()["text_cache"]["misses"]
+
+    engine.score = 1234
+    for _ in range(3):
+        _draw_frame(renderer, engine)
+    stats = renderer.stats()
+    assert stats["text_cache"]["misses"] == misses
+    assert stats["text_cache"]["hits"] > 0
+    assert stats["digits_drawn"] == 12
+
+
+def test_overlays_are_built_once_per_screen_size():
+    """Test that overlays are reused until the screen is resized."""
+    renderer = Renderer()
+    renderer.draw_pause()
+    overlay = renderer.get_overlay("pause")
+    renderer.draw_pause()
+    assert renderer.get_overlay("pause") is overlay
+    assert overlay.get_size() == renderer.screen.get_size()
+
+    renderer.resize(640, 700)
+    resized = renderer.get_overlay("pause")
+    assert resized is not overlay
+    assert resized.get_size() == (640, 700)
+
+
+def test_offscreen_renderer_matches_window():
+    """Test that off-screen frames equal on-screen ones without opening a window."""
+    pygame.display.quit()
+    engine = GameEngine(seed=5)
+    offscreen = Renderer(offscreen=True)
+    assert pygame.display.get_surface() is None
+    frames = []
+    for index in _play_frames(engine):
+        _draw_frame(offscreen, engine, paused=index == 30)
+        frames.append(pygame.surfarray.array3d(offscreen.screen))
+    assert offscreen.poll_input() == []
+    offscreen.close()
+    assert pygame.font.get_init()
+
+    engine = GameEngine(seed=5)
+    window = Renderer()
+    for index, frame in zip(_play_frames(engine), frames):
+        _draw_frame(window, engine, paused=index == 30)
+        assert (pygame.surfarray.array3d(window.screen) == frame).all()
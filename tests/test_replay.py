@@ -0,0 +1,193 @@
+"""Tests for input-log replays."""
+
+import json
+import pytest
+import pygame
+from tetris.ai import HeuristicAI
+from tetris.bitboard import BitBoard
+from tetris.constants import FPS
+from tetris.engine import Action, GameEngine
+from tetris.game import TetrisGame
+from tetris.pieces import BagGenerator
+from tetris.replay import ReplayPlayer, ReplayWriter, load_replay
+
+
+@pytest.fixture
+def ai_game(tmp_path):
+    """Create an AI game that records replays."""
+    pygame.init()
+    engine = GameEngine(BitBoard(), generator=BagGenerator(5))
+    yield TetrisGame(engine, ai=HeuristicAI(), replay_dir=str(tmp_path))
+    pygame.quit()
+
+
+def _play(game, updates):
+    """Advance a game by fixed one-tick updates."""
+    for _ in range(updates):
+        game._update_game(1.0 / FPS)
+
+
+def test_replay_reproduces_the_game(ai_game):
+    """Test that re-simulating a replay ends in the recorded state."""
+    _play(ai_game, 3000)
+    path = ai_game.replay_writer.path
+    ai_game.close_replay()
+
+    replay = load_replay(path)
+    assert replay.generator == "bag"
+    assert replay.seed == 5
+    assert replay.ticks == ai_game.ticks == 3000
+    assert len(replay.events) > 0
+
+    player = ReplayPlayer(replay)
+    engine = player.run()
+    assert player.matches_end()
+    assert engine.pieces_placed == ai_game.engine.pieces_placed > 10
+    assert engine.score == ai_game.score
+    assert engine.board.grid == ai_game.board.grid
+
+
+def test_replay_of_finished_game(tmp_path):
+    """Test that a game played to the end is replayed to the same end."""
+    pygame.init()
+    game = TetrisGame(GameEngine(BitBoard(), seed=3), replay_dir=str(tmp_path))
+    path = game.replay_writer.path
+    while not game.game_over:
+        game._step(Action.ROTATE)
+        _play(game, 30)
+        game._step(Action.DROP)
+    assert game.replay_writer is None
+    pygame.quit()
+
+    replay = load_replay(path)
+    assert replay.end["game_over"]
+    player = ReplayPlayer(replay)
+    player.run()
+    assert player.engine.game_over
+    assert player.matches_end()
+
+
+def test_replay_is_compact(ai_game):
+    """Test that a replay stores only a few bytes per action."""
+    _play(ai_game, 3000)
+    path = ai_game.replay_writer.path
+    ai_game.close_replay()
+
+    with open(path) as f:
+        size = len(f.read())
+    assert size < 16 * len(load_replay(path).events) + 512
+
+
+def test_restart_starts_a_new_replay(ai_game, tmp_path):
+    """Test that every game gets its own replay file, ending where it stopped."""
+    _play(ai_game, 600)
+    first = ai_game.replay_writer.path
+    engine = ai_game.engine
+    stopped = (ai_game.ticks, engine.score, engine.pieces_placed)
+    assert engine.pieces_placed > 0
+
+    engine.generator.reseed(9)
+    ai_game.reset_game()
+    assert ai_game.replay_writer.path != first
+    assert ai_game.replay_writer.replay.seed == 9
+    assert len(list(tmp_path.iterdir())) == 2
+
+    replay = load_replay(first)
+    assert (replay.end["end"], replay.end["score"], replay.end["pieces"]) == stopped
+    player = ReplayPlayer(replay)
+    player.run()
+    assert player.tick == 600
+    assert player.matches_end()
+
+
+def test_cut_off_replay_plays_to_its_last_event(ai_game):
+    """Test that a replay without an end record still loads and plays."""
+    _play(ai_game, 500)
+    path = ai_game.replay_writer.path
+    ai_game.replay_writer._file.flush()
+
+    replay = load_replay(path)
+    assert replay.end is None
+    assert replay.ticks == replay.events[-1][0]
+    player = ReplayPlayer(replay)
+    player.run()
+    assert player.matches_end()
+    ai_game.close_replay()
+
+
+def test_invalid_replays_are_rejected(tmp_path):
+    """Test that files of another format or rules version are rejected."""
+    path = tmp_path / "game.replay"
+    path.write_text(json.dumps({"format": "video"}) + "\n")
+    with pytest.raises(ValueError):
+        load_replay(str(path))
+
+    header = {"format": "tetris-replay", "version": 1, "rules": 0, "tick_rate": FPS,
+              "generator": "uniform", "seed": 1, "block_size": 70}
+    path.write_text(json.dumps(header) + "\n")
+    with pytest.raises(ValueError):
+        ReplayPlayer(load_replay(str(path)))
+
+
+@pytest.fixture
+def keyframed_replay(tmp_path):
+    """Record an AI game with a keyframe every 100 ticks."""
+    pygame.init()
+    game = TetrisGame(GameEngine(BitBoard(), seed=7), ai=HeuristicAI())
+    game.replay_writer = ReplayWriter(str(tmp_path / "game.replay"), game.engine, FPS,
+                                      keyframe_interval=100)
+    _play(game, 1050)
+    path = game.replay_writer.path
+    game.close_replay()
+    pygame.quit()
+    return path
+
+
+def test_keyframes_are_indexed(keyframed_replay):
+    """Test that keyframes are written every interval and indexed by offset."""
+    replay = load_replay(keyframed_replay)
+    assert [keyframe.tick for keyframe in replay.keyframes] == list(range(100, 1001, 100))
+
+    with open(keyframed_replay, "rb") as f:
+        lines = f.readlines()
+    index = json.loads(lines[-1])["index"]
+    assert [tick for tick, _ in index] == list(range(100, 1001, 100))
+    with open(keyframed_replay, "rb") as f:
+        for tick, offset in index:
+            f.seek(offset)
+            assert json.loads(f.readline())["keyframe"] == tick
+
+
+@pytest.mark.parametrize("ticks", [[0, 250, 999, 1050], [730, 120, 400, 5]])
+def test_seek_matches_playing_from_the_start(keyframed_replay, ticks):
+    """Test that seeking forward and back gives the state of a full replay."""
+    replay = load_replay(keyframed_replay)
+    player = ReplayPlayer(replay)
+    for tick in ticks:
+        player.seek(tick)
+        assert player.tick == tick
+
+        reference = ReplayPlayer(replay)
+        while reference.tick < tick:
+            reference.advance()
+        assert player.engine.snapshot() == reference.engine.snapshot()
+
+
+def test_load_from_keyframe(keyframed_replay):
+    """Test that a replay can be read from the keyframe before a tick."""
+    full = load_replay(keyframed_replay)
+    partial = load_replay(keyframed_replay, start_tick=750)
+    assert partial.start_tick == 700
+    assert partial.keyframes[0].event == 0
+    assert partial.events == [event for event in full.events if event[0] >= 700]
+
+    player = ReplayPlayer(partial)
+    assert player.tick == 700
+    with pytest.raises(ValueError):
+        player.seek(650)
+    player.seek(750)
+    reference = ReplayPlayer(full)
+    reference.seek(750)
+    assert player.engine.snapshot() == reference.engine.snapshot()
+    player.run()
+    assert player.matches_end()
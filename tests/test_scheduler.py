@@ -0,0 +1,91 @@
+"""Tests for the FixedStepScheduler class."""
+
+import pytest
+from tetris.scheduler import NANOSECONDS, FixedStepScheduler
+
+
+class FakeClock:
+    """Monotonic nanosecond clock that only moves when told to."""
+
+    def __init__(self):
+        self.now = 0
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += round(seconds * NANOSECONDS)
+
+
+def _scheduler(clock, **kwargs):
+    return FixedStepScheduler(60, clock=clock, sleep=clock.sleep, **kwargs)
+
+
+def test_ticks_follow_the_clock_exactly():
+    """Test that fractional frame times add up to whole ticks without drift."""
+    clock = FakeClock()
+    scheduler = _scheduler(clock)
+    ticks = []
+    for _ in range(600):
+        clock.now += 7_000_000  # 7 ms frames, well below a tick
+        ticks.append(scheduler.advance())
+    # 4.2 seconds are 252 ticks
+    assert sum(ticks) == scheduler.ticks == 252
+    assert set(ticks) == {0, 1}
+
+
+def test_schedule_is_deterministic():
+    """Test that the same clock readings always give the same ticks."""
+    def run():
+        clock = FakeClock()
+        scheduler = _scheduler(clock)
+        ticks = []
+        for step in range(500):
+            clock.now += (step * 7919) % 40_000_000
+            ticks.append(scheduler.advance())
+        return ticks
+
+    assert run() == run()
+
+
+def test_catch_up_is_limited():
+    """Test that a stall runs a bounded number of ticks and drops the rest."""
+    clock = FakeClock()
+    scheduler = _scheduler(clock, max_ticks_per_update=5)
+    clock.now += NANOSECONDS
+    assert scheduler.advance() == 5
+    assert scheduler.ticks_dropped == 55
+    assert scheduler.advance() == 0
+
+
+def test_wait_sleeps_until_the_next_tick():
+    """Test that waiting lands exactly on the next tick."""
+    clock = FakeClock()
+    scheduler = _scheduler(clock)
+    for _ in range(120):
+        scheduler.wait()
+        assert scheduler.advance() == 1
+    assert clock.now == pytest.approx(2 * NANOSECONDS, abs=1000)
+
+
+def test_rendering_is_skipped_while_behind():
+    """Test that frames are skipped under load, but not indefinitely."""
+    clock = FakeClock()
+    scheduler = _scheduler(clock, max_frame_skip=3)
+    rendered = []
+    for _ in range(40):
+        scheduler.advance()
+        clock.now += 20_000_000  # The simulation takes longer than a tick
+        rendered.append(scheduler.should_render())
+    assert rendered[:8] == [False, False, False, True] * 2
+    assert scheduler.frames_skipped == 30
+    assert scheduler.frames_rendered == 10
+
+    scheduler.advance()
+    assert scheduler.should_render()
+
+
+def test_invalid_tick_rate_is_rejected():
+    """Test that a scheduler needs a positive tick rate."""
+    with pytest.raises(ValueError):
+        FixedStepScheduler(0)
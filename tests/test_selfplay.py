@@ -0,0 +1,43 @@
+"""Tests for the self-play farm."""
+
+import pytest
+from tetris.selfplay import game_seeds, play_game, run_selfplay, summarize
+
+
+def test_game_seeds_are_reproducible():
+    """Test that the same base seed gives the same per-game seeds."""
+    assert game_seeds(7, 5) == game_seeds(7, 5)
+    assert game_seeds(7, 5) != game_seeds(8, 5)
+    assert len(set(game_seeds(7, 50))) == 50
+
+
+def test_play_game_is_deterministic():
+    """Test that a game replays identically from its seed."""
+    first = play_game(0, 1234)
+    second = play_game(0, 1234)
+    assert (first.score, first.lines, first.pieces) == (second.score, second.lines, second.pieces)
+    assert first.pieces > 0
+
+
+def test_play_game_respects_max_pieces():
+    """Test that a game stops at the piece limit."""
+    result = play_game(0, 1, max_pieces=3)
+    assert result.pieces <= 3
+
+
+def test_unknown_policy_is_rejected():
+    """Test that an unknown policy name is reported as such."""
+    with pytest.raises(ValueError, match="unknown policy"):
+        play_game(0, 1, policy="greedy")
+
+
+def test_run_selfplay_with_workers():
+    """Test that pooled and in-process runs produce the same games."""
+    pooled = sorted(run_selfplay(2, 4, seed=3), key=lambda result: result.game)
+    local = list(run_selfplay(1, 4, seed=3))
+    assert [result.score for result in pooled] == [result.score for result in local]
+    assert [result.pieces for result in pooled] == [result.pieces for result in local]
+
+    summary = summarize(pooled, elapsed=1.0)
+    assert summary["games"] == 4
+    assert summary["total_pieces"] == sum(result.pieces for result in local)
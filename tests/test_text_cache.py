@@ -0,0 +1,45 @@
+"""Tests for the text render caches."""
+
+import pytest
+import pygame
+from tetris.text_cache import DigitAtlas, TextCache
+
+WHITE = (255, 255, 255)
+
+
+@pytest.fixture
+def font():
+    """Create a font for testing."""
+    pygame.init()
+    yield pygame.font.Font(None, 36)
+    pygame.quit()
+
+
+def test_text_cache_hits_and_evicts(font):
+    """Test that repeated strings hit and the oldest entries are evicted."""
+    cache = TextCache(capacity=2)
+    first = cache.render(font, "Score", WHITE)
+    assert cache.render(font, "Score", WHITE) is first
+    assert cache.render(font, "Score", (255, 0, 0)) is not first
+    assert cache.stats()["hits"] == 1
+
+    cache.render(font, "Lines", WHITE)
+    assert len(cache) == 2
+    assert cache.evictions == 1
+    assert cache.render(font, "Score", WHITE) is not first
+    assert cache.hit_rate == pytest.approx(0.2)
+
+    with pytest.raises(ValueError):
+        TextCache(capacity=0)
+
+
+def test_digit_atlas_draws_numbers(font):
+    """Test that numbers are drawn from glyphs and cover their measured size."""
+    atlas = DigitAtlas(font, WHITE)
+    surface = pygame.Surface((200, 50))
+    rect = atlas.draw(surface, 1230, (10, 5))
+    assert rect.topleft == (10, 5)
+    assert rect.size == atlas.size(1230)
+    assert atlas.size(1230)[0] > atlas.size(12)[0]
+    assert surface.get_bounding_rect().width > 0
+    assert atlas.numbers_drawn == 1
@@ -0,0 +1,77 @@
+"""Tests for the weight tuner."""
+
+import json
+import pytest
+from tetris.tuner import CrossEntropyTuner, FEATURES
+
+
+def make_tuner(checkpoint=None, workers=1, **options):
+    """Create a small, fast tuner."""
+    settings = dict(population=4, games=2, max_pieces=15, seed=1, metric="pieces")
+    settings.update(options)
+    return CrossEntropyTuner(workers=workers, checkpoint=checkpoint, **settings)
+
+
+def test_sampling_is_reproducible():
+    """Test that the same generation samples the same candidates."""
+    assert make_tuner().sample() == make_tuner().sample()
+    assert set(make_tuner().sample()[0]) == set(FEATURES)
+
+
+def test_step_refits_distribution(tmp_path):
+    """Test that a generation updates the state and writes a checkpoint."""
+    checkpoint = tmp_path / "tuning.json"
+    tuner = make_tuner(str(checkpoint))
+    summary = tuner.step()
+
+    assert summary["generation"] == 1
+    assert tuner.state.best_weights is not None
+    assert json.loads(checkpoint.read_text())["generation"] == 1
+
+
+def test_resume_matches_uninterrupted_run(tmp_path):
+    """Test that resuming from a checkpoint continues the same search."""
+    uninterrupted = make_tuner().run(2)
+
+    checkpoint = str(tmp_path / "tuning.json")
+    make_tuner(checkpoint).run(1)
+    resumed = make_tuner(checkpoint)
+    assert resumed.load_checkpoint()
+    assert resumed.state.generation == 1
+    resumed.run(2)
+
+    assert resumed.state.mean == uninterrupted.mean
+    assert resumed.state.best_fitness == uninterrupted.best_fitness
+
+
+def test_resume_requires_the_same_settings(tmp_path):
+    """Test that a checkpoint is not resumed with other settings."""
+    checkpoint = str(tmp_path / "tuning.json")
+    make_tuner(checkpoint).run(1)
+    assert make_tuner(checkpoint, workers=2).load_checkpoint()
+
+    for options, name in [
+        ({"seed": 2}, "seed"), ({"games": 3}, "games"), ({"population": 6}, "population"),
+        ({"metric": "lines"}, "metric"), ({"max_pieces": None}, "max_pieces"),
+        ({"elite_fraction": 0.5}, "elite_count"), ({"initial_std": 0.3}, "initial_std"),
+        ({"noise": 0.1}, "noise"),
+    ]:
+        with pytest.raises(ValueError, match=name):
+            make_tuner(checkpoint, **options).load_checkpoint()
+
+
+def test_pool_matches_in_process():
+    """Test that pooled evaluation gives the same fitness."""
+    candidates = make_tuner().sample()
+    local = make_tuner().evaluate(candidates)
+    pooled_tuner = make_tuner(workers=2)
+    from multiprocessing import Pool
+    with Pool(2) as pool:
+        pooled = pooled_tuner.evaluate(candidates, pool)
+    assert pooled == local
+
+
+def test_invalid_metric():
+    """Test that unknown metrics are rejected."""
+    with pytest.raises(ValueError):
+        CrossEntropyTuner(metric="style")
@@ -0,0 +1,100 @@
+"""Tests for Zobrist hashing and the transposition table."""
+
+import random
+import pytest
+from tetris.ai import HeuristicAI
+from tetris.bitboard import BitBoard
+from tetris.board import Board
+from tetris.engine import GameEngine
+from tetris.pieces import Tetromino
+from tetris.zobrist import TranspositionTable
+
+
+def test_incremental_hash_matches_full_hash():
+    """Test that the BitBoard hash matches a full scan after every move."""
+    rng = random.Random(4)
+    board = BitBoard()
+    ai = HeuristicAI()
+    lines = 0
+
+    for _ in range(300):
+        piece = Tetromino(rng.choice(list(Tetromino.SHAPES)))
+        placement = ai.choose(board, piece)
+        if placement is None:
+            board.reset()
+            continue
+        piece.rotation, piece.x, piece.y = placement.rotation, placement.x, placement.y
+        board.add_piece_to_grid(piece)
+        lines += board.clear_lines()
+        assert board.get_zobrist_hash() == Board.get_zobrist_hash(board)
+
+    assert lines > 0
+
+
+def test_hash_is_order_independent():
+    """Test that equal boards hash equally whatever the move order."""
+    first = BitBoard()
+    second = BitBoard()
+    assert first.get_zobrist_hash() == 0
+
+    left = Tetromino("O")
+    left.x, left.y = 1, 18
+    right = Tetromino("O")
+    right.x, right.y = 3, 18
+
+    first.add_piece_to_grid(left)
+    first.add_piece_to_grid(right)
+    second.add_piece_to_grid(right)
+    second.add_piece_to_grid(left)
+
+    assert first.get_zobrist_hash() != 0
+    assert second.get_zobrist_hash() == first.get_zobrist_hash()
+    assert first.copy().get_zobrist_hash() == first.get_zobrist_hash()
+
+
+def test_lru_table_evicts_oldest():
+    """Test LRU eviction and the hit and miss counters."""
+    table = TranspositionTable(capacity=2)
+    table.put((1, "I"), "a")
+    table.put((2, "I"), "b")
+    assert table.get((1, "I")) == "a"
+
+    table.put((3, "I"), "c")
+    assert table.get((2, "I")) is None
+    assert table.get((1, "I")) == "a"
+    assert table.get((3, "I")) == "c"
+
+    assert table.stats() == {
+        "entries": 2, "hits": 3, "misses": 1, "evictions": 1, "hit_rate": 0.75,
+    }
+
+
+def test_depth_preferred_table_keeps_deeper_entries():
+    """Test that the depth-preferred policy keeps deeper results."""
+    table = TranspositionTable(capacity=1, policy="depth")
+    table.put((1, "T"), "deep", depth=3)
+    table.put((2, "T"), "shallow", depth=1)
+    assert table.get((1, "T")) == "deep"
+    assert table.get((1, "T"), depth=4) is None
+
+    table.put((2, "T"), "deeper", depth=5)
+    assert table.get((2, "T")) == "deeper"
+    assert table.evictions == 1
+
+
+def test_invalid_policy():
+    """Test that unknown policies are rejected."""
+    with pytest.raises(ValueError):
+        TranspositionTable(policy="random")
+
+
+def test_ai_reuses_cached_moves():
+    """Test that the AI hits the table when a position repeats."""
+    table = TranspositionTable()
+    ai = HeuristicAI(table=table)
+    first = GameEngine(BitBoard(), seed=9)
+    second = GameEngine(BitBoard(), seed=9)
+
+    assert ai.actions(first) == ai.actions(second)
+    assert table.hits == 1
+    assert table.misses == 1